@@ -8,11 +8,39 @@ from .acm import ACM
 from .client import Client
 from .sub_client import SubClient
 from .socket import Callbacks, SocketHandler
-from .lib.util import device, exceptions, headers, helpers, objects
-from requests import get
-from json import loads
+from .lib.util import device, dispatch, exceptions, headers, helpers, middleware, objects
 
-__newest__ = loads(get("https://pypi.python.org/pypi/Amino.py/json").text)["info"]["version"]
+# The asyncio clients pull in aiohttp, they are only imported when first used.
+lazy = {
+    "AsyncACM": "async_acm",
+    "AsyncClient": "async_client",
+    "AsyncSubClient": "async_sub_client",
+    "AsyncSocketHandler": "async_socket",
+    "SocketManager": "socket_manager"
+}
 
-if __version__ != __newest__:
-    print(exceptions.LibraryUpdateAvailable(f"New version of {__title__} available: {__newest__} (Using {__version__})"))
+def __getattr__(name: str):
+    if name not in lazy: raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+    value = getattr(import_module(f".{lazy[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+def check_version():
+    """
+    Check PyPI for a newer version of the library and print a warning if there is one.
+    This is not done on import anymore, call it yourself to be told about updates.
+
+    **Returns**
+        - **Success** : Newest version on PyPI.
+    """
+    from requests import get
+    from json import loads
+
+    __newest__ = loads(get("https://pypi.python.org/pypi/Amino.py/json").text)["info"]["version"]
+
+    if __version__ != __newest__:
+        print(exceptions.LibraryUpdateAvailable(f"New version of {__title__} available: {__newest__} (Using {__version__})"))
+
+    return __newest__
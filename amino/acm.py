@@ -4,15 +4,18 @@ from time import time as timestamp
 from typing import BinaryIO
 
 from . import client
-from .lib.util import exceptions, headers, device, objects
+from .lib.util import exceptions, headers, objects
 
-device = device.DeviceGenerator()
-headers.sid = client.Client().sid
 
 class ACM(client.Client):
-    def __init__(self, profile: objects.UserProfile, comId: str = None):
-        client.Client.__init__(self)
+    def __init__(self, profile: objects.UserProfile, comId: str = None, deviceId: str = None, proxies: dict = None, certificatePath = None, session: requests.Session = None, middlewares: list = None, sid: str = None):
+        client.Client.__init__(self, deviceId=deviceId, proxies=proxies, certificatePath=certificatePath, session=session, middlewares=middlewares)
 
+        if sid is not None: self.sid = sid
+        else: self.sid = headers.sid
+
+        self.authenticated = self.sid is not None
+        self.userId = getattr(profile, "userId", None)
         self.profile = profile
         self.comId = comId
 
@@ -36,9 +39,8 @@ class ACM(client.Client):
             "timestamp": int(timestamp() * 1000)
         })
 
-        response = requests.post(f"{self.api}/g/s/community", headers=headers.Headers(data=data).headers, data=data)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", "/g/s/community", data=data)
+        return response.status_code
 
     def delete_community(self, email: str, password: str, verificationCode: str):
         data = json.dumps({
@@ -50,24 +52,21 @@ class ACM(client.Client):
                 "type": 1,
                 "identity": email
             },
-            "deviceID": device.device_id
+            "deviceID": self.device_id
         })
 
         if self.comId is None: raise exceptions.CommunityNeeded()
-        response = requests.post(f"{self.api}/g/s-x{self.comId}/community/delete-request", headers=headers.Headers(data=data).headers, data=data)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/g/s-x{self.comId}/community/delete-request", data=data)
+        return response.status_code
 
     def list_communities(self, start: int = 0, size: int = 25):
-        response = requests.get(f"{self.api}/g/s/community/managed?start={start}&size={size}", headers=headers.Headers().headers)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.CommunityList(json.loads(response.text)["communityList"]).CommunityList
+        response = self.request("GET", f"/g/s/community/managed?start={start}&size={size}")
+        return objects.CommunityList(json.loads(response.text)["communityList"]).CommunityList
 
     def get_categories(self, start: int = 0, size: int = 25):
         if self.comId is None: raise exceptions.CommunityNeeded()
-        response = requests.get(f"{self.api}/x{self.comId}/s/blog-category?start={start}&size={size}", headers=headers.Headers().headers)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return json.loads(response.text)
+        response = self.request("GET", f"/x{self.comId}/s/blog-category?start={start}&size={size}")
+        return json.loads(response.text)
 
     def change_sidepanel_color(self, color: str):
         data = json.dumps({
@@ -77,15 +76,13 @@ class ACM(client.Client):
         })
 
         if self.comId is None: raise exceptions.CommunityNeeded()
-        response = requests.post(f"{self.api}/x{self.comId}/s/community/configuration", headers=headers.Headers(data=data).headers, data=data)
-        if response.status_code == 200: return response.status_code
-        else: return json.loads(response.text)
+        response = self.request("POST", f"/x{self.comId}/s/community/configuration", data=data)
+        return response.status_code
 
     def upload_themepack_raw(self, file: BinaryIO):
         if self.comId is None: raise exceptions.CommunityNeeded()
-        response = requests.post(f"{self.api}/x{self.comId}/s/media/upload/target/community-theme-pack", data=file.read(), headers=headers.Headers(data=file.read()).headers)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return json.loads(response.text)
+        response = self.request("POST", f"/x{self.comId}/s/media/upload/target/community-theme-pack", data=file.read())
+        return json.loads(response.text)
 
     def promote(self, userId: str, rank: str):
         rank = rank.lower().replace("agent", "transfer-agent")
@@ -96,39 +93,34 @@ class ACM(client.Client):
         data = json.dumps({})
 
         if self.comId is None: raise exceptions.CommunityNeeded()
-        response = requests.post(f"{self.api}/x{self.comId}/s/user-profile/{userId}/{rank}", headers=headers.Headers(data=data).headers, data=data)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/x{self.comId}/s/user-profile/{userId}/{rank}", data=data)
+        return response.status_code
 
     def get_join_requests(self, start: int = 0, size: int = 25):
         if self.comId is None: raise exceptions.CommunityNeeded()
 
-        response = requests.get(f"{self.api}/x{self.comId}/s/community/membership-request?status=pending&start={start}&size={size}", headers=headers.Headers().headers)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.JoinRequest(json.loads(response.text)).JoinRequest
+        response = self.request("GET", f"/x{self.comId}/s/community/membership-request?status=pending&start={start}&size={size}")
+        return objects.JoinRequest(json.loads(response.text)).JoinRequest
 
     def accept_join_request(self, userId: str):
         data = json.dumps({})
 
         if self.comId is None: raise exceptions.CommunityNeeded()
-        response = requests.post(f"{self.api}/x{self.comId}/s/community/membership-request/{userId}/accept", headers=headers.Headers(data=data).headers, data=data)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/x{self.comId}/s/community/membership-request/{userId}/accept", data=data)
+        return response.status_code
 
     def reject_join_request(self, userId: str):
         data = json.dumps({})
 
         if self.comId is None: raise exceptions.CommunityNeeded()
-        response = requests.post(f"{self.api}/x{self.comId}/s/community/membership-request/{userId}/reject", headers=headers.Headers(data=data).headers, data=data)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/x{self.comId}/s/community/membership-request/{userId}/reject", data=data)
+        return response.status_code
 
     def get_community_stats(self):
         if self.comId is None: raise exceptions.CommunityNeeded()
 
-        response = requests.get(f"{self.api}/x{self.comId}/s/community/stats", headers=headers.Headers().headers)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.CommunityStats(json.loads(response.text)["communityStats"]).CommunityStats
+        response = self.request("GET", f"/x{self.comId}/s/community/stats")
+        return objects.CommunityStats(json.loads(response.text)["communityStats"]).CommunityStats
 
     def get_community_user_stats(self, type: str, start: int = 0, size: int = 25):
         if self.comId is None: raise exceptions.CommunityNeeded()
@@ -137,9 +129,8 @@ class ACM(client.Client):
         elif type.lower() == "curator": target = "curator"
         else: raise exceptions.WrongType(type)
 
-        response = requests.get(f"{self.api}/x{self.comId}/s/community/stats/moderation?type={target}&start={start}&size={size}", headers=headers.Headers().headers)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.UserProfileList(json.loads(response.text)["userProfileList"]).UserProfileList
+        response = self.request("GET", f"/x{self.comId}/s/community/stats/moderation?type={target}&start={start}&size={size}")
+        return objects.UserProfileList(json.loads(response.text)["userProfileList"]).UserProfileList
 
     def change_welcome_message(self, message: str, isEnabled: bool = True):
         data = json.dumps({
@@ -152,9 +143,8 @@ class ACM(client.Client):
         })
 
         if self.comId is None: raise exceptions.CommunityNeeded()
-        response = requests.post(f"{self.api}/x{self.comId}/s/community/configuration", headers=headers.Headers(data=data).headers, data=data)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/x{self.comId}/s/community/configuration", data=data)
+        return response.status_code
 
     def change_guidelines(self, message: str):
         data = json.dumps({
@@ -163,9 +153,8 @@ class ACM(client.Client):
         })
 
         if self.comId is None: raise exceptions.CommunityNeeded()
-        response = requests.post(f"{self.api}/x{self.comId}/s/community/guideline", headers=headers.Headers(data=data).headers, data=data)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/x{self.comId}/s/community/guideline", data=data)
+        return response.status_code
 
     def edit_community(self, name: str = None, description: str = None, aminoId: str = None, primaryLanguage: str = None, themePackUrl: str = None):
         data = {"timestamp": int(timestamp() * 1000)}
@@ -179,9 +168,8 @@ class ACM(client.Client):
         data = json.dumps(data)
 
         if self.comId is None: raise exceptions.CommunityNeeded()
-        response = requests.post(f"{self.api}/x{self.comId}/s/community/settings", data=data, headers=headers.Headers(data=data).headers)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/x{self.comId}/s/community/settings", data=data)
+        return response.status_code
 
     def change_module(self, module: str, isEnabled: bool):
         if module.lower() == "chat": mod = "module.chat.enabled"
@@ -209,9 +197,8 @@ class ACM(client.Client):
         })
 
         if self.comId is None: raise exceptions.CommunityNeeded()
-        response = requests.post(f"{self.api}/x{self.comId}/s/community/configuration", headers=headers.Headers(data=data).headers, data=data)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/x{self.comId}/s/community/configuration", data=data)
+        return response.status_code
 
     def add_influencer(self, userId: str, monthlyFee: int):
         data = json.dumps({
@@ -220,24 +207,20 @@ class ACM(client.Client):
         })
 
         if self.comId is None: raise exceptions.CommunityNeeded()
-        response = requests.post(f"{self.api}/x{self.comId}/s/influencer/{userId}", headers=headers.Headers(data=data).headers, data=data)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/x{self.comId}/s/influencer/{userId}", data=data)
+        return response.status_code
 
     def remove_influencer(self, userId: str):
         if self.comId is None: raise exceptions.CommunityNeeded()
-        response = requests.delete(f"{self.api}/x{self.comId}/s/influencer/{userId}", headers=headers.Headers().headers)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("DELETE", f"/x{self.comId}/s/influencer/{userId}")
+        return response.status_code
 
     def get_notice_list(self, start: int = 0, size: int = 25):
         if self.comId is None: raise exceptions.CommunityNeeded()
-        response = requests.get(f"{self.api}/x{self.comId}/s/notice?type=management&status=1&start={start}&size={size}", headers=headers.Headers().headers)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.NoticeList(json.loads(response.text)["noticeList"]).NoticeList
+        response = self.request("GET", f"/x{self.comId}/s/notice?type=management&status=1&start={start}&size={size}")
+        return objects.NoticeList(json.loads(response.text)["noticeList"]).NoticeList
 
     def delete_pending_role(self, noticeId: str):
         if self.comId is None: raise exceptions.CommunityNeeded()
-        response = requests.delete(f"{self.api}/x{self.comId}/s/notice/{noticeId}", headers=headers.Headers().headers)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("DELETE", f"/x{self.comId}/s/notice/{noticeId}")
+        return response.status_code
@@ -0,0 +1,226 @@
+import json
+import aiohttp
+from time import time as timestamp
+from typing import BinaryIO
+
+from . import async_client
+from .lib.util import exceptions, headers, objects
+
+
+class AsyncACM(async_client.AsyncClient):
+    def __init__(self, profile: objects.UserProfile, comId: str = None, deviceId: str = None, proxy: str = None, certificatePath = None, session: aiohttp.ClientSession = None, middlewares: list = None, sid: str = None):
+        async_client.AsyncClient.__init__(self, deviceId=deviceId, proxy=proxy, certificatePath=certificatePath, session=session, middlewares=middlewares)
+
+        if sid is not None: self.sid = sid
+        else: self.sid = headers.sid
+
+        self.authenticated = self.sid is not None
+        self.userId = getattr(profile, "userId", None)
+        self.profile = profile
+        self.comId = comId
+
+    # TODO : Finish the imaging sizing, might not work for every picture...
+    async def create_community(self, name: str, tagline: str, icon: BinaryIO, themeColor: str, joinType: int = 0, primaryLanguage: str = "en"):
+        data = json.dumps({
+            "icon": {
+                "height": 512.0,
+                "imageMatrix": [1.6875, 0.0, 108.0, 0.0, 1.6875, 497.0, 0.0, 0.0, 1.0],
+                "path": await self.upload_media(icon),
+                "width": 512.0,
+                "x": 0.0,
+                "y": 0.0
+            },
+            "joinType": joinType,
+            "name": name,
+            "primaryLanguage": primaryLanguage,
+            "tagline": tagline,
+            "templateId": 9,
+            "themeColor": themeColor,
+            "timestamp": int(timestamp() * 1000)
+        })
+
+        response = await self.request("POST", "/g/s/community", data=data)
+        return response.status_code
+
+    async def delete_community(self, email: str, password: str, verificationCode: str):
+        data = json.dumps({
+            "secret": f"0 {password}",
+            "validationContext": {
+                "data": {
+                    "code": verificationCode
+                },
+                "type": 1,
+                "identity": email
+            },
+            "deviceID": self.device_id
+        })
+
+        if self.comId is None: raise exceptions.CommunityNeeded()
+        response = await self.request("POST", f"/g/s-x{self.comId}/community/delete-request", data=data)
+        return response.status_code
+
+    async def list_communities(self, start: int = 0, size: int = 25):
+        response = await self.request("GET", f"/g/s/community/managed?start={start}&size={size}")
+        return objects.CommunityList(json.loads(response.text)["communityList"]).CommunityList
+
+    async def get_categories(self, start: int = 0, size: int = 25):
+        if self.comId is None: raise exceptions.CommunityNeeded()
+        response = await self.request("GET", f"/x{self.comId}/s/blog-category?start={start}&size={size}")
+        return json.loads(response.text)
+
+    async def change_sidepanel_color(self, color: str):
+        data = json.dumps({
+            "path": "appearance.leftSidePanel.style.iconColor",
+            "value": color,
+            "timestamp": int(timestamp() * 1000)
+        })
+
+        if self.comId is None: raise exceptions.CommunityNeeded()
+        response = await self.request("POST", f"/x{self.comId}/s/community/configuration", data=data)
+        return response.status_code
+
+    async def upload_themepack_raw(self, file: BinaryIO):
+        if self.comId is None: raise exceptions.CommunityNeeded()
+        response = await self.request("POST", f"/x{self.comId}/s/media/upload/target/community-theme-pack", data=file.read())
+        return json.loads(response.text)
+
+    async def promote(self, userId: str, rank: str):
+        rank = rank.lower().replace("agent", "transfer-agent")
+
+        if rank.lower() not in ["transfer-agent", "leader", "curator"]:
+            raise exceptions.WrongType(rank)
+
+        data = json.dumps({})
+
+        if self.comId is None: raise exceptions.CommunityNeeded()
+        response = await self.request("POST", f"/x{self.comId}/s/user-profile/{userId}/{rank}", data=data)
+        return response.status_code
+
+    async def get_join_requests(self, start: int = 0, size: int = 25):
+        if self.comId is None: raise exceptions.CommunityNeeded()
+
+        response = await self.request("GET", f"/x{self.comId}/s/community/membership-request?status=pending&start={start}&size={size}")
+        return objects.JoinRequest(json.loads(response.text)).JoinRequest
+
+    async def accept_join_request(self, userId: str):
+        data = json.dumps({})
+
+        if self.comId is None: raise exceptions.CommunityNeeded()
+        response = await self.request("POST", f"/x{self.comId}/s/community/membership-request/{userId}/accept", data=data)
+        return response.status_code
+
+    async def reject_join_request(self, userId: str):
+        data = json.dumps({})
+
+        if self.comId is None: raise exceptions.CommunityNeeded()
+        response = await self.request("POST", f"/x{self.comId}/s/community/membership-request/{userId}/reject", data=data)
+        return response.status_code
+
+    async def get_community_stats(self):
+        if self.comId is None: raise exceptions.CommunityNeeded()
+
+        response = await self.request("GET", f"/x{self.comId}/s/community/stats")
+        return objects.CommunityStats(json.loads(response.text)["communityStats"]).CommunityStats
+
+    async def get_community_user_stats(self, type: str, start: int = 0, size: int = 25):
+        if self.comId is None: raise exceptions.CommunityNeeded()
+
+        if type.lower() == "leader": target = "leader"
+        elif type.lower() == "curator": target = "curator"
+        else: raise exceptions.WrongType(type)
+
+        response = await self.request("GET", f"/x{self.comId}/s/community/stats/moderation?type={target}&start={start}&size={size}")
+        return objects.UserProfileList(json.loads(response.text)["userProfileList"]).UserProfileList
+
+    async def change_welcome_message(self, message: str, isEnabled: bool = True):
+        data = json.dumps({
+            "path": "general.welcomeMessage",
+            "value": {
+                "enabled": isEnabled,
+                "text": message
+            },
+            "timestamp": int(timestamp() * 1000)
+        })
+
+        if self.comId is None: raise exceptions.CommunityNeeded()
+        response = await self.request("POST", f"/x{self.comId}/s/community/configuration", data=data)
+        return response.status_code
+
+    async def change_guidelines(self, message: str):
+        data = json.dumps({
+            "content": message,
+            "timestamp": int(timestamp() * 1000)
+        })
+
+        if self.comId is None: raise exceptions.CommunityNeeded()
+        response = await self.request("POST", f"/x{self.comId}/s/community/guideline", data=data)
+        return response.status_code
+
+    async def edit_community(self, name: str = None, description: str = None, aminoId: str = None, primaryLanguage: str = None, themePackUrl: str = None):
+        data = {"timestamp": int(timestamp() * 1000)}
+
+        if name is not None: data["name"] = name
+        if description is not None: data["content"] = description
+        if aminoId is not None: data["endpoint"] = aminoId
+        if primaryLanguage is not None: data["primaryLanguage"] = primaryLanguage
+        if themePackUrl is not None: data["themePackUrl"] = themePackUrl
+
+        data = json.dumps(data)
+
+        if self.comId is None: raise exceptions.CommunityNeeded()
+        response = await self.request("POST", f"/x{self.comId}/s/community/settings", data=data)
+        return response.status_code
+
+    async def change_module(self, module: str, isEnabled: bool):
+        if module.lower() == "chat": mod = "module.chat.enabled"
+        elif module.lower() == "livechat": mod = "module.chat.avChat.videoEnabled"
+        elif module.lower() == "screeningroom": mod = "module.chat.avChat.screeningRoomEnabled"
+        elif module.lower() == "publicchats": mod = "module.chat.publicChat.enabled"
+        elif module.lower() == "posts": mod = "module.post.enabled"
+        elif module.lower() == "ranking": mod = "module.ranking.enabled"
+        elif module.lower() == "leaderboards": mod = "module.ranking.leaderboardEnabled"
+        elif module.lower() == "featured": mod = "module.featured.enabled"
+        elif module.lower() == "featuredposts": mod = "module.featured.postEnabled"
+        elif module.lower() == "featuredusers": mod = "module.featured.memberEnabled"
+        elif module.lower() == "featuredchats": mod = "module.featured.publicChatRoomEnabled"
+        elif module.lower() == "sharedfolder": mod = "module.sharedFolder.enabled"
+        elif module.lower() == "influencer": mod = "module.influencer.enabled"
+        elif module.lower() == "catalog": mod = "module.catalog.enabled"
+        elif module.lower() == "externalcontent": mod = "module.externalContent.enabled"
+        elif module.lower() == "topiccategories": mod = "module.topicCategories.enabled"
+        else: raise exceptions.SpecifyType()
+
+        data = json.dumps({
+            "path": mod,
+            "value": isEnabled,
+            "timestamp": int(timestamp() * 1000)
+        })
+
+        if self.comId is None: raise exceptions.CommunityNeeded()
+        response = await self.request("POST", f"/x{self.comId}/s/community/configuration", data=data)
+        return response.status_code
+
+    async def add_influencer(self, userId: str, monthlyFee: int):
+        data = json.dumps({
+            "monthlyFee": monthlyFee,
+            "timestamp": int(timestamp() * 1000)
+        })
+
+        if self.comId is None: raise exceptions.CommunityNeeded()
+        response = await self.request("POST", f"/x{self.comId}/s/influencer/{userId}", data=data)
+        return response.status_code
+
+    async def remove_influencer(self, userId: str):
+        if self.comId is None: raise exceptions.CommunityNeeded()
+        response = await self.request("DELETE", f"/x{self.comId}/s/influencer/{userId}")
+        return response.status_code
+
+    async def get_notice_list(self, start: int = 0, size: int = 25):
+        if self.comId is None: raise exceptions.CommunityNeeded()
+        response = await self.request("GET", f"/x{self.comId}/s/notice?type=management&status=1&start={start}&size={size}")
+        return objects.NoticeList(json.loads(response.text)["noticeList"]).NoticeList
+
+    async def delete_pending_role(self, noticeId: str):
+        if self.comId is None: raise exceptions.CommunityNeeded()
+        response = await self.request("DELETE", f"/x{self.comId}/s/notice/{noticeId}")
+        return response.status_code
@@ -0,0 +1,247 @@
+import time
+import random
+import asyncio
+import aiohttp
+
+from .socket import frame_t
+from .lib.util import objects, pagination
+
+
+class AsyncSocketHandler:
+    def __init__(self, client, socket_trace = False, debug = False, frameQueue = None):
+        self.socket_url = "wss://ws1.narvii.com"
+        self.client = client
+        self.debug = debug
+        self.active = True
+        self.connected = False
+        self.headers = None
+        self.socket = None
+        self.socket_task = None
+        self.reconnect_task = None
+        self.reconnect = True
+        self.socket_stop = False
+        self.socket_trace = socket_trace
+
+        self.pingInterval = 30  # aiohttp pings every 30 seconds and closes the socket if the pong is late.
+        self.checkInterval = 5
+        self.backoffBase = 1
+        self.backoffMax = 60
+
+        self.backfillMessages = True  # Fetch the messages sent while the socket was down after a reconnect.
+        self.backfillPageSize = 100
+        self.backfillLimit = 500  # Per Chat.
+        self.backfill_task = None
+
+        self.frameQueue = frameQueue  # Frames are handled by the socket reader without one.
+        self.frame_task = None
+
+        self.lastFrame = 0
+        self.disconnectedAt = None
+        self.failures = 0
+        self.reconnects = 0
+        self.downtime = 0.0
+
+    async def run_socket(self):
+        if self.reconnect_task is None or self.reconnect_task.done():
+            self.reconnect_task = asyncio.ensure_future(self.reconnect_handler())
+
+    def alive(self):
+        return self.connected and not self.socket.closed and not self.socket_task.done()
+
+    def backoff(self):
+        # Full jitter, so a fleet of bots does not reconnect in lockstep after an outage.
+        return random.uniform(0, min(self.backoffMax, self.backoffBase * 2 ** self.failures))
+
+    async def reconnect_handler(self):
+        while self.reconnect:
+            if self.socket_task is not None and not self.alive():
+                self.disconnected()
+                delay = self.backoff()
+                if self.debug:
+                    print(f"[socket][reconnect_handler] Socket is dead, reconnecting in {delay:.1f}s (failures : {self.failures})")
+
+                self.failures += 1
+                await asyncio.sleep(delay)
+                if not self.reconnect: break
+
+                self.reconnects += 1
+                await self.restart()
+
+            await asyncio.sleep(self.checkInterval)
+
+        if self.debug:
+            print("[socket][reconnect_handler] reconnect is False, breaking")
+
+    def stats(self):
+        """
+        **Returns**
+            - **Success** : Dict with the number of ``reconnects``, the total ``downtime`` in seconds and whether the socket is ``connected``.
+        """
+        downtime = self.downtime
+        if self.disconnectedAt is not None: downtime += time.monotonic() - self.disconnectedAt
+        return {"connected": self.connected, "reconnects": self.reconnects, "downtime": downtime, "failures": self.failures}
+
+    def disconnected(self):
+        self.connected = False
+        if self.disconnectedAt is None: self.disconnectedAt = time.monotonic()
+
+    def on_open(self):
+        if self.debug:
+            print("[socket][on_open] Socket Opened")
+
+        now = time.monotonic()
+        self.lastFrame = now
+        self.connected = True
+        self.failures = 0
+
+        if self.disconnectedAt is not None:
+            self.downtime += now - self.disconnectedAt
+            self.disconnectedAt = None
+
+            if self.backfillMessages:
+                # Chats are held before the first frame of the new socket is read, so live Messages wait for the missed ones.
+                targets = self.client.backfill_targets()
+                if targets: self.backfill_task = asyncio.ensure_future(self.backfill(targets))
+
+    async def backfill(self, targets):
+        """
+        Fetch the Messages sent while the socket was down and replay them through the :class:`Callbacks <amino.socket.Callbacks>`, oldest first.
+
+        **Parameters**
+            - **targets** : List of ``(comId, chatId, createdTime, messageId)`` of the last Message seen in each Chat.
+        """
+        replayed = 0
+
+        try:
+            for comId, chatId, createdTime, messageId in targets:
+                messages = []
+
+                try:
+                    async for message in pagination.apaginate(
+                        lambda pageToken: self.client.get_chat_messages(chatId, self.backfillPageSize, pageToken=pageToken, comId=comId),
+                        lambda page: [objects.LazyMessage(x) for x in page.json],
+                        "messageId", untilTime=createdTime, untilId=messageId, maxItems=self.backfillLimit
+                    ): messages.append(message.json)
+
+                except Exception as backfillError:
+                    if self.debug:
+                        print(f"[socket][backfill] Error while fetching the Messages of {chatId} : {backfillError}")
+
+                if self.debug:
+                    print(f"[socket][backfill] {len(messages)} missed Messages in {chatId}")
+
+                messages.reverse()
+                self.client.replay_messages(comId, chatId, messages)
+                replayed += 1
+
+        finally:
+            # The Chats a failed or cancelled backfill did not reach get their live Messages back.
+            for comId, chatId, createdTime, messageId in targets[replayed:]: self.client.replay_messages(comId, chatId, [])
+
+    def on_close(self):
+        if self.debug:
+            print("[socket][on_close] Socket Closed")
+
+        self.active = False
+        self.disconnected()
+
+        if self.reconnect:
+            if self.debug:
+                print("[socket][on_close] reconnect is True, Opening Socket")
+
+    async def handle_message(self, data):
+        if self.socket_trace:
+            print(f"[socket][handle_message] Received Data : {data}")
+
+        self.client.handle_socket_message(data)
+        if self.client.dispatcher is not None: await self.client.dispatcher.wait()
+        return
+
+    async def read_socket(self):
+        socket = self.socket
+
+        async for message in socket:
+            if message.type == aiohttp.WSMsgType.TEXT:
+                self.lastFrame = time.monotonic()
+                if self.frameQueue is not None: await self.frameQueue.put(message.data, frame_t(message.data))
+                else: await self.handle_message(message.data)
+
+            elif message.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
+                break
+
+        if socket is self.socket: self.on_close()
+
+    async def send(self, data):
+        if self.debug:
+            print(f"[socket][send] Sending Data : {data}")
+
+        await self.socket.send_str(data)
+
+    async def start(self):
+        if self.debug:
+            print("[socket][start] Starting Socket")
+
+        self.headers = {
+            "NDCDEVICEID": self.client.device_id,
+            "NDCAUTH": f"sid={self.client.sid}"
+        }
+
+        self.socket = await self.connect(f"{self.socket_url}/?signbody={self.client.device_id}%7C{int(time.time() * 1000)}")
+
+        if self.frameQueue is not None and (self.frame_task is None or self.frame_task.done()):
+            self.frameQueue.open()
+            self.frame_task = asyncio.ensure_future(self.frameQueue.run(self.handle_message))
+
+        self.on_open()
+        self.socket_task = asyncio.ensure_future(self.read_socket())
+        self.reconnect = True
+        self.active = True
+        self.socket_stop = False
+
+        if self.debug:
+            print("[socket][start] Socket Started")
+
+    async def connect(self, url: str):
+        return await self.client.session.ws_connect(
+            url,
+            headers = self.headers,
+            proxy = self.client.proxy,
+            ssl = self.client.ssl,
+            heartbeat = self.pingInterval
+        )
+
+    async def restart(self):
+        if self.debug:
+            print("[socket][restart] Restarting Socket")
+
+        try:
+            await self.socket.close()
+        except Exception as closeError:
+            if self.debug:
+                print(f"[socket][restart] Error while closing Socket : {closeError}")
+
+        try:
+            await self.start()
+        except Exception as startError:
+            if self.debug:
+                print(f"[socket][restart] Error while starting Socket : {startError}")
+
+    async def close(self):
+        if self.debug:
+            print("[socket][close] Closing Socket")
+
+        self.reconnect = False
+        self.active = False
+        self.connected = False
+        self.socket_stop = True
+        if self.backfill_task is not None: self.backfill_task.cancel()
+        if self.frameQueue is not None: await self.frameQueue.close()
+        if self.socket is None: return
+
+        try:
+            await self.socket.close()
+        except Exception as closeError:
+            if self.debug:
+                print(f"[socket][close] Error while closing Socket : {closeError}")
+
+        return
@@ -8,30 +8,52 @@ from os import urandom
 from time import timezone, sleep
 from typing import BinaryIO
 from binascii import hexlify
+from functools import partial
 from time import time as timestamp
 from locale import getdefaultlocale as locale
+from requests.adapters import HTTPAdapter
 
-from .lib.util import exceptions, headers, device, objects, helpers
+from .lib.util import exceptions, headers, device, objects, helpers, middleware, pagination
 from .socket import Callbacks, SocketHandler
 
-device = device.DeviceGenerator()
 
 class Client(Callbacks, SocketHandler):
-    def __init__(self, deviceId: str = None, proxies: dict = None, certificatePath = None, socket_trace = False, socketDebugging = False):
+    def __init__(self, deviceId: str = None, proxies: dict = None, certificatePath = None, socket_trace = False, socketDebugging = False, session: requests.Session = None, pool_connections: int = 10, pool_maxsize: int = 10, pool_block: bool = False, middlewares: list = None, dispatcher = None, frameQueue = None, socketManager = None):
+        """
+        Amino Client.
+
+        **Parameters**
+            - *deviceId* : ID of the Device.
+            - *proxies* : Proxies used for every request.
+            - *certificatePath* : Path of the certificate used to verify requests.
+            - *session* : Shared :class:`requests.Session`. If given, the pool options below are ignored.
+            - *pool_connections* : Number of hosts to keep a connection pool for.
+            - *pool_maxsize* : Maximum number of keep-alive connections per host.
+            - *pool_block* : If the pool should block instead of opening extra connections when full.
+            - *middlewares* : List of :meth:`Middlewares <amino.lib.util.middleware.Middleware>` every request goes through.
+            - *dispatcher* : :meth:`ThreadDispatcher <amino.lib.util.dispatch.ThreadDispatcher>` running the event handlers. They run on the socket reader if not given.
+            - *frameQueue* : :meth:`FrameQueue <amino.lib.util.dispatch.FrameQueue>` buffering the frames between the socket reader and the handlers.
+            - *socketManager* : :meth:`SocketManager <amino.socket_manager.SocketManager>` running the socket with the ones of other accounts.
+        """
         self.api = "https://service.narvii.com/api/v1"
         self.authenticated = False
         self.configured = False
-        self.user_agent = device.user_agent
-
-        if deviceId is not None: self.device_id = deviceId
-        else: self.device_id = device.device_id
-
-        self.device_id_sig = device.device_id_sig
-        SocketHandler.__init__(self, self, socket_trace=socket_trace, debug=socketDebugging)
-        Callbacks.__init__(self, self)
+        dev = device.DeviceGenerator(deviceId=deviceId)
+        self.user_agent = dev.user_agent
+        self.device_id = dev.device_id
+        self.device_id_sig = dev.device_id_sig
+        self.static_headers = None
+        SocketHandler.__init__(self, self, socket_trace=socket_trace, debug=socketDebugging, frameQueue=frameQueue, socketManager=socketManager)
+        Callbacks.__init__(self, self, dispatcher=dispatcher)
         self.proxies = proxies
         self.certificatePath = certificatePath
 
+        if session is not None: self.session = session
+        else: self.session = self.create_session(pool_connections, pool_maxsize, pool_block)
+
+        if middlewares is not None: self.middlewares = middlewares
+        else: self.middlewares = []
+
         self.json = None
         self.sid = None
         self.userId = None
@@ -39,11 +61,54 @@ class Client(Callbacks, SocketHandler):
         self.profile: objects.UserProfile = objects.UserProfile(None)
         self.check_device(self.device_id)
         
-    def parse_headers(self, data = None):
-        if not data:
-            return headers.Headers(data=data, deviceId=self.device_id).headers
-        else:
-            return headers.Headers(deviceId=self.device_id).headers
+    @staticmethod
+    def create_session(pool_connections: int = 10, pool_maxsize: int = 10, pool_block: bool = False):
+        """
+        Create a keep-alive :class:`requests.Session` backed by a connection pool.
+
+        **Parameters**
+            - *pool_connections* : Number of hosts to keep a connection pool for.
+            - *pool_maxsize* : Maximum number of keep-alive connections per host.
+            - *pool_block* : If the pool should block instead of opening extra connections when full.
+
+        **Returns**
+            - **Success** : :class:`requests.Session`
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def request(self, method: str, path: str, data = None, headers: dict = None, **kwargs):
+        """
+        Send a request to the API through the middlewares.
+
+        **Parameters**
+            - **method** : HTTP method of the request.
+            - **path** : Path of the endpoint, relative to the API url.
+            - *data* : Body of the request.
+            - *headers* : Headers of the request. Built with :meth:`parse_headers` if not given.
+
+        **Returns**
+            - **Success** : :class:`requests.Response`
+
+            - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
+        """
+        if headers is None: headers = self.parse_headers(data=data)
+        handler = middleware.build_chain(self.middlewares, self._send)
+        response = handler(middleware.Request(method, f"{self.api}{path}", headers, data, **kwargs))
+        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
+        return response
+
+    def _send(self, request: middleware.Request):
+        return self.session.request(request.method, request.url, headers=request.headers, data=request.data, proxies=self.proxies, verify=self.certificatePath, **request.kwargs)
+
+    def parse_headers(self, data = None, type: str = None, sig: str = None):
+        if self.static_headers is None or self.static_headers["NDCDEVICEID"] != self.device_id:
+            self.static_headers = headers.static_headers(self.device_id, self.device_id_sig, self.user_agent)
+
+        return headers.request_headers(self.static_headers, data=data, type=type, sig=sig, sid=self.sid)
         
     def join_voice_chat(self, comId: str, chatId: str, joinType: int = 1):
         """
@@ -174,7 +239,7 @@ class Client(Callbacks, SocketHandler):
         self.userId = uId
         self.account: objects.UserProfile = self.get_user_info(uId)
         self.profile: objects.UserProfile = self.get_user_info(uId)
-        headers.sid = self.sid
+        headers.sid = self.sid  # Default of the SubClients and ACMs created without a sid
         self.start()
         self.run_socket()
 
@@ -201,22 +266,19 @@ class Client(Callbacks, SocketHandler):
             "timestamp": int(timestamp() * 1000)
         })
 
-        response = requests.post(f"{self.api}/g/s/auth/login", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
+        response = self.request("POST", "/g/s/auth/login", data=data)
         self.run_socket()
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-
-        else:
-            self.authenticated = True
-            self.json = json.loads(response.text)
-            self.sid = self.json["sid"]
-            self.userId = self.json["account"]["uid"]
-            self.account: objects.UserProfile = objects.UserProfile(self.json["account"]).UserProfile
-            self.profile: objects.UserProfile = objects.UserProfile(self.json["userProfile"]).UserProfile
-            headers.sid = self.sid
-            self.start()
-            return response.status_code
+        self.authenticated = True
+        self.json = json.loads(response.text)
+        self.sid = self.json["sid"]
+        self.userId = self.json["account"]["uid"]
+        self.account: objects.UserProfile = objects.UserProfile(self.json["account"]).UserProfile
+        self.profile: objects.UserProfile = objects.UserProfile(self.json["userProfile"]).UserProfile
+        headers.sid = self.sid  # Default of the SubClients and ACMs created without a sid
+        self.start()
+        return response.status_code
 
-    def register(self, nickname: str, email: str, password: str, verificationCode: str, deviceId: str = device.device_id):
+    def register(self, nickname: str, email: str, password: str, verificationCode: str, deviceId: str = None):
         """
         Register an account.
 
@@ -225,13 +287,14 @@ class Client(Callbacks, SocketHandler):
             - **email** : Email of the account.
             - **password** : Password of the account.
             - **verificationCode** : Verification code.
-            - **deviceId** : The device id being registered to.
+            - *deviceId* : The device id being registered to, the one of the client by default.
 
         **Returns**
             - **Success** : 200 (int)
 
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
+        if deviceId is None: deviceId = self.device_id
 
         data = json.dumps({
             "secret": f"0 {password}",
@@ -255,9 +318,8 @@ class Client(Callbacks, SocketHandler):
             "timestamp": int(timestamp() * 1000)
         })
 
-        response = requests.post(f"{self.api}/g/s/auth/register", data=data, headers=self.parse_headers(data=data), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", "/g/s/auth/register", data=data)
+        return response.status_code
 
     def restore(self, email: str, password: str):
         """
@@ -274,14 +336,13 @@ class Client(Callbacks, SocketHandler):
         """
         data = json.dumps({
             "secret": f"0 {password}",
-            "deviceID": device.device_id,
+            "deviceID": self.device_id,
             "email": email,
             "timestamp": int(timestamp() * 1000)
         })
 
-        response = requests.post(f"{self.api}/g/s/account/delete-request/cancel", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", "/g/s/account/delete-request/cancel", data=data)
+        return response.status_code
 
     def logout(self):
         """
@@ -301,18 +362,16 @@ class Client(Callbacks, SocketHandler):
             "timestamp": int(timestamp() * 1000)
         })
 
-        response = requests.post(f"{self.api}/g/s/auth/logout", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else:
-            self.authenticated = False
-            self.json = None
-            self.sid = None
-            self.userId = None
-            self.account: None
-            self.profile: None
-            headers.sid = None
-            self.close()
-            return response.status_code
+        response = self.request("POST", "/g/s/auth/logout", data=data)
+        if headers.sid == self.sid: headers.sid = None
+        self.authenticated = False
+        self.json = None
+        self.sid = None
+        self.userId = None
+        self.account: None
+        self.profile: None
+        self.close()
+        return response.status_code
 
     def configure(self, age: int, gender: str):
         """
@@ -341,9 +400,8 @@ class Client(Callbacks, SocketHandler):
             "timestamp": int(timestamp() * 1000)
         })
 
-        response = requests.post(f"{self.api}/g/s/persona/profile/basic", data=data, headers=self.parse_headers(data=data), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", "/g/s/persona/profile/basic", data=data)
+        return response.status_code
 
     def verify(self, email: str, code: str):
         """
@@ -363,13 +421,12 @@ class Client(Callbacks, SocketHandler):
                 "type": 1,
                 "identity": email,
                 "data": {"code": code}},
-            "deviceID": device.device_id,
+            "deviceID": self.device_id,
             "timestamp": int(timestamp() * 1000)
         })
 
-        response = requests.post(f"{self.api}/g/s/auth/check-security-validation", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", "/g/s/auth/check-security-validation", data=data)
+        return response.status_code
 
     def request_verify_code(self, email: str, resetPassword: bool = False):
         """
@@ -387,7 +444,7 @@ class Client(Callbacks, SocketHandler):
         data = {
             "identity": email,
             "type": 1,
-            "deviceID": device.device_id
+            "deviceID": self.device_id
         }
 
         if resetPassword is True:
@@ -395,9 +452,8 @@ class Client(Callbacks, SocketHandler):
             data["purpose"] = "reset-password"
 
         data = json.dumps(data)
-        response = requests.post(f"{self.api}/g/s/auth/request-security-validation", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", "/g/s/auth/request-security-validation", data=data)
+        return response.status_code
 
     def activate_account(self, email: str, code: str):
         """
@@ -417,12 +473,11 @@ class Client(Callbacks, SocketHandler):
             "type": 1,
             "identity": email,
             "data": {"code": code},
-            "deviceID": device.device_id
+            "deviceID": self.device_id
         })
 
-        response = requests.post(f"{self.api}/g/s/auth/activate-email", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", "/g/s/auth/activate-email", data=data)
+        return response.status_code
 
     # Provided by "𝑰 𝑵 𝑻 𝑬 𝑹 𝑳 𝑼 𝑫 𝑬#4082"
     def delete_account(self, password: str):
@@ -439,13 +494,12 @@ class Client(Callbacks, SocketHandler):
         """
 
         data = json.dumps({
-            "deviceID": device.device_id,
+            "deviceID": self.device_id,
             "secret": f"0 {password}"
         })
 
-        response = requests.post(f"{self.api}/g/s/account/delete-request", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", "/g/s/account/delete-request", data=data)
+        return response.status_code
 
     def change_password(self, email: str, password: str, code: str):
         """
@@ -471,15 +525,14 @@ class Client(Callbacks, SocketHandler):
                 "type": 1,
                 "identity": email,
                 "level": 2,
-                "deviceID": device.device_id
+                "deviceID": self.device_id
             },
             "phoneNumberValidationContext": None,
-            "deviceID": device.device_id
+            "deviceID": self.device_id
         })
 
-        response = requests.post(f"{self.api}/g/s/auth/reset-password", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", "/g/s/auth/reset-password", data=data)
+        return response.status_code
 
     def check_device(self, deviceId: str):
         """
@@ -503,14 +556,13 @@ class Client(Callbacks, SocketHandler):
             "timestamp": int(timestamp() * 1000)
         })
 
-        response = requests.post(f"{self.api}/g/s/device", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: self.configured = True; return response.status_code
+        response = self.request("POST", "/g/s/device", data=data)
+        self.configured = True
+        return response.status_code
 
     def get_account_info(self):
-        response = requests.get(f"{self.api}/g/s/account", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.UserProfile(json.loads(response.text)["account"]).UserProfile
+        response = self.request("GET", "/g/s/account")
+        return objects.UserProfile(json.loads(response.text)["account"]).UserProfile
 
     def upload_media(self, file: BinaryIO, fileType: str):
         """
@@ -531,17 +583,15 @@ class Client(Callbacks, SocketHandler):
         else: raise exceptions.SpecifyType(fileType)
 
         data = file.read()
-        response = requests.post(f"{self.api}/g/s/media/upload", data=data, headers=headers.Headers(type=t, data=data, deviceId=self.device_id).headers, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return json.loads(response.text)["mediaValue"]
+        response = self.request("POST", "/g/s/media/upload", data=data, headers=self.parse_headers(data=data, type=t))
+        return json.loads(response.text)["mediaValue"]
 
     def handle_socket_message(self, data):
         return self.resolve(data)
 
     def get_eventlog(self):
-        response = requests.get(f"{self.api}/g/s/eventlog/profile?language=en", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return json.loads(response.text)
+        response = self.request("GET", "/g/s/eventlog/profile?language=en")
+        return json.loads(response.text)
 
     def sub_clients(self, start: int = 0, size: int = 25):
         """
@@ -557,15 +607,62 @@ class Client(Callbacks, SocketHandler):
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
         if not self.authenticated: raise exceptions.NotLoggedIn()
-        response = requests.get(f"{self.api}/g/s/community/joined?v=1&start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.CommunityList(json.loads(response.text)["communityList"]).CommunityList
+        response = self.request("GET", f"/g/s/community/joined?v=1&start={start}&size={size}")
+        return objects.CommunityList(json.loads(response.text)["communityList"]).CommunityList
 
     def sub_clients_profile(self, start: int = 0, size: int = 25):
         if not self.authenticated: raise exceptions.NotLoggedIn()
-        response = requests.get(f"{self.api}/g/s/community/joined?v=1&start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return json.loads(response.text)["userInfoInCommunities"]
+        response = self.request("GET", f"/g/s/community/joined?v=1&start={start}&size={size}")
+        return json.loads(response.text)["userInfoInCommunities"]
+
+    def get_sub_client(self, comId: str = None, aminoId: str = None):
+        """
+        Create a SubClient for a Community sharing this client's connection pool and account.
+
+        **Parameters**
+            - *comId* : ID of the Community.
+            - *aminoId* : Amino ID of the Community.
+
+        **Returns**
+            - **Success** : :meth:`SubClient <amino.sub_client.SubClient>`
+
+            - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
+        """
+        from .sub_client import SubClient
+        return SubClient(comId=comId, aminoId=aminoId, profile=self.profile, deviceId=self.device_id, proxies=self.proxies, certificatePath=self.certificatePath, session=self.session, middlewares=self.middlewares, sid=self.sid)
+
+    def get_acm(self, comId: str = None):
+        """
+        Create an ACM sharing this client's connection pool and account.
+
+        **Parameters**
+            - *comId* : ID of the Community.
+
+        **Returns**
+            - **Success** : :meth:`ACM <amino.acm.ACM>`
+        """
+        from .acm import ACM
+        return ACM(profile=self.profile, comId=comId, deviceId=self.device_id, proxies=self.proxies, certificatePath=self.certificatePath, session=self.session, middlewares=self.middlewares, sid=self.sid)
+
+    def iter_all(self, method, *args, start: int = 0, size: int = 100, concurrency: int = 8, maxItems: int = None, rows: bool = False, **kwargs):
+        """
+        Iterate over every item of a list taking ``start`` and ``size``, requesting up to ``concurrency`` pages at once.
+
+        **Parameters**
+            - **method** : Method of the client returning the list, like :meth:`get_user_followers`.
+            - *args*, *kwargs* : Other arguments of ``method``.
+            - *start* : Offset to start from.
+            - *size* : Size of each page.
+            - *concurrency* : Maximum number of pages requested at once.
+            - *maxItems* : Maximum number of items.
+            - *rows* : Yield :class:`Records <amino.lib.util.objects.Record>` reading the json of each item instead of parsed objects, see :func:`records <amino.lib.util.pagination.records>`.
+
+        **Returns**
+            - **Success** : Generator of the objects of the list, in order. See :func:`flatten <amino.lib.util.pagination.flatten>`.
+
+            - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
+        """
+        return pagination.paginate_offsets(partial(method, *args, **kwargs), pagination.records if rows else pagination.flatten, start, size, concurrency, maxItems)
 
     def get_user_info(self, userId: str):
         """
@@ -579,9 +676,8 @@ class Client(Callbacks, SocketHandler):
 
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
-        response = requests.get(f"{self.api}/g/s/user-profile/{userId}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.UserProfile(json.loads(response.text)["userProfile"]).UserProfile
+        response = self.request("GET", f"/g/s/user-profile/{userId}")
+        return objects.UserProfile(json.loads(response.text)["userProfile"]).UserProfile
 
     def get_chat_threads(self, start: int = 0, size: int = 25):
         """
@@ -596,9 +692,8 @@ class Client(Callbacks, SocketHandler):
 
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
-        response = requests.get(f"{self.api}/g/s/chat/thread?type=joined-me&start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.ThreadList(json.loads(response.text)["threadList"]).ThreadList
+        response = self.request("GET", f"/g/s/chat/thread?type=joined-me&start={start}&size={size}")
+        return objects.ThreadList(json.loads(response.text)["threadList"]).ThreadList
 
     def get_chat_thread(self, chatId: str):
         """
@@ -612,14 +707,12 @@ class Client(Callbacks, SocketHandler):
 
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
-        response = requests.get(f"{self.api}/g/s/chat/thread/{chatId}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.Thread(json.loads(response.text)["thread"]).Thread
+        response = self.request("GET", f"/g/s/chat/thread/{chatId}")
+        return objects.Thread(json.loads(response.text)["thread"]).Thread
 
     def get_chat_users(self, chatId: str, start: int = 0, size: int = 25):
-        response = requests.get(f"{self.api}/g/s/chat/thread/{chatId}/member?start={start}&size={size}&type=default&cv=1.2", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.UserProfileList(json.loads(response.text)["memberList"]).UserProfileList
+        response = self.request("GET", f"/g/s/chat/thread/{chatId}/member?start={start}&size={size}&type=default&cv=1.2")
+        return objects.UserProfileList(json.loads(response.text)["memberList"]).UserProfileList
 
     def join_chat(self, chatId: str):
         """
@@ -633,9 +726,8 @@ class Client(Callbacks, SocketHandler):
 
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
-        response = requests.post(f"{self.api}/g/s/chat/thread/{chatId}/member/{self.userId}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/g/s/chat/thread/{chatId}/member/{self.userId}")
+        return response.status_code
 
     def leave_chat(self, chatId: str):
         """
@@ -649,9 +741,8 @@ class Client(Callbacks, SocketHandler):
 
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
-        response = requests.delete(f"{self.api}/g/s/chat/thread/{chatId}/member/{self.userId}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("DELETE", f"/g/s/chat/thread/{chatId}/member/{self.userId}")
+        return response.status_code
 
     def start_chat(self, userId: [str, list], message: str, title: str = None, content: str = None, isGlobal: bool = False, publishToGlobal: bool = False):
         """
@@ -690,9 +781,8 @@ class Client(Callbacks, SocketHandler):
 
         data = json.dumps(data)
 
-        response = requests.post(f"{self.api}/g/s/chat/thread", data=data, headers=self.parse_headers(data=data), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", "/g/s/chat/thread", data=data)
+        return response.status_code
 
     def invite_to_chat(self, userId: [str, list], chatId: str):
         """
@@ -716,38 +806,56 @@ class Client(Callbacks, SocketHandler):
             "timestamp": int(timestamp() * 1000)
         })
 
-        response = requests.post(f"{self.api}/g/s/chat/thread/{chatId}/member/invite", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/g/s/chat/thread/{chatId}/member/invite", data=data)
+        return response.status_code
 
     def kick(self, userId: str, chatId: str, allowRejoin: bool = True):
         if allowRejoin: allowRejoin = 1
         if not allowRejoin: allowRejoin = 0
-        response = requests.delete(f"{self.api}/g/s/chat/thread/{chatId}/member/{userId}?allowRejoin={allowRejoin}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("DELETE", f"/g/s/chat/thread/{chatId}/member/{userId}?allowRejoin={allowRejoin}")
+        return response.status_code
 
-    def get_chat_messages(self, chatId: str, size: int = 25, pageToken: str = None):
+    def get_chat_messages(self, chatId: str, size: int = 25, pageToken: str = None, comId: str = None):
         """
         List of Messages from an Chat.
 
         **Parameters**
             - **chatId** : ID of the Chat.
             - *size* : Size of the list.
-            - *size* : Size of the list.
             - *pageToken* : Next Page Token.
+            - *comId* : ID of the Community of the Chat, for a Community Chat.
 
         **Returns**
             - **Success** : :meth:`Message List <amino.lib.util.objects.MessageList>`
 
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
-        if pageToken is not None: url = f"{self.api}/g/s/chat/thread/{chatId}/message?v=2&pagingType=t&pageToken={pageToken}&size={size}"
-        else: url = f"{self.api}/g/s/chat/thread/{chatId}/message?v=2&pagingType=t&size={size}"
+        scope = f"x{comId}" if comId else "g"
+        if pageToken is not None: url = f"/{scope}/s/chat/thread/{chatId}/message?v=2&pagingType=t&pageToken={pageToken}&size={size}"
+        else: url = f"/{scope}/s/chat/thread/{chatId}/message?v=2&pagingType=t&size={size}"
 
-        response = requests.get(url, headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.GetMessages(json.loads(response.text)).GetMessages
+        response = self.request("GET", url)
+        return objects.GetMessages(json.loads(response.text)).GetMessages
+
+    def iter_chat_messages(self, chatId: str, size: int = 100, pageToken: str = None, untilTime = None, untilMessageId: str = None, maxItems: int = None, prefetch: bool = True):
+        """
+        Iterate over the Messages of a Chat, newest first, fetching the pages as needed.
+
+        **Parameters**
+            - **chatId** : ID of the Chat.
+            - *size* : Size of each page.
+            - *pageToken* : Page Token to start from.
+            - *untilTime* : Stop at the first Message sent before this unix timestamp or :class:`datetime.datetime`.
+            - *untilMessageId* : Stop at this Message, without yielding it.
+            - *maxItems* : Maximum number of Messages.
+            - *prefetch* : Request the next page while the current one is consumed.
+
+        **Returns**
+            - **Success** : Generator of :meth:`Message <amino.lib.util.objects.Message>`
+
+            - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
+        """
+        return pagination.paginate(partial(self.get_chat_messages, chatId, size), lambda page: [objects.Message(x).Message for x in page.json], "messageId", pageToken, untilTime, untilMessageId, maxItems, prefetch)
 
     def get_message_info(self, chatId: str, messageId: str):
         """
@@ -762,9 +870,8 @@ class Client(Callbacks, SocketHandler):
 
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
-        response = requests.get(f"{self.api}/g/s/chat/thread/{chatId}/message/{messageId}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.Message(json.loads(response.text)["message"]).Message
+        response = self.request("GET", f"/g/s/chat/thread/{chatId}/message/{messageId}")
+        return objects.Message(json.loads(response.text)["message"]).Message
 
     def get_community_info(self, comId: str):
         """
@@ -778,9 +885,8 @@ class Client(Callbacks, SocketHandler):
 
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
-        response = requests.get(f"{self.api}/g/s-x{comId}/community/info?withInfluencerList=1&withTopicList=true&influencerListOrderStrategy=fansCount", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.Community(json.loads(response.text)["community"]).Community
+        response = self.request("GET", f"/g/s-x{comId}/community/info?withInfluencerList=1&withTopicList=true&influencerListOrderStrategy=fansCount")
+        return objects.Community(json.loads(response.text)["community"]).Community
 
     def search_community(self, aminoId: str):
         """
@@ -794,12 +900,10 @@ class Client(Callbacks, SocketHandler):
 
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
-        response = requests.get(f"{self.api}/g/s/search/amino-id-and-link?q={aminoId}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else:
-            response = json.loads(response.text)["resultList"]
-            if len(response) == 0: raise exceptions.CommunityNotFound(aminoId)
-            else: return objects.CommunityList([com["refObject"] for com in response]).CommunityList
+        response = self.request("GET", f"/g/s/search/amino-id-and-link?q={aminoId}")
+        response = json.loads(response.text)["resultList"]
+        if len(response) == 0: raise exceptions.CommunityNotFound(aminoId)
+        else: return objects.CommunityList([com["refObject"] for com in response]).CommunityList
 
     def get_user_following(self, userId: str, start: int = 0, size: int = 25):
         """
@@ -815,9 +919,8 @@ class Client(Callbacks, SocketHandler):
 
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
-        response = requests.get(f"{self.api}/g/s/user-profile/{userId}/joined?start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.UserProfileList(json.loads(response.text)["userProfileList"]).UserProfileList
+        response = self.request("GET", f"/g/s/user-profile/{userId}/joined?start={start}&size={size}")
+        return objects.UserProfileList(json.loads(response.text)["userProfileList"]).UserProfileList
 
     def get_user_followers(self, userId: str, start: int = 0, size: int = 25):
         """
@@ -833,9 +936,8 @@ class Client(Callbacks, SocketHandler):
 
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
-        response = requests.get(f"{self.api}/g/s/user-profile/{userId}/member?start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.UserProfileList(json.loads(response.text)["userProfileList"]).UserProfileList
+        response = self.request("GET", f"/g/s/user-profile/{userId}/member?start={start}&size={size}")
+        return objects.UserProfileList(json.loads(response.text)["userProfileList"]).UserProfileList
 
     def get_user_visitors(self, userId: str, start: int = 0, size: int = 25):
         """
@@ -851,9 +953,8 @@ class Client(Callbacks, SocketHandler):
 
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
-        response = requests.get(f"{self.api}/g/s/user-profile/{userId}/visitors?start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.VisitorsList(json.loads(response.text)).VisitorsList
+        response = self.request("GET", f"/g/s/user-profile/{userId}/visitors?start={start}&size={size}")
+        return objects.VisitorsList(json.loads(response.text)).VisitorsList
 
     def get_blocked_users(self, start: int = 0, size: int = 25):
         """
@@ -868,26 +969,22 @@ class Client(Callbacks, SocketHandler):
 
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
-        response = requests.get(f"{self.api}/g/s/block?start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.UserProfileList(json.loads(response.text)["userProfileList"]).UserProfileList
+        response = self.request("GET", f"/g/s/block?start={start}&size={size}")
+        return objects.UserProfileList(json.loads(response.text)["userProfileList"]).UserProfileList
 
     def get_blog_info(self, blogId: str = None, wikiId: str = None, quizId: str = None, fileId: str = None):
         if blogId or quizId:
             if quizId is not None: blogId = quizId
-            response = requests.get(f"{self.api}/g/s/blog/{blogId}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-            if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-            else: return objects.GetBlogInfo(json.loads(response.text)).GetBlogInfo
+            response = self.request("GET", f"/g/s/blog/{blogId}")
+            return objects.GetBlogInfo(json.loads(response.text)).GetBlogInfo
 
         elif wikiId:
-            response = requests.get(f"{self.api}/g/s/item/{wikiId}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-            if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-            else: return objects.GetWikiInfo(json.loads(response.text)).GetWikiInfo
+            response = self.request("GET", f"/g/s/item/{wikiId}")
+            return objects.GetWikiInfo(json.loads(response.text)).GetWikiInfo
 
         elif fileId:
-            response = requests.get(f"{self.api}/g/s/shared-folder/files/{fileId}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-            if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-            else: return objects.SharedFolderFile(json.loads(response.text)["file"]).SharedFolderFile
+            response = self.request("GET", f"/g/s/shared-folder/files/{fileId}")
+            return objects.SharedFolderFile(json.loads(response.text)["file"]).SharedFolderFile
 
         else: raise exceptions.SpecifyType()
 
@@ -899,13 +996,12 @@ class Client(Callbacks, SocketHandler):
 
         if blogId or quizId:
             if quizId is not None: blogId = quizId
-            response = requests.get(f"{self.api}/g/s/blog/{blogId}/comment?sort={sorting}&start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        elif wikiId: response = requests.get(f"{self.api}/g/s/item/{wikiId}/comment?sort={sorting}&start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        elif fileId: response = requests.get(f"{self.api}/g/s/shared-folder/files/{fileId}/comment?sort={sorting}&start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
+            response = self.request("GET", f"/g/s/blog/{blogId}/comment?sort={sorting}&start={start}&size={size}")
+        elif wikiId: response = self.request("GET", f"/g/s/item/{wikiId}/comment?sort={sorting}&start={start}&size={size}")
+        elif fileId: response = self.request("GET", f"/g/s/shared-folder/files/{fileId}/comment?sort={sorting}&start={start}&size={size}")
         else: raise exceptions.SpecifyType()
 
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.CommentList(json.loads(response.text)["commentList"]).CommentList
+        return objects.CommentList(json.loads(response.text)["commentList"]).CommentList
 
     def get_blocker_users(self, start: int = 0, size: int = 25):
         """
@@ -920,9 +1016,8 @@ class Client(Callbacks, SocketHandler):
 
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
-        response = requests.get(f"{self.api}/g/s/block/full-list?start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return json.loads(response.text)["blockerUidList"]
+        response = self.request("GET", f"/g/s/block/full-list?start={start}&size={size}")
+        return json.loads(response.text)["blockerUidList"]
 
     def get_wall_comments(self, userId: str, sorting: str, start: int = 0, size: int = 25):
         """
@@ -945,9 +1040,8 @@ class Client(Callbacks, SocketHandler):
         elif sorting.lower() == "top": sorting = "vote"
         else: raise exceptions.WrongType(sorting)
 
-        response = requests.get(f"{self.api}/g/s/user-profile/{userId}/g-comment?sort={sorting}&start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.CommentList(json.loads(response.text)["commentList"]).CommentList
+        response = self.request("GET", f"/g/s/user-profile/{userId}/g-comment?sort={sorting}&start={start}&size={size}")
+        return objects.CommentList(json.loads(response.text)["commentList"]).CommentList
 
     def flag(self, reason: str, flagType: int, userId: str = None, blogId: str = None, wikiId: str = None, asGuest: bool = False):
         """
@@ -993,9 +1087,8 @@ class Client(Callbacks, SocketHandler):
         else: flg = "flag"
 
         data = json.dumps(data)
-        response = requests.post(f"{self.api}/g/s/{flg}", data=data, headers=self.parse_headers(data=data), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/g/s/{flg}", data=data)
+        return response.status_code
 
     def send_message(self, chatId: str, message: str = None, messageType: int = 0, file: BinaryIO = None, fileType: str = None, replyTo: str = None, mentionUserIds: list = None, stickerId: str = None, embedId: str = None, embedType: int = None, embedLink: str = None, embedTitle: str = None, embedContent: str = None, embedImage: BinaryIO = None):
         """
@@ -1078,9 +1171,8 @@ class Client(Callbacks, SocketHandler):
             data["mediaUploadValue"] = base64.b64encode(file.read()).decode()
 
         data = json.dumps(data)
-        response = requests.post(f"{self.api}/g/s/chat/thread/{chatId}/message", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/g/s/chat/thread/{chatId}/message", data=data)
+        return response.status_code
 
     def delete_message(self, chatId: str, messageId: str, asStaff: bool = False, reason: str = None):
         """
@@ -1104,10 +1196,9 @@ class Client(Callbacks, SocketHandler):
         }
 
         data = json.dumps(data)
-        if not asStaff: response = requests.delete(f"{self.api}/g/s/chat/thread/{chatId}/message/{messageId}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        else: response = requests.post(f"{self.api}/g/s/chat/thread/{chatId}/message/{messageId}/admin", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        if not asStaff: response = self.request("DELETE", f"/g/s/chat/thread/{chatId}/message/{messageId}")
+        else: response = self.request("POST", f"/g/s/chat/thread/{chatId}/message/{messageId}/admin", data=data)
+        return response.status_code
 
     def mark_as_read(self, chatId: str, messageId: str):
         """
@@ -1126,9 +1217,8 @@ class Client(Callbacks, SocketHandler):
             "messageId": messageId,
             "timestamp": int(timestamp() * 1000)
         })
-        response = requests.post(f"{self.api}/g/s/chat/thread/{chatId}/mark-as-read", headers=self.parse_headers(), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/g/s/chat/thread/{chatId}/mark-as-read", data=data)
+        return response.status_code
 
     def edit_chat(self, chatId: str, doNotDisturb: bool = None, pinChat: bool = None, title: str = None, icon: str = None, backgroundImage: str = None, content: str = None, announcement: str = None, coHosts: list = None, keywords: list = None, pinAnnouncement: bool = None, publishToGlobal: bool = None, canTip: bool = None, viewOnly: bool = None, canInvite: bool = None, fansOnly: bool = None):
         """
@@ -1175,76 +1265,63 @@ class Client(Callbacks, SocketHandler):
         if doNotDisturb is not None:
             if doNotDisturb:
                 data = json.dumps({"alertOption": 2, "timestamp": int(timestamp() * 1000)})
-                response = requests.post(f"{self.api}/g/s/chat/thread/{chatId}/member/{self.userId}/alert", data=data, headers=self.parse_headers(data=data), proxies=self.proxies, verify=self.certificatePath)
-                if response.status_code != 200: res.append(exceptions.CheckException(json.loads(response.text)))
-                else: res.append(response.status_code)
+                response = self.request("POST", f"/g/s/chat/thread/{chatId}/member/{self.userId}/alert", data=data)
+                res.append(response.status_code)
 
             if not doNotDisturb:
                 data = json.dumps({"alertOption": 1, "timestamp": int(timestamp() * 1000)})
-                response = requests.post(f"{self.api}/g/s/chat/thread/{chatId}/member/{self.userId}/alert", data=data, headers=self.parse_headers(data=data), proxies=self.proxies, verify=self.certificatePath)
-                if response.status_code != 200: res.append(exceptions.CheckException(json.loads(response.text)))
-                else: res.append(response.status_code)
+                response = self.request("POST", f"/g/s/chat/thread/{chatId}/member/{self.userId}/alert", data=data)
+                res.append(response.status_code)
 
         if pinChat is not None:
             if pinChat:
-                response = requests.post(f"{self.api}/g/s/chat/thread/{chatId}/pin", data=data, headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-                if response.status_code != 200: res.append(exceptions.CheckException(json.loads(response.text)))
-                else: res.append(response.status_code)
+                response = self.request("POST", f"/g/s/chat/thread/{chatId}/pin", data=data)
+                res.append(response.status_code)
 
             if not pinChat:
-                response = requests.post(f"{self.api}/g/s/chat/thread/{chatId}/unpin", data=data, headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-                if response.status_code != 200: res.append(exceptions.CheckException(json.loads(response.text)))
-                else: res.append(response.status_code)
+                response = self.request("POST", f"/g/s/chat/thread/{chatId}/unpin", data=data)
+                res.append(response.status_code)
 
         if backgroundImage is not None:
             data = json.dumps({"media": [100, backgroundImage, None], "timestamp": int(timestamp() * 1000)})
-            response = requests.post(f"{self.api}/g/s/chat/thread/{chatId}/member/{self.userId}/background", data=data, headers=self.parse_headers(data=data), proxies=self.proxies, verify=self.certificatePath)
-            if response.status_code != 200: res.append(exceptions.CheckException(json.loads(response.text)))
-            else: res.append(response.status_code)
+            response = self.request("POST", f"/g/s/chat/thread/{chatId}/member/{self.userId}/background", data=data)
+            res.append(response.status_code)
 
         if coHosts is not None:
             data = json.dumps({"uidList": coHosts, "timestamp": int(timestamp() * 1000)})
-            response = requests.post(f"{self.api}/g/s/chat/thread/{chatId}/co-host", data=data, headers=self.parse_headers(data=data), proxies=self.proxies, verify=self.certificatePath)
-            if response.status_code != 200: res.append(exceptions.CheckException(json.loads(response.text)))
-            else: res.append(response.status_code)
+            response = self.request("POST", f"/g/s/chat/thread/{chatId}/co-host", data=data)
+            res.append(response.status_code)
 
         if viewOnly is not None:
             if viewOnly:
-                response = requests.post(f"{self.api}/g/s/chat/thread/{chatId}/view-only/enable", data=data, headers=self.parse_headers(data=data), proxies=self.proxies, verify=self.certificatePath)
-                if response.status_code != 200: res.append(exceptions.CheckException(json.loads(response.text)))
-                else: res.append(response.status_code)
+                response = self.request("POST", f"/g/s/chat/thread/{chatId}/view-only/enable", data=data)
+                res.append(response.status_code)
 
             if not viewOnly:
-                response = requests.post(f"{self.api}/g/s/chat/thread/{chatId}/view-only/disable", data=data, headers=self.parse_headers(data=data), proxies=self.proxies, verify=self.certificatePath)
-                if response.status_code != 200: res.append(exceptions.CheckException(json.loads(response.text)))
-                else: res.append(response.status_code)
+                response = self.request("POST", f"/g/s/chat/thread/{chatId}/view-only/disable", data=data)
+                res.append(response.status_code)
 
         if canInvite is not None:
             if canInvite:
-                response = requests.post(f"{self.api}/g/s/chat/thread/{chatId}/members-can-invite/enable", data=data, headers=self.parse_headers(data=data), proxies=self.proxies, verify=self.certificatePath)
-                if response.status_code != 200: res.append(exceptions.CheckException(json.loads(response.text)))
-                else: res.append(response.status_code)
+                response = self.request("POST", f"/g/s/chat/thread/{chatId}/members-can-invite/enable", data=data)
+                res.append(response.status_code)
 
             if not canInvite:
-                response = requests.post(f"{self.api}/g/s/chat/thread/{chatId}/members-can-invite/disable", data=data, headers=self.parse_headers(data=data), proxies=self.proxies, verify=self.certificatePath)
-                if response.status_code != 200: res.append(exceptions.CheckException(json.loads(response.text)))
-                else: res.append(response.status_code)
+                response = self.request("POST", f"/g/s/chat/thread/{chatId}/members-can-invite/disable", data=data)
+                res.append(response.status_code)
 
         if canTip is not None:
             if canTip:
-                response = requests.post(f"{self.api}/g/s/chat/thread/{chatId}/tipping-perm-status/enable", data=data, headers=self.parse_headers(data=data), proxies=self.proxies, verify=self.certificatePath)
-                if response.status_code != 200: res.append(exceptions.CheckException(json.loads(response.text)))
-                else: res.append(response.status_code)
+                response = self.request("POST", f"/g/s/chat/thread/{chatId}/tipping-perm-status/enable", data=data)
+                res.append(response.status_code)
 
             if not canTip:
-                response = requests.post(f"{self.api}/g/s/chat/thread/{chatId}/tipping-perm-status/disable", data=data, headers=self.parse_headers(data=data), proxies=self.proxies, verify=self.certificatePath)
-                if response.status_code != 200: res.append(exceptions.CheckException(json.loads(response.text)))
-                else: res.append(response.status_code)
+                response = self.request("POST", f"/g/s/chat/thread/{chatId}/tipping-perm-status/disable", data=data)
+                res.append(response.status_code)
 
         data = json.dumps(data)
-        response = requests.post(f"{self.api}/g/s/chat/thread/{chatId}", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: res.append(exceptions.CheckException(json.loads(response.text)))
-        else: res.append(response.status_code)
+        response = self.request("POST", f"/g/s/chat/thread/{chatId}", data=data)
+        res.append(response.status_code)
 
         return res
 
@@ -1260,9 +1337,8 @@ class Client(Callbacks, SocketHandler):
 
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
-        response = requests.get(f"{self.api}/g/s/user-profile/{userId}?action=visit", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("GET", f"/g/s/user-profile/{userId}?action=visit")
+        return response.status_code
 
     def send_coins(self, coins: int, blogId: str = None, chatId: str = None, objectId: str = None, transactionId: str = None):
         url = None
@@ -1274,19 +1350,18 @@ class Client(Callbacks, SocketHandler):
             "timestamp": int(timestamp() * 1000)
         }
 
-        if blogId is not None: url = f"{self.api}/g/s/blog/{blogId}/tipping"
-        if chatId is not None: url = f"{self.api}/g/s/chat/thread/{chatId}/tipping"
+        if blogId is not None: url = f"/g/s/blog/{blogId}/tipping"
+        if chatId is not None: url = f"/g/s/chat/thread/{chatId}/tipping"
         if objectId is not None:
             data["objectId"] = objectId
             data["objectType"] = 2
-            url = f"{self.api}/g/s/tipping"
+            url = "/g/s/tipping"
 
         if url is None: raise exceptions.SpecifyType()
 
         data = json.dumps(data)
-        response = requests.post(url, headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", url, data=data)
+        return response.status_code
 
     def follow(self, userId: [str, list]):
         """
@@ -1301,16 +1376,15 @@ class Client(Callbacks, SocketHandler):
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
         if isinstance(userId, str):
-            response = requests.post(f"{self.api}/g/s/user-profile/{userId}/member", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
+            response = self.request("POST", f"/g/s/user-profile/{userId}/member")
 
         elif isinstance(userId, list):
             data = json.dumps({"targetUidList": userId, "timestamp": int(timestamp() * 1000)})
-            response = requests.post(f"{self.api}/g/s/user-profile/{self.userId}/joined", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
+            response = self.request("POST", f"/g/s/user-profile/{self.userId}/joined", data=data)
 
         else: raise exceptions.WrongType
 
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        return response.status_code
 
     def unfollow(self, userId: str):
         """
@@ -1324,9 +1398,8 @@ class Client(Callbacks, SocketHandler):
 
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
-        response = requests.delete(f"{self.api}/g/s/user-profile/{userId}/member/{self.userId}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("DELETE", f"/g/s/user-profile/{userId}/member/{self.userId}")
+        return response.status_code
 
     def block(self, userId: str):
         """
@@ -1340,9 +1413,8 @@ class Client(Callbacks, SocketHandler):
 
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
-        response = requests.post(f"{self.api}/g/s/block/{userId}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/g/s/block/{userId}")
+        return response.status_code
 
     def unblock(self, userId: str):
         """
@@ -1356,9 +1428,8 @@ class Client(Callbacks, SocketHandler):
 
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
-        response = requests.delete(f"{self.api}/g/s/block/{userId}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("DELETE", f"/g/s/block/{userId}")
+        return response.status_code
 
     def join_community(self, comId: str, invitationId: str = None):
         """
@@ -1377,9 +1448,8 @@ class Client(Callbacks, SocketHandler):
         if invitationId: data["invitationId"] = invitationId
 
         data = json.dumps(data)
-        response = requests.post(f"{self.api}/x{comId}/s/community/join", data=data, headers=self.parse_headers(data=data), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/x{comId}/s/community/join", data=data)
+        return response.status_code
 
     def request_join_community(self, comId: str, message: str = None):
         """
@@ -1395,9 +1465,8 @@ class Client(Callbacks, SocketHandler):
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
         data = json.dumps({"message": message, "timestamp": int(timestamp() * 1000)})
-        response = requests.post(f"{self.api}/x{comId}/s/community/membership-request", data=data, headers=self.parse_headers(data=data), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/x{comId}/s/community/membership-request", data=data)
+        return response.status_code
 
     def leave_community(self, comId: str):
         """
@@ -1411,9 +1480,8 @@ class Client(Callbacks, SocketHandler):
 
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
-        response = requests.post(f"{self.api}/x{comId}/s/community/leave", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/x{comId}/s/community/leave")
+        return response.status_code
 
     def flag_community(self, comId: str, reason: str, flagType: int, isGuest: bool = False):
         """
@@ -1443,9 +1511,8 @@ class Client(Callbacks, SocketHandler):
         if isGuest: flg = "g-flag"
         else: flg = "flag"
 
-        response = requests.post(f"{self.api}/x{comId}/s/{flg}", data=data, headers=self.parse_headers(data=data), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/x{comId}/s/{flg}", data=data)
+        return response.status_code
 
     def edit_profile(self, nickname: str = None, content: str = None, icon: BinaryIO = None, backgroundColor: str = None, backgroundImage: str = None, defaultBubbleId: str = None):
         """
@@ -1481,9 +1548,8 @@ class Client(Callbacks, SocketHandler):
         if defaultBubbleId: data["extensions"] = {"defaultBubbleId": defaultBubbleId}
 
         data = json.dumps(data)
-        response = requests.post(f"{self.api}/g/s/user-profile/{self.userId}", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/g/s/user-profile/{self.userId}", data=data)
+        return response.status_code
 
     def set_privacy_status(self, isAnonymous: bool = False, getNotifications: bool = False):
         """
@@ -1507,9 +1573,8 @@ class Client(Callbacks, SocketHandler):
         if getNotifications: data["privacyMode"] = 1
 
         data = json.dumps(data)
-        response = requests.post(f"{self.api}/g/s/account/visit-settings", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", "/g/s/account/visit-settings", data=data)
+        return response.status_code
 
     def set_amino_id(self, aminoId: str):
         """
@@ -1524,9 +1589,8 @@ class Client(Callbacks, SocketHandler):
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
         data = json.dumps({"aminoId": aminoId, "timestamp": int(timestamp() * 1000)})
-        response = requests.post(f"{self.api}/g/s/account/change-amino-id", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", "/g/s/account/change-amino-id", data=data)
+        return response.status_code
 
     def get_linked_communities(self, userId: str):
         """
@@ -1540,9 +1604,8 @@ class Client(Callbacks, SocketHandler):
 
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
-        response = requests.get(f"{self.api}/g/s/user-profile/{userId}/linked-community", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.CommunityList(json.loads(response.text)["linkedCommunityList"]).CommunityList
+        response = self.request("GET", f"/g/s/user-profile/{userId}/linked-community")
+        return objects.CommunityList(json.loads(response.text)["linkedCommunityList"]).CommunityList
 
     def get_unlinked_communities(self, userId: str):
         """
@@ -1556,9 +1619,8 @@ class Client(Callbacks, SocketHandler):
 
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
-        response = requests.get(f"{self.api}/g/s/user-profile/{userId}/linked-community", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.CommunityList(json.loads(response.text)["unlinkedCommunityList"]).CommunityList
+        response = self.request("GET", f"/g/s/user-profile/{userId}/linked-community")
+        return objects.CommunityList(json.loads(response.text)["unlinkedCommunityList"]).CommunityList
 
     def reorder_linked_communities(self, comIds: list):
         """
@@ -1573,9 +1635,8 @@ class Client(Callbacks, SocketHandler):
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
         data = json.dumps({"ndcIds": comIds, "timestamp": int(timestamp() * 1000)})
-        response = requests.post(f"{self.api}/g/s/user-profile/{self.userId}/linked-community/reorder", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/g/s/user-profile/{self.userId}/linked-community/reorder", data=data)
+        return response.status_code
 
     def add_linked_community(self, comId: str):
         """
@@ -1589,9 +1650,8 @@ class Client(Callbacks, SocketHandler):
 
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
-        response = requests.post(f"{self.api}/g/s/user-profile/{self.userId}/linked-community/{comId}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/g/s/user-profile/{self.userId}/linked-community/{comId}")
+        return response.status_code
 
     def remove_linked_community(self, comId: str):
         """
@@ -1605,9 +1665,8 @@ class Client(Callbacks, SocketHandler):
 
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
-        response = requests.delete(f"{self.api}/g/s/user-profile/{self.userId}/linked-community/{comId}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("DELETE", f"/g/s/user-profile/{self.userId}/linked-community/{comId}")
+        return response.status_code
 
     def comment(self, message: str, userId: str = None, blogId: str = None, wikiId: str = None, replyTo: str = None):
         """
@@ -1639,21 +1698,20 @@ class Client(Callbacks, SocketHandler):
         if userId:
             data["eventSource"] = "UserProfileView"
             data = json.dumps(data)
-            response = requests.post(f"{self.api}/g/s/user-profile/{userId}/g-comment", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
+            response = self.request("POST", f"/g/s/user-profile/{userId}/g-comment", data=data)
 
         elif blogId:
             data["eventSource"] = "PostDetailView"
             data = json.dumps(data)
-            response = requests.post(f"{self.api}/g/s/blog/{blogId}/g-comment", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
+            response = self.request("POST", f"/g/s/blog/{blogId}/g-comment", data=data)
 
         elif wikiId:
             data["eventSource"] = "PostDetailView"
             data = json.dumps(data)
-            response = requests.post(f"{self.api}/g/s/item/{wikiId}/g-comment", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
+            response = self.request("POST", f"/g/s/item/{wikiId}/g-comment", data=data)
 
         else: raise exceptions.SpecifyType
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        return response.status_code
 
     def delete_comment(self, commentId: str, userId: str = None, blogId: str = None, wikiId: str = None):
         """
@@ -1670,13 +1728,12 @@ class Client(Callbacks, SocketHandler):
 
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
-        if userId: response = requests.delete(f"{self.api}/g/s/user-profile/{userId}/g-comment/{commentId}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        elif blogId: response = requests.delete(f"{self.api}/g/s/blog/{blogId}/g-comment/{commentId}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        elif wikiId: response = requests.delete(f"{self.api}/g/s/item/{wikiId}/g-comment/{commentId}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
+        if userId: response = self.request("DELETE", f"/g/s/user-profile/{userId}/g-comment/{commentId}")
+        elif blogId: response = self.request("DELETE", f"/g/s/blog/{blogId}/g-comment/{commentId}")
+        elif wikiId: response = self.request("DELETE", f"/g/s/item/{wikiId}/g-comment/{commentId}")
         else: raise exceptions.SpecifyType
 
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        return response.status_code
 
     def like_blog(self, blogId: [str, list] = None, wikiId: str = None):
         """
@@ -1700,24 +1757,23 @@ class Client(Callbacks, SocketHandler):
             if isinstance(blogId, str):
                 data["eventSource"] = "UserProfileView"
                 data = json.dumps(data)
-                response = requests.post(f"{self.api}/g/s/blog/{blogId}/g-vote?cv=1.2", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
+                response = self.request("POST", f"/g/s/blog/{blogId}/g-vote?cv=1.2", data=data)
 
             elif isinstance(blogId, list):
                 data["targetIdList"] = blogId
                 data = json.dumps(data)
-                response = requests.post(f"{self.api}/g/s/feed/g-vote", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
+                response = self.request("POST", "/g/s/feed/g-vote", data=data)
 
             else: raise exceptions.WrongType(type(blogId))
 
         elif wikiId:
             data["eventSource"] = "PostDetailView"
             data = json.dumps(data)
-            response = requests.post(f"{self.api}/g/s/item/{wikiId}/g-vote?cv=1.2", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
+            response = self.request("POST", f"/g/s/item/{wikiId}/g-vote?cv=1.2", data=data)
 
         else: raise exceptions.SpecifyType()
 
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        return response.status_code
 
     def unlike_blog(self, blogId: str = None, wikiId: str = None):
         """
@@ -1732,12 +1788,11 @@ class Client(Callbacks, SocketHandler):
 
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
-        if blogId: response = requests.delete(f"{self.api}/g/s/blog/{blogId}/g-vote?eventSource=UserProfileView", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        elif wikiId: response = requests.delete(f"{self.api}/g/s/item/{wikiId}/g-vote?eventSource=PostDetailView", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
+        if blogId: response = self.request("DELETE", f"/g/s/blog/{blogId}/g-vote?eventSource=UserProfileView")
+        elif wikiId: response = self.request("DELETE", f"/g/s/item/{wikiId}/g-vote?eventSource=PostDetailView")
         else: raise exceptions.SpecifyType
 
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        return response.status_code
 
     def like_comment(self, commentId: str, userId: str = None, blogId: str = None, wikiId: str = None):
         """
@@ -1762,22 +1817,21 @@ class Client(Callbacks, SocketHandler):
         if userId:
             data["eventSource"] = "UserProfileView"
             data = json.dumps(data)
-            response = requests.post(f"{self.api}/g/s/user-profile/{userId}/comment/{commentId}/g-vote?cv=1.2&value=1", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
+            response = self.request("POST", f"/g/s/user-profile/{userId}/comment/{commentId}/g-vote?cv=1.2&value=1", data=data)
 
         elif blogId:
             data["eventSource"] = "PostDetailView"
             data = json.dumps(data)
-            response = requests.post(f"{self.api}/g/s/blog/{blogId}/comment/{commentId}/g-vote?cv=1.2&value=1", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
+            response = self.request("POST", f"/g/s/blog/{blogId}/comment/{commentId}/g-vote?cv=1.2&value=1", data=data)
 
         elif wikiId:
             data["eventSource"] = "PostDetailView"
             data = json.dumps(data)
-            response = requests.post(f"{self.api}/g/s/item/{wikiId}/comment/{commentId}/g-vote?cv=1.2&value=1", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
+            response = self.request("POST", f"/g/s/item/{wikiId}/comment/{commentId}/g-vote?cv=1.2&value=1", data=data)
 
         else: raise exceptions.SpecifyType
 
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        return response.status_code
 
     def unlike_comment(self, commentId: str, userId: str = None, blogId: str = None, wikiId: str = None):
         """
@@ -1794,13 +1848,12 @@ class Client(Callbacks, SocketHandler):
 
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
-        if userId: response = requests.delete(f"{self.api}/g/s/user-profile/{userId}/comment/{commentId}/g-vote?eventSource=UserProfileView", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        elif blogId: response = requests.delete(f"{self.api}/g/s/blog/{blogId}/comment/{commentId}/g-vote?eventSource=PostDetailView", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        elif wikiId: response = requests.delete(f"{self.api}/g/s/item/{wikiId}/comment/{commentId}/g-vote?eventSource=PostDetailView", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
+        if userId: response = self.request("DELETE", f"/g/s/user-profile/{userId}/comment/{commentId}/g-vote?eventSource=UserProfileView")
+        elif blogId: response = self.request("DELETE", f"/g/s/blog/{blogId}/comment/{commentId}/g-vote?eventSource=PostDetailView")
+        elif wikiId: response = self.request("DELETE", f"/g/s/item/{wikiId}/comment/{commentId}/g-vote?eventSource=PostDetailView")
         else: raise exceptions.SpecifyType
 
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        return response.status_code
 
     def get_membership_info(self):
         """
@@ -1814,9 +1867,8 @@ class Client(Callbacks, SocketHandler):
 
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
-        response = requests.get(f"{self.api}/g/s/membership?force=true", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.Membership(json.loads(response.text)).Membership
+        response = self.request("GET", "/g/s/membership?force=true")
+        return objects.Membership(json.loads(response.text)).Membership
 
     def get_ta_announcements(self, language: str = "en", start: int = 0, size: int = 25):
         """
@@ -1834,9 +1886,8 @@ class Client(Callbacks, SocketHandler):
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
         if language not in self.get_supported_languages(): raise exceptions.UnsupportedLanguage(language)
-        response = requests.get(f"{self.api}/g/s/announcement?language={language}&start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.BlogList(json.loads(response.text)["blogList"]).BlogList
+        response = self.request("GET", f"/g/s/announcement?language={language}&start={start}&size={size}")
+        return objects.BlogList(json.loads(response.text)["blogList"]).BlogList
 
     def get_wallet_info(self):
         """
@@ -1850,9 +1901,8 @@ class Client(Callbacks, SocketHandler):
 
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
-        response = requests.get(f"{self.api}/g/s/wallet", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.WalletInfo(json.loads(response.text)["wallet"]).WalletInfo
+        response = self.request("GET", "/g/s/wallet")
+        return objects.WalletInfo(json.loads(response.text)["wallet"]).WalletInfo
 
     def get_wallet_history(self, start: int = 0, size: int = 25):
         """
@@ -1867,9 +1917,8 @@ class Client(Callbacks, SocketHandler):
 
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
-        response = requests.get(f"{self.api}/g/s/wallet/coin/history?start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.WalletHistory(json.loads(response.text)["coinHistoryList"]).WalletHistory
+        response = self.request("GET", f"/g/s/wallet/coin/history?start={start}&size={size}")
+        return objects.WalletHistory(json.loads(response.text)["coinHistoryList"]).WalletHistory
 
     def get_from_deviceid(self, deviceId: str):
         """
@@ -1883,9 +1932,8 @@ class Client(Callbacks, SocketHandler):
 
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
-        response = requests.get(f"{self.api}/g/s/auid?deviceId={deviceId}")
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return json.loads(response.text)["auid"]
+        response = self.request("GET", f"/g/s/auid?deviceId={deviceId}")
+        return json.loads(response.text)["auid"]
 
     def get_from_code(self, code: str):
         """
@@ -1900,9 +1948,8 @@ class Client(Callbacks, SocketHandler):
 
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
-        response = requests.get(f"{self.api}/g/s/link-resolution?q={code}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.FromCode(json.loads(response.text)["linkInfoV2"]).FromCode
+        response = self.request("GET", f"/g/s/link-resolution?q={code}")
+        return objects.FromCode(json.loads(response.text)["linkInfoV2"]).FromCode
 
     def get_from_id(self, objectId: str, objectType: int, comId: str = None):
         """
@@ -1925,10 +1972,9 @@ class Client(Callbacks, SocketHandler):
             "timestamp": int(timestamp() * 1000)
         })
 
-        if comId: response = requests.post(f"{self.api}/g/s-x{comId}/link-resolution", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        else: response = requests.post(f"{self.api}/g/s/link-resolution", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.FromCode(json.loads(response.text)["linkInfoV2"]).FromCode
+        if comId: response = self.request("POST", f"/g/s-x{comId}/link-resolution", data=data)
+        else: response = self.request("POST", "/g/s/link-resolution", data=data)
+        return objects.FromCode(json.loads(response.text)["linkInfoV2"]).FromCode
 
     def get_supported_languages(self):
         """
@@ -1942,9 +1988,8 @@ class Client(Callbacks, SocketHandler):
 
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
-        response = requests.get(f"{self.api}/g/s/community-collection/supported-languages?start=0&size=100", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return json.loads(response.text)["supportedLanguages"]
+        response = self.request("GET", "/g/s/community-collection/supported-languages?start=0&size=100")
+        return json.loads(response.text)["supportedLanguages"]
 
     def claim_new_user_coupon(self):
         """
@@ -1958,9 +2003,8 @@ class Client(Callbacks, SocketHandler):
 
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
-        response = requests.post(f"{self.api}/g/s/coupon/new-user-coupon/claim", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", "/g/s/coupon/new-user-coupon/claim")
+        return response.status_code
 
     def get_subscriptions(self, start: int = 0, size: int = 25):
         """
@@ -1975,9 +2019,8 @@ class Client(Callbacks, SocketHandler):
 
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
-        response = requests.get(f"{self.api}/g/s/store/subscription?objectType=122&start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return json.loads(response.text)["storeSubscriptionItemList"]
+        response = self.request("GET", f"/g/s/store/subscription?objectType=122&start={start}&size={size}")
+        return json.loads(response.text)["storeSubscriptionItemList"]
 
     def get_all_users(self, start: int = 0, size: int = 25):
         """
@@ -1992,23 +2035,21 @@ class Client(Callbacks, SocketHandler):
 
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
-        response = requests.get(f"{self.api}/g/s/user-profile?type=recent&start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.UserProfileCountList(json.loads(response.text)).UserProfileCountList
+        response = self.request("GET", f"/g/s/user-profile?type=recent&start={start}&size={size}")
+        return objects.UserProfileCountList(json.loads(response.text)).UserProfileCountList
 
     def accept_host(self, chatId: str, requestId: str):
         data = json.dumps({})
 
-        response = requests.post(f"{self.api}/g/s/chat/thread/{chatId}/transfer-organizer/{requestId}/accept", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/g/s/chat/thread/{chatId}/transfer-organizer/{requestId}/accept", data=data)
+        return response.status_code
 
     def accept_organizer(self, chatId: str, requestId: str):
         self.accept_host(chatId, requestId)
 
     # Contributed by 'https://github.com/LynxN1'
     def link_identify(self, code: str):
-        response = requests.get(f"{self.api}/g/s/community/link-identify?q=http%3A%2F%2Faminoapps.com%2Finvite%2F{code}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
+        response = self.request("GET", f"/g/s/community/link-identify?q=http%3A%2F%2Faminoapps.com%2Finvite%2F{code}")
         return json.loads(response.text)
 
     def invite_to_vc(self, chatId: str, userId: str):
@@ -2029,9 +2070,8 @@ class Client(Callbacks, SocketHandler):
             "uid": userId
         })
 
-        response = requests.post(f"{self.api}/g/s/chat/thread/{chatId}/vvchat-presenter/invite", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/g/s/chat/thread/{chatId}/vvchat-presenter/invite", data=data)
+        return response.status_code
 
     def wallet_config(self, level: int):
         """
@@ -2052,11 +2092,9 @@ class Client(Callbacks, SocketHandler):
             "timestamp": int(timestamp() * 1000)
         })
 
-        response = requests.post(f"{self.api}/g/s/wallet/ads/config", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", "/g/s/wallet/ads/config", data=data)
+        return response.status_code
 
     def get_avatar_frames(self, start: int = 0, size: int = 25):
-        response = requests.get(f"{self.api}/g/s/avatar-frame?start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.AvatarFrameList(json.loads(response.text)["avatarFrameList"]).AvatarFrameList
+        response = self.request("GET", f"/g/s/avatar-frame?start={start}&size={size}")
+        return objects.AvatarFrameList(json.loads(response.text)["avatarFrameList"]).AvatarFrameList
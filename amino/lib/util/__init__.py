@@ -2,4 +2,8 @@ from .exceptions import *
 from .helpers import *
 from .objects import *
 from .headers import *
-from .device import *
\ No newline at end of file
+from .device import *
+from .middleware import *
+from .pagination import *
+from .dispatch import *
+from .columnar import *
\ No newline at end of file
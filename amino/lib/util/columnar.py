@@ -0,0 +1,73 @@
+import json
+from importlib import import_module
+
+# numpy and pyarrow are optional, they are only imported by the exports needing them.
+
+__all__ = ["arrow_array", "numpy_array", "to_arrow", "to_numpy"]
+
+
+def require(name: str):
+    try: return import_module(name)
+    except ImportError as error: raise ImportError(f"{name} is needed for this export, install it with : pip install {name}") from error
+
+def select(schema, fields: list = None):
+    return schema if fields is None else schema.select(fields)
+
+def arrow_array(values: list):
+    """
+    Arrow array of ``values``, holding the json text of each value when Arrow can not give them a single type.
+    """
+    pyarrow = require("pyarrow")
+
+    try: return pyarrow.array(values)
+    except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError, pyarrow.ArrowNotImplementedError, OverflowError):
+        return pyarrow.array([None if value is None else json.dumps(value) for value in values], pyarrow.string())
+
+def numpy_array(values: list):
+    """
+    NumPy array of ``values`` : int64 for integers, float64 for numbers with missing ones as NaN, bool for booleans and object for the rest.
+    """
+    numpy = require("numpy")
+    kinds = set(map(type, values))
+    missing = type(None) in kinds
+    kinds.discard(type(None))
+
+    try:
+        if kinds == {bool} and not missing: return numpy.fromiter(values, bool, len(values))
+        if kinds and kinds <= {int, float}:
+            if missing or float in kinds: return numpy.fromiter((numpy.nan if value is None else value for value in values), numpy.float64, len(values))
+            return numpy.fromiter(values, numpy.int64, len(values))
+
+    except OverflowError: pass
+    return numpy.fromiter(values, object, len(values))
+
+def to_arrow(data: list, schema, fields: list = None):
+    """
+    Arrow table of the fields of every item of ``data``, read from their json without building a list object.
+
+    **Parameters**
+        - **data** : List of the json of each item, like the ``json`` of a :meth:`MessageList <amino.lib.util.objects.MessageList>`.
+        - **schema** : :meth:`Schema <amino.lib.util.objects.Schema>` of the items, like ``objects.Message.schema``.
+        - *fields* : Names of the fields to export, all of them by default.
+
+    **Returns**
+        - **Success** : ``pyarrow.Table`` with a column per field. Columns without a single Arrow type hold the json text of their values.
+    """
+    pyarrow = require("pyarrow")
+    columns = select(schema, fields).columns(data)
+    return pyarrow.table({name: arrow_array(values) for name, values in columns.items()})
+
+def to_numpy(data: list, schema, fields: list = None) -> dict:
+    """
+    NumPy arrays of the fields of every item of ``data``, read from their json without building a list object.
+
+    **Parameters**
+        - **data** : List of the json of each item, like the ``json`` of a :meth:`MessageList <amino.lib.util.objects.MessageList>`.
+        - **schema** : :meth:`Schema <amino.lib.util.objects.Schema>` of the items, like ``objects.Message.schema``.
+        - *fields* : Names of the fields to export, all of them by default.
+
+    **Returns**
+        - **Success** : Dict of ``numpy.ndarray`` by field, see :func:`numpy_array`.
+    """
+    columns = select(schema, fields).columns(data)
+    return {name: numpy_array(values) for name, values in columns.items()}
@@ -1,32 +1,35 @@
 import json
 from .helpers import generate_device_info
 
-class DeviceGenerator:
-    def __init__(self, deviceId = None):
-        try:
-            with open("device.json", "r") as stream:
-                data = json.load(stream)
-                self.user_agent = data["user_agent"]
+cache = {}
+
+def load_device_info(path: str = "device.json") -> dict:
+    """
+    Read the device info from ``path``, generating it if missing or broken.
+    The file is only read once, later calls return the copy kept in memory.
+    """
+    if path in cache: return cache[path]
 
-                if deviceId:
-                    self.device_id = deviceId
-                else:
-                    self.device_id = data["device_id"]
+    try:
+        with open(path, "r") as stream:
+            data = json.load(stream)
 
-                self.device_id_sig = data["device_id_sig"]
+    except (FileNotFoundError, json.decoder.JSONDecodeError):
+        data = generate_device_info()
+        with open(path, "w") as stream:
+            json.dump(data, stream, indent=4)
 
-        except (FileNotFoundError, json.decoder.JSONDecodeError):
-            device = generate_device_info()
-            with open("device.json", "w") as stream:
-                json.dump(device, stream, indent=4)
+    cache[path] = data
+    return data
 
-            with open("device.json", "r") as stream:
-                data = json.load(stream)
-                self.user_agent = data["user_agent"]
+class DeviceGenerator:
+    def __init__(self, deviceId = None):
+        data = load_device_info()
+        self.user_agent = data["user_agent"]
 
-                if deviceId:
-                    self.device_id = deviceId
-                else:
-                    self.device_id = data["device_id"]
+        if deviceId:
+            self.device_id = deviceId
+        else:
+            self.device_id = data["device_id"]
 
-                self.device_id_sig = data["device_id_sig"]
+        self.device_id_sig = data["device_id_sig"]
@@ -0,0 +1,463 @@
+import re
+import inspect
+import threading
+import traceback
+
+from itertools import count
+from collections import deque, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+# asyncio is imported inside AsyncDispatcher and AsyncFrameQueue, so importing the library for the sync Client does not load it.
+
+__all__ = ["chat_key", "handler_loop", "schedule", "run_blocking", "ThreadDispatcher", "AsyncDispatcher", "FrameBuffer", "FrameQueue", "AsyncFrameQueue"]
+
+thread_id = re.compile(r'"threadId"\s*:\s*"([^"]*)"')
+
+
+def chat_key(data):
+    """
+    Key events are ordered by: ``(comId, chatId)`` of an :class:`Event <amino.lib.util.objects.Event>`, ``None`` for other events.
+    """
+    message = getattr(data, "message", None)
+    if message is None: return None
+    return getattr(data, "comId", None), getattr(message, "chatId", None)
+
+
+def report(error: Exception):
+    traceback.print_exception(type(error), error, error.__traceback__)
+
+
+coroutine_loop = None
+coroutine_lock = threading.Lock()
+running = set()
+
+
+def handler_loop():
+    """
+    Event loop running the coroutine handlers of the sync clients, on a thread shared by every client and started on first use.
+    """
+    global coroutine_loop
+    import asyncio
+
+    with coroutine_lock:
+        if coroutine_loop is None:
+            coroutine_loop = asyncio.new_event_loop()
+            threading.Thread(target=coroutine_loop.run_forever, name="amino-handlers", daemon=True).start()
+
+        return coroutine_loop
+
+
+def reported(future):
+    if not future.cancelled() and future.exception() is not None: report(future.exception())
+
+
+def schedule(coroutine, report: bool = True):
+    """
+    Run the coroutine of a handler: as a task when called from a running event loop (asyncio clients), on :func:`handler_loop` otherwise.
+
+    **Parameters**
+        - **coroutine** : Coroutine of the handler.
+        - *report* : Print the traceback if it fails. ``False`` when the caller waits for its result and handles the error itself.
+
+    **Returns**
+        - **Success** : :class:`asyncio.Task` or :class:`concurrent.futures.Future` of the coroutine.
+    """
+    import asyncio
+
+    try: asyncio.get_running_loop()
+    except RuntimeError: future = asyncio.run_coroutine_threadsafe(coroutine, handler_loop())
+    else:
+        future = asyncio.ensure_future(coroutine)
+        running.add(future)
+        future.add_done_callback(running.discard)
+
+    if report: future.add_done_callback(reported)
+    return future
+
+
+async def run_blocking(function, *args, **kwargs):
+    """
+    Await a blocking function, like a method of the sync :meth:`Client <amino.client.Client>`, from a coroutine handler.
+    It runs on the default executor of the loop so the other handlers keep going.
+    """
+    import asyncio
+    from functools import partial
+
+    return await asyncio.get_running_loop().run_in_executor(None, partial(function, *args, **kwargs))
+
+
+class ThreadDispatcher:
+    """
+    Runs the event handlers on a thread pool instead of the socket thread.
+    Events with the same key (the same Chat) are handled one after another, in the order they were received, events of different Chats in parallel.
+
+    **Parameters**
+        - *workers* : Number of threads running handlers.
+        - *maxPending* : Maximum number of events waiting to be handled. The socket thread waits when it is reached.
+        - *onError* : Function called with the exceptions raised by handlers, the traceback is printed by default.
+        - *onRelease* : Function called on the worker thread each time an event is handled and its slot released, for callers waiting on another thread or loop.
+    """
+    def __init__(self, workers: int = 4, maxPending: int = 1000, onError = None, onRelease = None):
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="amino-dispatch")
+        self.slots = threading.BoundedSemaphore(maxPending)
+        self.onError = onError if onError is not None else report
+        self.onRelease = onRelease
+        self.queues = {}
+        self.lock = threading.Lock()
+        self.dispatched = 0
+        self.failed = 0
+
+    def submit(self, key, function, *args):
+        """
+        Queue ``function(*args)`` behind the other jobs of ``key``.
+        """
+        self.slots.acquire()
+        self.enqueue(key, function, args)
+
+    def enqueue(self, key, function, args: tuple):
+        """
+        :meth:`submit` for a caller that already took one of the ``slots``.
+        """
+        with self.lock:
+            queue = self.queues.get(key)
+            if queue is not None:
+                queue.append((function, args))
+                return
+
+            self.queues[key] = deque([(function, args)])
+
+        self.executor.submit(self.drain, key)
+
+    def drain(self, key):
+        while True:
+            with self.lock:
+                queue = self.queues[key]
+                if not queue:
+                    del self.queues[key]
+                    return
+                function, args = queue.popleft()
+
+            failed = False
+            try:
+                result = function(*args)
+                # A coroutine handler is waited for, the next event of its Chat comes after it.
+                if inspect.isawaitable(result): schedule(result, report=False).result()
+            except Exception as error:
+                failed = True
+                self.onError(error)
+            finally:
+                with self.lock:
+                    self.dispatched += 1
+                    self.failed += failed
+                self.slots.release()
+                if self.onRelease is not None: self.onRelease()
+
+    def pending(self):
+        with self.lock:
+            return sum(len(queue) for queue in self.queues.values())
+
+    def stats(self):
+        """
+        **Returns**
+            - **Success** : Dict with the number of ``pending`` events, of ``dispatched`` ones and of ``failed`` handlers.
+        """
+        return {"pending": self.pending(), "dispatched": self.dispatched, "failed": self.failed}
+
+    def close(self, wait: bool = True):
+        self.executor.shutdown(wait=wait)
+
+
+class AsyncDispatcher:
+    """
+    Runs the event handlers of the asyncio clients in tasks instead of the socket reader.
+    Events with the same key (the same Chat) are handled one after another, in the order they were received, events of different Chats concurrently.
+    Handlers returning an awaitable are awaited before the next event of their Chat.
+
+    **Parameters**
+        - *maxPending* : Maximum number of events waiting to be handled. The socket reader waits when it is reached.
+        - *onError* : Function called with the exceptions raised by handlers, the traceback is printed by default.
+    """
+    def __init__(self, maxPending: int = 1000, onError = None):
+        self.maxPending = maxPending
+        self.onError = onError if onError is not None else report
+        self.queues = {}
+        self.tasks = set()
+        self.count = 0
+        self.ready = None
+        self.dispatched = 0
+        self.failed = 0
+
+    def submit(self, key, function, *args):
+        """
+        Queue ``function(*args)`` behind the other jobs of ``key``. Must be called from the event loop.
+        """
+        import asyncio
+
+        self.count += 1
+        queue = self.queues.get(key)
+        if queue is not None:
+            queue.append((function, args))
+            return
+
+        self.queues[key] = deque([(function, args)])
+        task = asyncio.ensure_future(self.drain(key))
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    async def drain(self, key):
+        queue = self.queues[key]
+
+        while queue:
+            function, args = queue.popleft()
+
+            try:
+                result = function(*args)
+                if inspect.isawaitable(result): await result
+            except Exception as error:
+                self.failed += 1
+                self.onError(error)
+            finally:
+                self.dispatched += 1
+                self.count -= 1
+                if self.ready is not None and self.count < self.maxPending: self.ready.set()
+
+        del self.queues[key]
+
+    async def wait(self):
+        """
+        Wait until fewer than ``maxPending`` events are waiting.
+        """
+        import asyncio
+
+        while self.count >= self.maxPending:
+            if self.ready is None: self.ready = asyncio.Event()
+            self.ready.clear()
+            await self.ready.wait()
+
+    def pending(self):
+        return self.count
+
+    def stats(self):
+        """
+        **Returns**
+            - **Success** : Dict with the number of ``pending`` events, of ``dispatched`` ones and of ``failed`` handlers.
+        """
+        return {"pending": self.count, "dispatched": self.dispatched, "failed": self.failed}
+
+    async def close(self, wait: bool = True):
+        import asyncio
+
+        if wait and self.tasks: await asyncio.gather(*self.tasks, return_exceptions=True)
+        for task in self.tasks: task.cancel()
+
+
+class FrameBuffer:
+    """
+    Bounded buffer of raw socket frames between the socket reader and the handlers.
+
+    Message frames are handed out before the ``lowPriority`` ones (typing, presence...).
+    When the buffer is full, a message frame takes the place of the oldest low priority frame, otherwise ``policy`` applies:
+        - ``"block"`` : The reader waits for room.
+        - ``"drop_oldest"`` : The oldest frame is dropped, low priority ones first.
+        - ``"drop_newest"`` : The new frame is dropped.
+
+    With ``coalesce``, a low priority frame replaces the one of the same Chat still waiting and takes its turn, so only the latest typing state (start or end) is handled.
+    """
+    policies = ("block", "drop_oldest", "drop_newest")
+
+    def __init__(self, maxSize: int = 10000, policy: str = "block", coalesce: bool = True, lowPriority: tuple = (304, 306)):
+        if policy not in self.policies: raise ValueError(f"policy must be one of {self.policies}, not {policy!r}")
+
+        self.maxSize = maxSize
+        self.policy = policy
+        self.coalesce = coalesce
+        self.lowPriority = frozenset(lowPriority)
+        self.high = deque()
+        self.low = OrderedDict()
+        self.sequence = count()
+
+        self.enqueued = 0
+        self.processed = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.maxDepth = 0
+
+    def depth(self):
+        return len(self.high) + len(self.low)
+
+    def full(self):
+        return self.depth() >= self.maxSize
+
+    def must_wait(self, t):
+        return self.policy == "block" and self.full() and (t in self.lowPriority or not self.low)
+
+    def push(self, data, t = None):
+        """
+        Add a frame, ``t`` is its type if known.
+
+        **Returns**
+            - ``False`` if the frame was dropped, ``True`` otherwise.
+        """
+        low = t in self.lowPriority
+        key = next(self.sequence)
+
+        if low and self.coalesce:
+            match = thread_id.search(data)
+            if match is not None:
+                key = match.group(1)
+                if key in self.low:
+                    self.low[key] = data
+                    self.low.move_to_end(key)
+                    self.coalesced += 1
+                    return True
+
+        if self.full():
+            if not low and self.low: self.low.popitem(last=False)
+            elif self.policy == "drop_newest" or (low and not self.low):
+                self.dropped += 1
+                return False
+            elif self.low: self.low.popitem(last=False)
+            else: self.high.popleft()
+            self.dropped += 1
+
+        if low: self.low[key] = data
+        else: self.high.append(data)
+
+        self.enqueued += 1
+        self.maxDepth = max(self.maxDepth, self.depth())
+        return True
+
+    def pop(self):
+        if self.high: return self.high.popleft()
+        return self.low.popitem(last=False)[1]
+
+    def stats(self):
+        """
+        **Returns**
+            - **Success** : Dict with the current ``depth`` (and its ``high`` and ``low`` priority parts), the ``maxDepth`` reached, and the number of frames ``enqueued``, ``processed``, ``dropped`` and ``coalesced``.
+        """
+        return {
+            "depth": self.depth(),
+            "high": len(self.high),
+            "low": len(self.low),
+            "maxDepth": self.maxDepth,
+            "enqueued": self.enqueued,
+            "processed": self.processed,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced
+        }
+
+
+class FrameQueue(FrameBuffer):
+    """
+    :class:`FrameBuffer` of the sync :meth:`SocketHandler <amino.socket.SocketHandler>`, its frames are handled by a thread of their own.
+    """
+    def __init__(self, maxSize: int = 10000, policy: str = "block", coalesce: bool = True, lowPriority: tuple = (304, 306)):
+        FrameBuffer.__init__(self, maxSize, policy, coalesce, lowPriority)
+        self.condition = threading.Condition()
+        self.closed = False
+
+    def put(self, data, t = None):
+        with self.condition:
+            while self.must_wait(t) and not self.closed: self.condition.wait()
+            accepted = self.push(data, t)
+            self.condition.notify_all()
+            return accepted
+
+    def get(self):
+        """
+        **Returns**
+            - **Success** : The next frame, None once the queue is closed and empty.
+        """
+        with self.condition:
+            while not self.depth():
+                if self.closed: return None
+                self.condition.wait()
+
+            data = self.pop()
+            self.condition.notify_all()
+            return data
+
+    def run(self, handler):
+        """
+        Pass every frame to ``handler`` until the queue is closed.
+        """
+        while True:
+            data = self.get()
+            if data is None: return
+
+            try: handler(data)
+            except Exception as error: report(error)
+            self.processed += 1
+
+    def open(self):
+        with self.condition:
+            self.closed = False
+
+    def close(self):
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+
+
+class AsyncFrameQueue(FrameBuffer):
+    """
+    :class:`FrameBuffer` of the :meth:`AsyncSocketHandler <amino.async_socket.AsyncSocketHandler>`, its frames are handled by a task of their own.
+    """
+    def __init__(self, maxSize: int = 10000, policy: str = "block", coalesce: bool = True, lowPriority: tuple = (304, 306)):
+        FrameBuffer.__init__(self, maxSize, policy, coalesce, lowPriority)
+        self.condition = None
+        self.closed = False
+
+    def get_condition(self):
+        import asyncio
+
+        if self.condition is None: self.condition = asyncio.Condition()
+        return self.condition
+
+    async def put(self, data, t = None):
+        condition = self.get_condition()
+
+        async with condition:
+            while self.must_wait(t) and not self.closed: await condition.wait()
+            accepted = self.push(data, t)
+            condition.notify_all()
+            return accepted
+
+    async def get(self):
+        """
+        **Returns**
+            - **Success** : The next frame, None once the queue is closed and empty.
+        """
+        condition = self.get_condition()
+
+        async with condition:
+            while not self.depth():
+                if self.closed: return None
+                await condition.wait()
+
+            data = self.pop()
+            condition.notify_all()
+            return data
+
+    async def run(self, handler):
+        """
+        Pass every frame to the coroutine function ``handler`` until the queue is closed.
+        """
+        while True:
+            data = await self.get()
+            if data is None: return
+
+            try: await handler(data)
+            except Exception as error: report(error)
+            self.processed += 1
+
+    def open(self):
+        self.closed = False
+
+    async def close(self):
+        condition = self.get_condition()
+
+        async with condition:
+            self.closed = True
+            condition.notify_all()
@@ -2,26 +2,33 @@ from amino.lib.util import device
 
 sid = None
 
-class Headers:
-    def __init__(self, data = None, type = None, deviceId: str = None, sig: str = None):
-        if deviceId:
-            dev = device.DeviceGenerator(deviceId=deviceId)
-        else:
-            dev = device.DeviceGenerator()
+def static_headers(deviceId: str, deviceIdSig: str, userAgent: str) -> dict:
+    """
+    Headers that stay the same for every request of a device, build them once and pass them to :func:`request_headers`.
+    """
+    return {
+        "NDCDEVICEID": deviceId,
+        "NDC-MSG-SIG": deviceIdSig,
+        "Accept-Language": "en-US",
+        "Content-Type": "application/json; charset=utf-8",
+        "User-Agent": userAgent,
+        "Host": "service.narvii.com",
+        "Accept-Encoding": "gzip",
+        "Connection": "Keep-Alive"
+    }
 
-        headers = {
-            "NDCDEVICEID": dev.device_id,
-            "NDC-MSG-SIG": dev.device_id_sig,
-            "Accept-Language": "en-US",
-            "Content-Type": "application/json; charset=utf-8",
-            "User-Agent": dev.user_agent,
-            "Host": "service.narvii.com",
-            "Accept-Encoding": "gzip",
-            "Connection": "Keep-Alive"
-        }
+def request_headers(static: dict, data = None, type: str = None, sig: str = None, sid: str = None) -> dict:
+    """
+    Copy of ``static`` with the parts that change on every request.
+    """
+    headers = static.copy()
+    if data: headers["Content-Length"] = str(len(data))
+    if sid: headers["NDCAUTH"] = f"sid={sid}"
+    if type: headers["Content-Type"] = type
+    if sig: headers["NDC-MSG-SIG"] = sig
+    return headers
 
-        if data: headers["Content-Length"] = str(len(data))
-        if sid: headers["NDCAUTH"] = f"sid={sid}"
-        if type: headers["Content-Type"] = type
-        if sig: headers["NDC-MSG-SIG"] = sig
-        self.headers = headers
+class Headers:
+    def __init__(self, data = None, type = None, deviceId: str = None, sig: str = None):
+        dev = device.DeviceGenerator(deviceId=deviceId)
+        self.headers = request_headers(static_headers(dev.device_id, dev.device_id_sig, dev.user_agent), data=data, type=type, sig=sig, sid=sid)
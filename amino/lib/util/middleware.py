@@ -0,0 +1,424 @@
+import re
+import time
+import threading
+
+from functools import partial
+from collections import OrderedDict
+
+# asyncio and aiohttp are imported inside the async handlers, so importing the library for the sync Client does not load them.
+
+__all__ = ["Request", "Response", "Middleware", "build_chain", "build_async_chain", "TimingMiddleware", "RetryMiddleware", "RateLimitMiddleware", "TracingMiddleware", "CacheMiddleware", "SingleFlightMiddleware"]
+
+
+class Request:
+    def __init__(self, method: str, url: str, headers: dict = None, data = None, **kwargs):
+        self.method = method
+        self.url = url
+        self.headers = headers
+        self.data = data
+        self.kwargs = kwargs
+
+
+class Response:
+    """
+    Fully read response of the asyncio clients, exposing the same attributes as :class:`requests.Response`.
+    """
+    def __init__(self, status_code: int, content: bytes, headers: dict = None, url: str = None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers
+        self.url = url
+
+    @property
+    def text(self):
+        return self.content.decode("utf-8", errors="replace")
+
+
+class Middleware:
+    """
+    Base of the request middlewares.
+
+    A middleware receives the :class:`Request` and ``call_next``, the rest of the chain, and returns the response.
+    Override :meth:`handle` for :meth:`Client <amino.client.Client>` and :meth:`handle_async` for :meth:`AsyncClient <amino.async_client.AsyncClient>`.
+    """
+    def handle(self, request: Request, call_next):
+        return call_next(request)
+
+    async def handle_async(self, request: Request, call_next):
+        return await call_next(request)
+
+
+def build_chain(middlewares: list, send):
+    handler = send
+    for middleware in reversed(middlewares):
+        handler = partial(middleware.handle, call_next=handler)
+    return handler
+
+
+def build_async_chain(middlewares: list, send):
+    handler = send
+    for middleware in reversed(middlewares):
+        handler = partial(middleware.handle_async, call_next=handler)
+    return handler
+
+
+class TimingMiddleware(Middleware):
+    """
+    Records how many requests were made to each endpoint and how long they took.
+    """
+    def __init__(self):
+        self.stats = {}
+        self.lock = threading.Lock()
+
+    def record(self, request: Request, elapsed: float):
+        key = f"{request.method} {request.url.split('?')[0]}"
+
+        with self.lock:
+            count, total, longest = self.stats.get(key, (0, 0.0, 0.0))
+            self.stats[key] = (count + 1, total + elapsed, max(longest, elapsed))
+
+    def summary(self):
+        """
+        **Returns**
+            - **Success** : Dict of ``"METHOD url"`` to its ``count``, ``total``, ``average`` and ``max`` time in seconds.
+        """
+        with self.lock:
+            return {key: {"count": count, "total": total, "average": total / count, "max": longest} for key, (count, total, longest) in self.stats.items()}
+
+    def reset(self):
+        with self.lock:
+            self.stats.clear()
+
+    def handle(self, request: Request, call_next):
+        start = time.perf_counter()
+        try: return call_next(request)
+        finally: self.record(request, time.perf_counter() - start)
+
+    async def handle_async(self, request: Request, call_next):
+        start = time.perf_counter()
+        try: return await call_next(request)
+        finally: self.record(request, time.perf_counter() - start)
+
+
+class RetryMiddleware(Middleware):
+    """
+    Retries requests that failed to connect or got a server error, waiting ``backoff * 2 ** attempt`` seconds between tries.
+
+    **Parameters**
+        - *retries* : Maximum number of retries.
+        - *backoff* : Base delay in seconds.
+        - *statuses* : Status codes to retry.
+        - *errors* : Exceptions to retry, connection errors and timeouts by default.
+        - *methods* : Methods that are safe to send again.
+    """
+    def __init__(self, retries: int = 3, backoff: float = 0.5, statuses: tuple = (500, 502, 503, 504), errors: tuple = None, methods: tuple = ("GET", "DELETE")):
+        self.retries = retries
+        self.backoff = backoff
+        self.statuses = statuses
+        self.errors = errors
+        self.methods = methods
+
+    def handle(self, request: Request, call_next):
+        if request.method not in self.methods: return call_next(request)
+        errors = self.errors or (OSError,)
+
+        for attempt in range(self.retries + 1):
+            try:
+                response = call_next(request)
+                if response.status_code not in self.statuses or attempt == self.retries: return response
+            except errors:
+                if attempt == self.retries: raise
+
+            time.sleep(self.backoff * 2 ** attempt)
+
+    async def handle_async(self, request: Request, call_next):
+        import asyncio
+
+        if request.method not in self.methods: return await call_next(request)
+        errors = self.errors
+
+        if errors is None:
+            from aiohttp import ClientConnectionError
+            errors = (OSError, asyncio.TimeoutError, ClientConnectionError)
+
+        for attempt in range(self.retries + 1):
+            try:
+                response = await call_next(request)
+                if response.status_code not in self.statuses or attempt == self.retries: return response
+            except errors:
+                if attempt == self.retries: raise
+
+            await asyncio.sleep(self.backoff * 2 ** attempt)
+
+
+class RateLimitMiddleware(Middleware):
+    """
+    Token bucket limiting the client to ``rate`` requests per second, with bursts of up to ``burst`` requests.
+    """
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate) - 1
+            self.updated = now
+            if self.tokens < 0: return -self.tokens / self.rate
+            else: return 0
+
+    def handle(self, request: Request, call_next):
+        delay = self.reserve()
+        if delay: time.sleep(delay)
+        return call_next(request)
+
+    async def handle_async(self, request: Request, call_next):
+        import asyncio
+
+        delay = self.reserve()
+        if delay: await asyncio.sleep(delay)
+        return await call_next(request)
+
+
+class TracingMiddleware(Middleware):
+    """
+    Reports every request, its status and its duration to ``callback``, ``print`` by default.
+    """
+    def __init__(self, callback = print):
+        self.callback = callback
+
+    def trace(self, request: Request, start: float, response = None, error: Exception = None):
+        elapsed = (time.perf_counter() - start) * 1000
+        if error is not None: self.callback(f"[request] {request.method} {request.url} failed after {elapsed:.1f}ms : {error!r}")
+        else: self.callback(f"[request] {request.method} {request.url} -> {response.status_code} in {elapsed:.1f}ms")
+
+    def handle(self, request: Request, call_next):
+        start = time.perf_counter()
+        try: response = call_next(request)
+        except Exception as error:
+            self.trace(request, start, error=error)
+            raise
+
+        self.trace(request, start, response)
+        return response
+
+    async def handle_async(self, request: Request, call_next):
+        start = time.perf_counter()
+        try: response = await call_next(request)
+        except Exception as error:
+            self.trace(request, start, error=error)
+            raise
+
+        self.trace(request, start, response)
+        return response
+
+
+class CacheMiddleware(Middleware):
+    """
+    Caches the responses of read-mostly GET endpoints in memory, each for its own time to live.
+    The least recently used responses are dropped once there are more than ``maxEntries`` or ``maxBytes``.
+
+    **Parameters**
+        - *ttls* : Dict of endpoint name to time to live in seconds, merged over :attr:`TTLS`. Use 0 to stop caching an endpoint.
+        - *maxEntries* : Maximum number of cached responses.
+        - *maxBytes* : Maximum total size of the cached bodies.
+    """
+    ENDPOINTS = {
+        "get_user_info": re.compile(r"/(g|x[^/]+)/s/user-profile/[^/?]+$"),
+        "get_community_info": re.compile(r"/g/s-x[^/]+/community/info\?"),
+        "get_chat_thread": re.compile(r"/(g|x[^/]+)/s/chat/thread/[^/?]+$"),
+        "get_sticker_pack_info": re.compile(r"/x[^/]+/s/sticker-collection/[^/?]+\?includeStickers=true$"),
+        "get_supported_languages": re.compile(r"/g/s/community-collection/supported-languages\?"),
+        "search_community": re.compile(r"/g/s/search/amino-id-and-link\?")
+    }
+
+    TTLS = {
+        "get_user_info": 60,
+        "get_community_info": 300,
+        "get_chat_thread": 30,
+        "get_sticker_pack_info": 3600,
+        "get_supported_languages": 86400,
+        "search_community": 300
+    }
+
+    def __init__(self, ttls: dict = None, maxEntries: int = 1024, maxBytes: int = 16 * 1024 * 1024):
+        self.ttls = {**self.TTLS, **(ttls or {})}
+        self.maxEntries = maxEntries
+        self.maxBytes = maxBytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+    def endpoint(self, request: Request):
+        if request.method != "GET": return None
+
+        for name, pattern in self.ENDPOINTS.items():
+            if self.ttls.get(name) and pattern.search(request.url): return name
+
+    def key(self, request: Request):
+        return request.url, (request.headers or {}).get("NDCAUTH")
+
+    def get(self, request: Request):
+        key = self.key(request)
+
+        with self.lock:
+            entry = self.entries.get(key)
+
+            if entry is not None and entry[0] > time.monotonic():
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry[2]
+
+            if entry is not None: self.remove(key)
+            self.misses += 1
+
+    def put(self, request: Request, endpoint: str, response):
+        if response.status_code != 200: return
+        size = len(response.content)
+        if size > self.maxBytes: return
+        key = self.key(request)
+
+        with self.lock:
+            if key in self.entries: self.remove(key)
+            self.entries[key] = (time.monotonic() + self.ttls[endpoint], size, response, endpoint)
+            self.size += size
+
+            while len(self.entries) > self.maxEntries or self.size > self.maxBytes:
+                self.remove(next(iter(self.entries)))
+                self.evictions += 1
+
+    def remove(self, key):
+        self.size -= self.entries.pop(key)[1]
+
+    def invalidate(self, endpoint: str = None, contains: str = None):
+        """
+        Drop cached responses.
+
+        **Parameters**
+            - *endpoint* : Only drop the responses of this endpoint, like ``"get_user_info"``.
+            - *contains* : Only drop the responses whose url contains this text, like an userId.
+
+        **Returns**
+            - **Success** : Number of responses dropped.
+        """
+        with self.lock:
+            keys = [key for key, entry in self.entries.items() if (endpoint is None or entry[3] == endpoint) and (contains is None or contains in key[0])]
+            for key in keys: self.remove(key)
+            return len(keys)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+
+    def summary(self):
+        """
+        **Returns**
+            - **Success** : Dict with the ``hits``, ``misses``, ``evictions``, ``entries`` and ``bytes`` of the cache.
+        """
+        with self.lock:
+            return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "entries": len(self.entries), "bytes": self.size}
+
+    def handle(self, request: Request, call_next):
+        endpoint = self.endpoint(request)
+        if endpoint is None: return call_next(request)
+
+        response = self.get(request)
+        if response is not None: return response
+
+        response = call_next(request)
+        self.put(request, endpoint, response)
+        return response
+
+    async def handle_async(self, request: Request, call_next):
+        endpoint = self.endpoint(request)
+        if endpoint is None: return await call_next(request)
+
+        response = self.get(request)
+        if response is not None: return response
+
+        response = await call_next(request)
+        self.put(request, endpoint, response)
+        return response
+
+
+class Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.response = None
+        self.error = None
+
+
+class SingleFlightMiddleware(Middleware):
+    """
+    Shares one request between identical GETs sent at the same time, every caller gets the response of the first one.
+    Place it after a :class:`CacheMiddleware` so only cache misses are coalesced.
+    """
+    def __init__(self):
+        self.flights = {}
+        self.tasks = {}
+        self.requests = 0
+        self.collapsed = 0
+        self.lock = threading.Lock()
+
+    def key(self, request: Request):
+        return request.url, (request.headers or {}).get("NDCAUTH")
+
+    def summary(self):
+        """
+        **Returns**
+            - **Success** : Dict with the number of ``requests`` sent and of the ``collapsed`` ones that waited for them.
+        """
+        with self.lock:
+            return {"requests": self.requests, "collapsed": self.collapsed, "in_flight": len(self.flights) + len(self.tasks)}
+
+    def handle(self, request: Request, call_next):
+        if request.method != "GET": return call_next(request)
+        key = self.key(request)
+
+        with self.lock:
+            flight = self.flights.get(key)
+            leader = flight is None
+
+            if leader:
+                flight = self.flights[key] = Flight()
+                self.requests += 1
+            else: self.collapsed += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None: raise flight.error
+            return flight.response
+
+        try:
+            flight.response = call_next(request)
+            return flight.response
+        except BaseException as error:
+            flight.error = error
+            raise
+        finally:
+            with self.lock: del self.flights[key]
+            flight.done.set()
+
+    async def handle_async(self, request: Request, call_next):
+        import asyncio
+
+        if request.method != "GET": return await call_next(request)
+        key = self.key(request)
+
+        with self.lock:
+            task = self.tasks.get(key)
+
+            if task is None:
+                task = self.tasks[key] = asyncio.ensure_future(call_next(request))
+                task.add_done_callback(lambda task: self.tasks.pop(key, None))
+                self.requests += 1
+            else: self.collapsed += 1
+
+        return await asyncio.shield(task)
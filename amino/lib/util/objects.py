@@ -1,17 +1,335 @@
 # You don't even know how long this shit took...
 # F*ck you Sand for making me do this.
 
+import weakref
+
 class Objects:
     class Users:
         team_amino = "000000000-0000-0000-0000-000000000000"
         news_feed = "000000000-0000-0000-0000-000000000001"
 
-class UserProfile:
+def field(*keys):
+    """
+    Extractor of the value at ``keys`` in a json.
+    """
+    def extract(data):
+        for key in keys: data = data[key]
+        return data
+
+    extract.keys = keys
+    return extract
+
+def nested(cls, *keys):
+    """
+    Extractor of the ``cls`` object parsed from the value at ``keys`` in a json, an empty one if there is none.
+    """
+    def extract(data):
+        try:
+            for key in keys: data = data[key]
+        except (KeyError, TypeError): return cls([])
+
+        value = cls(data)
+        return getattr(value, cls.__name__, value)
+
+    return extract
+
+def column(data, *keys) -> list:
+    """
+    Values at ``keys`` in every item of ``data``, None when there is none.
+    """
+    extract, values = field(*keys), []
+
+    for item in data:
+        try: values.append(extract(item))
+        except (KeyError, TypeError): values.append(None)
+
+    return values
+
+def nested_column(cls, data, *keys) -> list:
+    """
+    ``cls`` objects parsed from the values at ``keys`` in every item of ``data``, None when there is none.
+    """
+    extract, values = field(*keys), []
+
+    for item in data:
+        try: values.append(getattr(cls(extract(item)), cls.__name__))
+        except (KeyError, TypeError): values.append(None)
+
+    return values
+
+class lazy:
+    """
+    Attribute built by the decorated method on first access, then kept as a plain attribute of the object.
+    Unlike ``functools.cached_property`` it takes no lock, two threads reading it at once may both build it.
+    """
+    def __init__(self, build):
+        self.build = build
+        self.name = build.__name__
+        self.__doc__ = build.__doc__
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, cls=None):
+        if obj is None: return self
+
+        value = obj.__dict__[self.name] = self.build(obj)
+        return value
+
+profileCache = None
+
+def cache_profiles(enabled: bool = True):
+    """
+    Share one :class:`UserProfile` per user between the objects built from every response, like the authors of the messages of a chat history.
+    A profile is kept while an object holds it, later ones of the same user reuse it instead of reading their json.
+
+    **Parameters**
+        - *enabled* : Start or stop sharing them.
+    """
+    global profileCache
+    profileCache = weakref.WeakValueDictionary() if enabled else None
+
+def profile(data) -> "UserProfile":
+    """
+    :class:`UserProfile` of ``data``, the one already built for this user when :func:`cache_profiles` is enabled.
+    """
+    cache, uid = profileCache, data.get("uid") if isinstance(data, dict) else None
+    if cache is None or uid is None: return UserProfile(data).UserProfile
+
+    value = cache.get(uid)
+    if value is None: value = cache[uid] = UserProfile(data).UserProfile
+    return value
+
+def profile_column(data, *keys) -> "UserProfileList":
+    """
+    :class:`UserProfileList` of the profiles at ``keys`` in every item of ``data``, reading each user once.
+    """
+    return UserProfile.schema.parse_columns(UserProfileList(column(data, *keys)), key="uid")
+
+class LazyObject:
+    """
+    Base of the objects reading each field from their json on first access, then keeping it.
+    ``fields`` maps the name of each attribute to the extractor of its value, missing values are None.
+    """
+    fields = {}
+
     def __init__(self, data):
         self.json = data
 
-        try: self.fanClub: FanClubList = FanClubList(data["fanClubList"]).FanClubList
-        except (KeyError, TypeError): self.fanClub: FanClubList = FanClubList([])
+    def __getattr__(self, name):
+        extract = type(self).fields.get(name)
+        if extract is None: raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+        try: value = extract(self.json)
+        except (KeyError, TypeError, IndexError): value = None
+
+        self.__dict__[name] = value
+        return value
+
+def missing(key):
+    return None
+
+def compile_fields(fields, assign: bool = False):
+    """
+    Function returning the tuple of the values of ``fields`` in a json, missing values are None.
+    With ``assign``, the function takes an object and sets them as its attributes from its json instead.
+    The paths of the :func:`field` extractors are read by generated code going through each shared part once, other extractors are called.
+    """
+    namespace = {"missing": missing}
+    lines, values, paths, getters = [], [], {(): "data"}, {}
+
+    def path(keys):
+        if keys in paths: return paths[keys]
+
+        name = paths[keys] = f"v{len(paths)}"
+        key = keys[-1]
+
+        if isinstance(key, str):
+            lines.append(f"{name} = {getter(keys[:-1])}({key!r})")
+        else:
+            lines.append(f"try: {name} = {path(keys[:-1])}[{key!r}]")
+            lines.append(f"except (KeyError, TypeError, IndexError): {name} = None")
+
+        return name
+
+    def getter(keys):
+        if keys in getters: return getters[keys]
+
+        value = path(keys)
+        name = getters[keys] = f"g{len(getters)}"
+        lines.append(f"{name} = {value}.get if isinstance({value}, dict) else missing")
+        return name
+
+    for index, extract in enumerate(fields.values()):
+        keys = getattr(extract, "keys", None)
+        if keys:
+            values.append(path(tuple(keys)))
+            continue
+
+        namespace[f"f{index}"] = extract
+        lines.append(f"try: c{index} = f{index}(data)")
+        lines.append(f"except (KeyError, TypeError): c{index} = None")
+        values.append(f"c{index}")
+
+    if assign:
+        lines.insert(0, "data = obj.json")
+        lines.extend(f"obj.{name} = {value}" for name, value in zip(fields, values))
+        source = "def extract(obj):\n" + "".join(f"    {line}\n" for line in lines) + "    return obj\n"
+    else:
+        source = "def extract(data):\n" + "".join(f"    {line}\n" for line in lines) + f"    return ({', '.join(values)},)\n"
+
+    exec(compile(source, "<fields>", "exec"), namespace)
+    return namespace["extract"]
+
+class Schema:
+    """
+    Fields of an object, mapping the name of each attribute to its extractor, all read by one :func:`compiled <compile_fields>` function.
+    """
+    def __init__(self, fields: dict):
+        self.fields = fields
+        self.names = tuple(fields)
+        self.extract = compile_fields(fields)
+        self.assign = compile_fields(fields, assign=True)
+        self.selected = {}
+
+    def parse(self, obj):
+        """
+        Set the fields of ``obj`` from its json.
+        """
+        return self.assign(obj)
+
+    def select(self, names) -> "Schema":
+        """
+        Schema of the fields ``names`` only, compiled once.
+        """
+        names = tuple(names)
+        schema = self.selected.get(names)
+        if schema is not None: return schema
+
+        unknown = [name for name in names if name not in self.fields]
+        if unknown: raise ValueError(f"Unknown fields : {', '.join(unknown)}")
+
+        schema = self.selected[names] = Schema({name: self.fields[name] for name in names})
+        return schema
+
+    def columns(self, data) -> dict:
+        """
+        Lists of the values of each field in every item of ``data``.
+        """
+        rows = list(map(self.extract, data))
+        if not rows: return {name: [] for name in self.names}
+        return dict(zip(self.names, map(list, zip(*rows))))
+
+    def parse_columns(self, obj, key: str = None):
+        """
+        Set the fields of the list ``obj`` from its json, each one to the list of its values in every item.
+        With ``key``, the items having the same value at this key of their json are read once and share their values.
+        """
+        rows = list(map(self.extract, obj.json)) if key is None else self.intern(obj.json, key)
+        if rows: obj.__dict__.update(zip(self.names, map(list, zip(*rows))))
+        return obj
+
+    def intern(self, data, key: str) -> list:
+        extract, rows, seen = self.extract, [], {}
+
+        for item in data:
+            value = item.get(key) if isinstance(item, dict) else None
+            if value is None:
+                rows.append(extract(item))
+                continue
+
+            row = seen.get(value)
+            if row is None: row = seen[value] = extract(item)
+            rows.append(row)
+
+        return rows
+
+class UserProfile:
+    schema = Schema({
+        "accountMembershipStatus": field("accountMembershipStatus"),
+        "activation": field("activation"),
+        "activePublicLiveThreadId": field("activePublicLiveThreadId"),
+        "age": field("age"),
+        "aminoId": field("aminoId"),
+        "aminoIdEditable": field("aminoIdEditable"),
+        "appleId": field("appleID"),
+        "avatarFrame": field("avatarFrame"),
+        "avatarFrameId": field("avatarFrameId"),
+        "backgroundColor": field("extensions", "style", "backgroundColor"),
+        "backgroundImage": field("extensions", "style", "backgroundMediaList", 1),
+        "blogsCount": field("blogsCount"),
+        "commentsCount": field("commentsCount"),
+        "content": field("content"),
+        "coverAnimation": field("extensions", "coverAnimation"),
+        "createdTime": field("createdTime"),
+        "customTitles": field("extensions", "customTitles"),
+        "dateOfBirth": field("dateOfBirth"),
+        "defaultBubbleId": field("extensions", "defaultBubbleId"),
+        "disabledLevel": field("extensions", "__disabledLevel__"),
+        "disabledStatus": field("extensions", "__disabledStatus__"),
+        "disabledTime": field("extensions", "__disabledTime__"),
+        "email": field("email"),
+        "extensions": field("extensions"),
+        "facebookId": field("facebookID"),
+        "fansCount": field("influencerInfo", "fansCount"),
+        "followersCount": field("membersCount"),
+        "followingCount": field("joinedCount"),
+        "followingStatus": field("followingStatus"),
+        "gender": field("gender"),
+        "globalStrikeCount": field("adminInfo", "globalStrikeCount"),
+        "googleId": field("googleID"),
+        "icon": field("icon"),
+        "influencerCreatedTime": field("influencerInfo", "createdTime"),
+        "influencerInfo": field("influencerInfo"),
+        "influencerMonthlyFee": field("influencerInfo", "monthlyFee"),
+        "influencerPinned": field("influencerInfo", "pinned"),
+        "isGlobal": field("isGlobal"),
+        "isMemberOfTeamAmino": field("extensions", "isMemberOfTeamAmino"),
+        "isNicknameVerified": field("isNicknameVerified"),
+        "itemsCount": field("itemsCount"),
+        "lastStrikeTime": field("adminInfo", "lastStrikeTime"),
+        "lastWarningTime": field("adminInfo", "lastWarningTime"),
+        "level": field("level"),
+        "mediaList": field("mediaList"),
+        "membershipStatus": field("membershipStatus"),
+        "modifiedTime": field("modifiedTime"),
+        "mood": field("mood"),
+        "moodSticker": field("moodSticker"),
+        "nickname": field("nickname"),
+        "notificationSubscriptionStatus": field("notificationSubscriptionStatus"),
+        "onlineStatus": field("onlineStatus"),
+        "onlineStatus2": field("settings", "onlineStatus"),
+        "phoneNumber": field("phoneNumber"),
+        "postsCount": field("postsCount"),
+        "privilegeOfChatInviteRequest": field("extensions", "privilegeOfChatInviteRequest"),
+        "privilegeOfCommentOnUserProfile": field("extensions", "privilegeOfCommentOnUserProfile"),
+        "pushEnabled": field("pushEnabled"),
+        "race": field("race"),
+        "reputation": field("reputation"),
+        "role": field("role"),
+        "securityLevel": field("securityLevel"),
+        "staffInfo": field("adminInfo"),
+        "status": field("status"),
+        "storiesCount": field("storiesCount"),
+        "strikeCount": field("adminInfo", "strikeCount"),
+        "tagList": field("tagList"),
+        "twitterId": field("twitterID"),
+        "userId": field("uid"),
+        "verified": field("verified"),
+        "visitPrivacy": field("visitPrivacy"),
+        "visitorsCount": field("visitorsCount"),
+        "warningCount": field("adminInfo", "warningCount"),
+        "totalQuizHighestScore": field("totalQuizHighestScore"),
+        "totalQuizPlayedTimes": field("totalQuizPlayedTimes"),
+        "requestId": field("requestId"),
+        "message": field("message"),
+        "applicant": field("applicant"),
+        "avgDailySpendTimeIn7Days": field("avgDailySpendTimeIn7Days"),
+        "adminLogCountIn7Days": field("adminLogCountIn7Days")
+    })
+
+    def __init__(self, data):
+        self.json = data
 
         self.accountMembershipStatus = None
         self.activation = None
@@ -94,181 +412,19 @@ class UserProfile:
         self.avgDailySpendTimeIn7Days = None
         self.adminLogCountIn7Days = None
 
+    @lazy
+    def fanClub(self) -> "FanClubList":
+        try: return FanClubList(self.json["fanClubList"]).FanClubList
+        except (KeyError, TypeError): return FanClubList([])
+
     @property
     def UserProfile(self):
-        try: self.accountMembershipStatus = self.json["accountMembershipStatus"]
-        except (KeyError, TypeError): pass
-        try: self.activation = self.json["activation"]
-        except (KeyError, TypeError): pass
-        try: self.activePublicLiveThreadId = self.json["activePublicLiveThreadId"]
-        except (KeyError, TypeError): pass
-        try: self.age = self.json["age"]
-        except (KeyError, TypeError): pass
-        try: self.aminoId = self.json["aminoId"]
-        except (KeyError, TypeError): pass
-        try: self.aminoIdEditable = self.json["aminoIdEditable"]
-        except (KeyError, TypeError): pass
-        try: self.appleId = self.json["appleID"]
-        except (KeyError, TypeError): pass
-        try: self.avatarFrame = self.json["avatarFrame"]
-        except (KeyError, TypeError): pass
-        try: self.avatarFrameId = self.json["avatarFrameId"]
-        except (KeyError, TypeError): pass
-        try: self.backgroundColor = self.json["extensions"]["style"]["backgroundColor"]
-        except (KeyError, TypeError): pass
-        try: self.backgroundImage = self.json["extensions"]["style"]["backgroundMediaList"][1]
-        except (KeyError, TypeError, IndexError): pass
-        try: self.blogsCount = self.json["blogsCount"]
-        except (KeyError, TypeError): pass
-        try: self.commentsCount = self.json["commentsCount"]
-        except (KeyError, TypeError): pass
-        try: self.content = self.json["content"]
-        except (KeyError, TypeError): pass
-        try: self.coverAnimation = self.json["extensions"]["coverAnimation"]
-        except (KeyError, TypeError): pass
-        try: self.createdTime = self.json["createdTime"]
-        except (KeyError, TypeError): pass
-        try: self.customTitles = self.json["extensions"]["customTitles"]
-        except (KeyError, TypeError): pass
-        try: self.dateOfBirth = self.json["dateOfBirth"]
-        except (KeyError, TypeError): pass
-        try: self.defaultBubbleId = self.json["extensions"]["defaultBubbleId"]
-        except (KeyError, TypeError): pass
-        try: self.disabledLevel = self.json["extensions"]["__disabledLevel__"]
-        except (KeyError, TypeError): pass
-        try: self.disabledStatus = self.json["extensions"]["__disabledStatus__"]
-        except (KeyError, TypeError): pass
-        try: self.disabledTime = self.json["extensions"]["__disabledTime__"]
-        except (KeyError, TypeError): pass
-        try: self.email = self.json["email"]
-        except (KeyError, TypeError): pass
-        try: self.extensions = self.json["extensions"]
-        except (KeyError, TypeError): pass
-        try: self.facebookId = self.json["facebookID"]
-        except (KeyError, TypeError): pass
-        try: self.fansCount = self.json["influencerInfo"]["fansCount"]
-        except (KeyError, TypeError): pass
-        try: self.followersCount = self.json["membersCount"]
-        except (KeyError, TypeError): pass
-        try: self.followingCount = self.json["joinedCount"]
-        except (KeyError, TypeError): pass
-        try: self.followingStatus = self.json["followingStatus"]
-        except (KeyError, TypeError): pass
-        try: self.gender = self.json["gender"]
-        except (KeyError, TypeError): pass
-        try: self.globalStrikeCount = self.json["adminInfo"]["globalStrikeCount"]
-        except (KeyError, TypeError): pass
-        try: self.googleId = self.json["googleID"]
-        except (KeyError, TypeError): pass
-        try: self.icon = self.json["icon"]
-        except (KeyError, TypeError): pass
-        try: self.influencerCreatedTime = self.json["influencerInfo"]["createdTime"]
-        except (KeyError, TypeError): pass
-        try: self.influencerInfo = self.json["influencerInfo"]
-        except (KeyError, TypeError): pass
-        try: self.influencerMonthlyFee = self.json["influencerInfo"]["monthlyFee"]
-        except (KeyError, TypeError): pass
-        try: self.influencerPinned = self.json["influencerInfo"]["pinned"]
-        except (KeyError, TypeError): pass
-        try: self.isGlobal = self.json["isGlobal"]
-        except (KeyError, TypeError): pass
-        try: self.isMemberOfTeamAmino = self.json["extensions"]["isMemberOfTeamAmino"]
-        except (KeyError, TypeError): pass
-        try: self.isNicknameVerified = self.json["isNicknameVerified"]
-        except (KeyError, TypeError): pass
-        try: self.itemsCount = self.json["itemsCount"]
-        except (KeyError, TypeError): pass
-        try: self.lastStrikeTime = self.json["adminInfo"]["lastStrikeTime"]
-        except (KeyError, TypeError): pass
-        try: self.lastWarningTime = self.json["adminInfo"]["lastWarningTime"]
-        except (KeyError, TypeError): pass
-        try: self.level = self.json["level"]
-        except (KeyError, TypeError): pass
-        try: self.mediaList = self.json["mediaList"]
-        except (KeyError, TypeError): pass
-        try: self.membershipStatus = self.json["membershipStatus"]
-        except (KeyError, TypeError): pass
-        try: self.modifiedTime = self.json["modifiedTime"]
-        except (KeyError, TypeError): pass
-        try: self.mood = self.json["mood"]
-        except (KeyError, TypeError): pass
-        try: self.moodSticker = self.json["moodSticker"]
-        except (KeyError, TypeError): pass
-        try: self.nickname = self.json["nickname"]
-        except (KeyError, TypeError): pass
-        try: self.notificationSubscriptionStatus = self.json["notificationSubscriptionStatus"]
-        except (KeyError, TypeError): pass
-        try: self.onlineStatus = self.json["onlineStatus"]
-        except (KeyError, TypeError): pass
-        try: self.onlineStatus2 = self.json["settings"]["onlineStatus"]
-        except (KeyError, TypeError): pass
-        try: self.phoneNumber = self.json["phoneNumber"]
-        except (KeyError, TypeError): pass
-        try: self.postsCount = self.json["postsCount"]
-        except (KeyError, TypeError): pass
-        try: self.privilegeOfChatInviteRequest = self.json["extensions"]["privilegeOfChatInviteRequest"]
-        except (KeyError, TypeError): pass
-        try: self.privilegeOfCommentOnUserProfile = self.json["extensions"]["privilegeOfCommentOnUserProfile"]
-        except (KeyError, TypeError): pass
-        try: self.pushEnabled = self.json["pushEnabled"]
-        except (KeyError, TypeError): pass
-        try: self.race = self.json["race"]
-        except (KeyError, TypeError): pass
-        try: self.reputation = self.json["reputation"]
-        except (KeyError, TypeError): pass
-        try: self.role = self.json["role"]
-        except (KeyError, TypeError): pass
-        try: self.securityLevel = self.json["securityLevel"]
-        except (KeyError, TypeError): pass
-        try: self.staffInfo = self.json["adminInfo"]
-        except (KeyError, TypeError): pass
-        try: self.status = self.json["status"]
-        except (KeyError, TypeError): pass
-        try: self.storiesCount = self.json["storiesCount"]
-        except (KeyError, TypeError): pass
-        try: self.strikeCount = self.json["adminInfo"]["strikeCount"]
-        except (KeyError, TypeError): pass
-        try: self.tagList = self.json["tagList"]
-        except (KeyError, TypeError): pass
-        try: self.twitterId = self.json["twitterID"]
-        except (KeyError, TypeError): pass
-        try: self.userId = self.json["uid"]
-        except (KeyError, TypeError): pass
-        try: self.verified = self.json["verified"]
-        except (KeyError, TypeError): pass
-        try: self.visitPrivacy = self.json["visitPrivacy"]
-        except (KeyError, TypeError): pass
-        try: self.visitorsCount = self.json["visitorsCount"]
-        except (KeyError, TypeError): pass
-        try: self.warningCount = self.json["adminInfo"]["warningCount"]
-        except (KeyError, TypeError): pass
-        try: self.totalQuizHighestScore = self.json["totalQuizHighestScore"]
-        except (KeyError, TypeError): pass
-        try: self.totalQuizPlayedTimes = self.json["totalQuizPlayedTimes"]
-        except (KeyError, TypeError): pass
-        try: self.requestId = self.json["requestId"]
-        except (KeyError, TypeError): pass
-        try: self.message = self.json["message"]
-        except (KeyError, TypeError): pass
-        try: self.applicant = self.json["applicant"]
-        except (KeyError, TypeError): pass
-        try: self.avgDailySpendTimeIn7Days = self.json["avgDailySpendTimeIn7Days"]
-        except (KeyError, TypeError): pass
-        try: self.adminLogCountIn7Days = self.json["adminLogCountIn7Days"]
-        except (KeyError, TypeError): pass
-
-        return self
+        return self.schema.parse(self)
 
 class UserProfileList:
     def __init__(self, data):
-        _fanClub = []
-
         self.json = data
 
-        for y in data:
-            try: _fanClub.append(FanClubList(y["fanClubList"]).FanClubList)
-            except (KeyError, TypeError): _fanClub.append(None)
-
         self.accountMembershipStatus = []
         self.activation = []
         self.activePublicLiveThreadId = []
@@ -295,7 +451,6 @@ class UserProfileList:
         self.extensions = []
         self.facebookId = []
         self.fansCount = []
-        self.fanClub = _fanClub
         self.followersCount = []
         self.followingCount = []
         self.followingStatus = []
@@ -351,189 +506,55 @@ class UserProfileList:
         self.avgDailySpendTimeIn7Days = []
         self.adminLogCountIn7Days = []
 
+    @lazy
+    def fanClub(self) -> list:
+        return nested_column(FanClubList, self.json, "fanClubList")
+
+    def rows(self):
+        """
+        Items of the list as :class:`UserProfileRecord` rows, reading the json instead of filling the columns.
+
+        **Returns**
+            - **Success** : :class:`Rows`
+        """
+        return Rows(self.json, UserProfileRecord)
+
+    def to_arrow(self, fields: list = None):
+        """
+        Columns of the list as an Arrow table, read from its json. Needs ``pyarrow``.
+
+        **Parameters**
+            - *fields* : Names of the fields to export, all of them by default.
+
+        **Returns**
+            - **Success** : ``pyarrow.Table``, see :func:`to_arrow <amino.lib.util.columnar.to_arrow>`.
+        """
+        from .columnar import to_arrow
+        return to_arrow(self.json, UserProfile.schema, fields)
+
+    def to_numpy(self, fields: list = None) -> dict:
+        """
+        Columns of the list as NumPy arrays, read from its json. Needs ``numpy``.
+
+        **Parameters**
+            - *fields* : Names of the fields to export, all of them by default.
+
+        **Returns**
+            - **Success** : Dict of ``numpy.ndarray`` by field, see :func:`to_numpy <amino.lib.util.columnar.to_numpy>`.
+        """
+        from .columnar import to_numpy
+        return to_numpy(self.json, UserProfile.schema, fields)
+
     @property
     def UserProfileList(self):
-        for x in self.json:
-            try: self.accountMembershipStatus.append(x["accountMembershipStatus"])
-            except (KeyError, TypeError): self.accountMembershipStatus.append(None)
-            try: self.activation.append(x["activation"])
-            except (KeyError, TypeError): self.activation.append(None)
-            try: self.activePublicLiveThreadId.append(x["activePublicLiveThreadId"])
-            except (KeyError, TypeError): self.activePublicLiveThreadId.append(None)
-            try: self.age.append(x["age"])
-            except (KeyError, TypeError): self.age.append(None)
-            try: self.aminoId.append(x["aminoId"])
-            except (KeyError, TypeError): self.aminoId.append(None)
-            try: self.aminoIdEditable.append(x["aminoIdEditable"])
-            except (KeyError, TypeError): self.aminoIdEditable.append(None)
-            try: self.appleId.append(x["appleID"])
-            except (KeyError, TypeError): self.appleId.append(None)
-            try: self.avatarFrame.append(x["avatarFrame"])
-            except (KeyError, TypeError): self.avatarFrame.append(None)
-            try: self.avatarFrameId.append(x["avatarFrameId"])
-            except (KeyError, TypeError): self.avatarFrameId.append(None)
-            try: self.backgroundColor.append(x["extensions"]["style"]["backgroundColor"])
-            except (KeyError, TypeError): self.backgroundColor.append(None)
-            try: self.backgroundImage.append(x["extensions"]["style"]["backgroundMediaList"][1])
-            except (KeyError, TypeError, IndexError): self.backgroundImage.append(None)
-            try: self.blogsCount.append(x["blogsCount"])
-            except (KeyError, TypeError): self.blogsCount.append(None)
-            try: self.commentsCount.append(x["commentsCount"])
-            except (KeyError, TypeError): self.commentsCount.append(None)
-            try: self.content.append(x["content"])
-            except (KeyError, TypeError): self.content.append(None)
-            try: self.coverAnimation.append(x["extensions"]["coverAnimation"])
-            except (KeyError, TypeError): self.coverAnimation.append(None)
-            try: self.createdTime.append(x["createdTime"])
-            except (KeyError, TypeError): self.createdTime.append(None)
-            try: self.customTitles.append(x["extensions"]["customTitles"])
-            except (KeyError, TypeError): self.customTitles.append(None)
-            try: self.dateOfBirth.append(x["dateOfBirth"])
-            except (KeyError, TypeError): self.dateOfBirth.append(None)
-            try: self.defaultBubbleId.append(x["extensions"]["defaultBubbleId"])
-            except (KeyError, TypeError): self.defaultBubbleId.append(None)
-            try: self.disabledLevel.append(x["extensions"]["__disabledLevel__"])
-            except (KeyError, TypeError): self.disabledLevel.append(None)
-            try: self.disabledStatus.append(x["extensions"]["__disabledStatus__"])
-            except (KeyError, TypeError): self.disabledStatus.append(None)
-            try: self.disabledTime.append(x["extensions"]["__disabledTime__"])
-            except (KeyError, TypeError): self.disabledTime.append(None)
-            try: self.email.append(x["email"])
-            except (KeyError, TypeError): self.email.append(None)
-            try: self.extensions.append(x["extensions"])
-            except (KeyError, TypeError): self.extensions.append(None)
-            try: self.facebookId.append(x["facebookID"])
-            except (KeyError, TypeError): self.facebookId.append(None)
-            try: self.fansCount.append(x["influencerInfo"]["fansCount"])
-            except (KeyError, TypeError): self.fansCount.append(None)
-            try: self.followersCount.append(x["membersCount"])
-            except (KeyError, TypeError): self.followersCount.append(None)
-            try: self.followingCount.append(x["joinedCount"])
-            except (KeyError, TypeError): self.followingCount.append(None)
-            try: self.followingStatus.append(x["followingStatus"])
-            except (KeyError, TypeError): self.followingStatus.append(None)
-            try: self.gender.append(x["gender"])
-            except (KeyError, TypeError): self.gender.append(None)
-            try: self.globalStrikeCount.append(x["adminInfo"]["globalStrikeCount"])
-            except (KeyError, TypeError): self.globalStrikeCount.append(None)
-            try: self.googleId.append(x["googleID"])
-            except (KeyError, TypeError): self.googleId.append(None)
-            try: self.icon.append(x["icon"])
-            except (KeyError, TypeError): self.icon.append(None)
-            try: self.influencerCreatedTime.append(x["influencerInfo"]["createdTime"])
-            except (KeyError, TypeError): self.influencerCreatedTime.append(None)
-            try: self.influencerInfo.append(x["influencerInfo"])
-            except (KeyError, TypeError): self.influencerInfo.append(None)
-            try: self.influencerMonthlyFee.append(x["influencerInfo"]["monthlyFee"])
-            except (KeyError, TypeError): self.influencerMonthlyFee.append(None)
-            try: self.influencerPinned.append(x["influencerInfo"]["pinned"])
-            except (KeyError, TypeError): self.influencerPinned.append(None)
-            try: self.isGlobal.append(x["isGlobal"])
-            except (KeyError, TypeError): self.isGlobal.append(None)
-            try: self.isMemberOfTeamAmino.append(x["extensions"]["isMemberOfTeamAmino"])
-            except (KeyError, TypeError): self.isMemberOfTeamAmino.append(None)
-            try: self.isNicknameVerified.append(x["isNicknameVerified"])
-            except (KeyError, TypeError): self.isNicknameVerified.append(None)
-            try: self.itemsCount.append(x["itemsCount"])
-            except (KeyError, TypeError): self.itemsCount.append(None)
-            try: self.lastStrikeTime.append(x["adminInfo"]["lastStrikeTime"])
-            except (KeyError, TypeError): self.lastStrikeTime.append(None)
-            try: self.lastWarningTime.append(x["adminInfo"]["lastWarningTime"])
-            except (KeyError, TypeError): self.lastWarningTime.append(None)
-            try: self.level.append(x["level"])
-            except (KeyError, TypeError): self.level.append(None)
-            try: self.mediaList.append(x["mediaList"])
-            except (KeyError, TypeError): self.mediaList.append(None)
-            try: self.membershipStatus.append(x["membershipStatus"])
-            except (KeyError, TypeError): self.membershipStatus.append(None)
-            try: self.modifiedTime.append(x["modifiedTime"])
-            except (KeyError, TypeError): self.modifiedTime.append(None)
-            try: self.mood.append(x["mood"])
-            except (KeyError, TypeError): self.mood.append(None)
-            try: self.moodSticker.append(x["moodSticker"])
-            except (KeyError, TypeError): self.moodSticker.append(None)
-            try: self.nickname.append(x["nickname"])
-            except (KeyError, TypeError): self.nickname.append(None)
-            try: self.notificationSubscriptionStatus.append(x["notificationSubscriptionStatus"])
-            except (KeyError, TypeError): self.notificationSubscriptionStatus.append(None)
-            try: self.onlineStatus.append(x["onlineStatus"])
-            except (KeyError, TypeError): self.onlineStatus.append(None)
-            try: self.onlineStatus2.append(x["settings"]["onlineStatus"])
-            except (KeyError, TypeError): self.onlineStatus2.append(None)
-            try: self.phoneNumber.append(x["phoneNumber"])
-            except (KeyError, TypeError): self.phoneNumber.append(None)
-            try: self.postsCount.append(x["postsCount"])
-            except (KeyError, TypeError): self.postsCount.append(None)
-            try: self.privilegeOfChatInviteRequest.append(x["extensions"]["privilegeOfChatInviteRequest"])
-            except (KeyError, TypeError): self.privilegeOfChatInviteRequest.append(None)
-            try: self.privilegeOfCommentOnUserProfile.append(x["extensions"]["privilegeOfCommentOnUserProfile"])
-            except (KeyError, TypeError): self.privilegeOfCommentOnUserProfile.append(None)
-            try: self.pushEnabled.append(x["pushEnabled"])
-            except (KeyError, TypeError): self.pushEnabled.append(None)
-            try: self.race.append(x["race"])
-            except (KeyError, TypeError): self.race.append(None)
-            try: self.reputation.append(x["reputation"])
-            except (KeyError, TypeError): self.reputation.append(None)
-            try: self.role.append(x["role"])
-            except (KeyError, TypeError): self.role.append(None)
-            try: self.securityLevel.append(x["securityLevel"])
-            except (KeyError, TypeError): self.securityLevel.append(None)
-            try: self.staffInfo.append(x["adminInfo"])
-            except (KeyError, TypeError): self.staffInfo.append(None)
-            try: self.status.append(x["status"])
-            except (KeyError, TypeError): self.status.append(None)
-            try: self.storiesCount.append(x["storiesCount"])
-            except (KeyError, TypeError): self.storiesCount.append(None)
-            try: self.strikeCount.append(x["adminInfo"]["strikeCount"])
-            except (KeyError, TypeError): self.strikeCount.append(None)
-            try: self.tagList.append(x["tagList"])
-            except (KeyError, TypeError): self.tagList.append(None)
-            try: self.twitterId.append(x["twitterID"])
-            except (KeyError, TypeError): self.twitterId.append(None)
-            try: self.userId.append(x["uid"])
-            except (KeyError, TypeError): self.userId.append(None)
-            try: self.verified.append(x["verified"])
-            except (KeyError, TypeError): self.verified.append(None)
-            try: self.visitPrivacy.append(x["visitPrivacy"])
-            except (KeyError, TypeError): self.visitPrivacy.append(None)
-            try: self.visitorsCount.append(x["visitorsCount"])
-            except (KeyError, TypeError): self.visitorsCount.append(None)
-            try: self.warningCount.append(x["adminInfo"]["warningCount"])
-            except (KeyError, TypeError): self.warningCount.append(None)
-            try: self.totalQuizPlayedTimes.append(x["totalQuizPlayedTimes"])
-            except (KeyError, TypeError): self.totalQuizPlayedTimes.append(None)
-            try: self.totalQuizHighestScore.append(x["totalQuizHighestScore"])
-            except (KeyError, TypeError): self.totalQuizHighestScore.append(None)
-            try: self.requestId.append(x["requestId"])
-            except (KeyError, TypeError): self.requestId.append(None)
-            try: self.message.append(x["message"])
-            except (KeyError, TypeError): self.message.append(None)
-            try: self.applicant.append(x["applicant"])
-            except (KeyError, TypeError): self.applicant.append(None)
-            try: self.avgDailySpendTimeIn7Days.append(x["avgDailySpendTimeIn7Days"])
-            except (KeyError, TypeError): self.avgDailySpendTimeIn7Days.append(None)
-            try: self.adminLogCountIn7Days.append(x["adminLogCountIn7Days"])
-            except (KeyError, TypeError): self.adminLogCountIn7Days.append(None)
-
-        return self
+        return UserProfile.schema.parse_columns(self)
 
 class BlogList:
     def __init__(self, data, nextPageToken = None, prevPageToken = None):
-        _author, _quizQuestionList = [], []
-
         self.json = data
         self.nextPageToken = nextPageToken
         self.prevPageToken = prevPageToken
 
-        for y in data:
-            try: _author.append(y["author"])
-            except (KeyError, TypeError): _author.append(None)
-            try: _quizQuestionList.append(QuizQuestionList(y["quizQuestionList"]).QuizQuestionList)
-            except (KeyError, TypeError): _quizQuestionList.append(None)
-
-        self.author: UserProfileList = UserProfileList(_author).UserProfileList
-        self.quizQuestionList = _quizQuestionList
-
         self.createdTime = []
         self.globalVotesCount = []
         self.globalVotedValue = []
@@ -556,6 +577,7 @@ class BlogList:
         self.widgetDisplayInterval = []
         self.totalPollVoteCount = []
         self.blogId = []
+        self.comId = []
         self.viewCount = []
         self.fansOnly = []
         self.backgroundColor = []
@@ -576,93 +598,26 @@ class BlogList:
         self.quizLastAddQuestionTime = []
         self.isIntroPost = []
 
+    @lazy
+    def author(self) -> "UserProfileList":
+        return profile_column(self.json, "author")
+
+    @lazy
+    def quizQuestionList(self) -> list:
+        return nested_column(QuizQuestionList, self.json, "quizQuestionList")
+
+    def rows(self):
+        """
+        Items of the list as :class:`BlogRecord` rows, reading the json instead of filling the columns.
+
+        **Returns**
+            - **Success** : :class:`Rows`
+        """
+        return Rows(self.json, BlogRecord)
+
     @property
     def BlogList(self):
-        for x in self.json:
-            try: self.globalVotesCount.append(x["globalVotesCount"])
-            except (KeyError, TypeError): self.globalVotesCount.append(None)
-            try: self.globalVotedValue.append(x["globalVotedValue"])
-            except (KeyError, TypeError): self.globalVotedValue.append(None)
-            try: self.keywords.append(x["keywords"])
-            except (KeyError, TypeError): self.keywords.append(None)
-            try: self.mediaList.append(x["mediaList"])
-            except (KeyError, TypeError): self.mediaList.append(None)
-            try: self.style.append(x["style"])
-            except (KeyError, TypeError): self.style.append(None)
-            try: self.totalQuizPlayCount.append(x["totalQuizPlayCount"])
-            except (KeyError, TypeError): self.totalQuizPlayCount.append(None)
-            try: self.title.append(x["title"])
-            except (KeyError, TypeError): self.title.append(None)
-            try: self.tipInfo.append(x["tipInfo"])
-            except (KeyError, TypeError): self.tipInfo.append(None)
-            try: self.tippersCount.append(x["tipInfo"]["tippersCount"])
-            except (KeyError, TypeError): self.tippersCount.append(None)
-            try: self.tippable.append(x["tipInfo"]["tippable"])
-            except (KeyError, TypeError): self.tippable.append(None)
-            try: self.tippedCoins.append(x["tipInfo"]["tippedCoins"])
-            except (KeyError, TypeError): self.tippedCoins.append(None)
-            try: self.contentRating.append(x["contentRating"])
-            except (KeyError, TypeError): self.contentRating.append(None)
-            try: self.needHidden.append(x["needHidden"])
-            except (KeyError, TypeError): self.needHidden.append(None)
-            try: self.guestVotesCount.append(x["guestVotesCount"])
-            except (KeyError, TypeError): self.guestVotesCount.append(None)
-            try: self.type.append(x["type"])
-            except (KeyError, TypeError): self.type.append(None)
-            try: self.status.append(x["status"])
-            except (KeyError, TypeError): self.status.append(None)
-            try: self.globalCommentsCount.append(x["globalCommentsCount"])
-            except (KeyError, TypeError): self.globalCommentsCount.append(None)
-            try: self.modifiedTime.append(x["modifiedTime"])
-            except (KeyError, TypeError): self.modifiedTime.append(None)
-            try: self.widgetDisplayInterval.append(x["widgetDisplayInterval"])
-            except (KeyError, TypeError): self.widgetDisplayInterval.append(None)
-            try: self.totalPollVoteCount.append(x["totalPollVoteCount"])
-            except (KeyError, TypeError): self.totalPollVoteCount.append(None)
-            try: self.blogId.append(x["blogId"])
-            except (KeyError, TypeError): self.blogId.append(None)
-            try: self.viewCount.append(x["viewCount"])
-            except (KeyError, TypeError): self.viewCount.append(None)
-            try: self.fansOnly.append(x["extensions"]["fansOnly"])
-            except (KeyError, TypeError): self.fansOnly.append(None)
-            try: self.backgroundColor.append(x["extensions"]["style"]["backgroundColor"])
-            except (KeyError, TypeError): self.backgroundColor.append(None)
-            try: self.votesCount.append(x["votesCount"])
-            except (KeyError, TypeError): self.votesCount.append(None)
-            try: self.endTime.append(x["endTime"])
-            except (KeyError, TypeError): self.endTime.append(None)
-            try: self.refObjectId.append(x["refObjectId"])
-            except (KeyError, TypeError): self.refObjectId.append(None)
-            try: self.refObject.append(x["refObject"])
-            except (KeyError, TypeError): self.refObject.append(None)
-            try: self.votedValue.append(x["votedValue"])
-            except (KeyError, TypeError): self.votedValue.append(None)
-            try: self.content.append(x["content"])
-            except (KeyError, TypeError): self.content.append(None)
-            try: self.createdTime.append(x["createdTime"])
-            except (KeyError, TypeError): self.createdTime.append(None)
-            try: self.extensions.append(x["extensions"])
-            except (KeyError, TypeError): self.extensions.append(None)
-            try: self.shareUrl.append(x["shareURLFullPath"])
-            except (KeyError, TypeError): self.shareUrl.append(None)
-            try: self.commentsCount.append(x["commentsCount"])
-            except (KeyError, TypeError): self.commentsCount.append(None)
-            try: self.featuredType.append(x["extensions"]["featuredType"])
-            except (KeyError, TypeError): self.featuredType.append(None)
-            try: self.disabledTime.append(x["extensions"]["__disabledTime__"])
-            except (KeyError, TypeError): self.disabledTime.append(None)
-            try: self.quizPlayedTimes.append(x["extensions"]["quizPlayedTimes"])
-            except (KeyError, TypeError): self.quizPlayedTimes.append(None)
-            try: self.quizTotalQuestionCount.append(x["extensions"]["quizTotalQuestionCount"])
-            except (KeyError, TypeError): self.quizTotalQuestionCount.append(None)
-            try: self.quizTrendingTimes.append(x["extensions"]["quizTrendingTimes"])
-            except (KeyError, TypeError): self.quizTrendingTimes.append(None)
-            try: self.quizLastAddQuestionTime.append(x["extensions"]["quizLastAddQuestionTime"])
-            except (KeyError, TypeError): self.quizLastAddQuestionTime.append(None)
-            try: self.isIntroPost.append(x["extensions"]["isIntroPost"])
-            except (KeyError, TypeError): self.isIntroPost.append(None)
-
-        return self
+        return Blog.schema.parse_columns(self)
 
 class RecentBlogs:
     def __init__(self, data):
@@ -724,14 +679,54 @@ class BlogCategoryList:
         return self
 
 class Blog:
+    schema = Schema({
+        "globalVotesCount": field("globalVotesCount"),
+        "globalVotedValue": field("globalVotedValue"),
+        "keywords": field("keywords"),
+        "mediaList": field("mediaList"),
+        "style": field("style"),
+        "totalQuizPlayCount": field("totalQuizPlayCount"),
+        "title": field("title"),
+        "tipInfo": field("tipInfo"),
+        "tippersCount": field("tipInfo", "tippersCount"),
+        "tippable": field("tipInfo", "tippable"),
+        "tippedCoins": field("tipInfo", "tippedCoins"),
+        "contentRating": field("contentRating"),
+        "needHidden": field("needHidden"),
+        "guestVotesCount": field("guestVotesCount"),
+        "type": field("type"),
+        "status": field("status"),
+        "globalCommentsCount": field("globalCommentsCount"),
+        "modifiedTime": field("modifiedTime"),
+        "widgetDisplayInterval": field("widgetDisplayInterval"),
+        "totalPollVoteCount": field("totalPollVoteCount"),
+        "blogId": field("blogId"),
+        "comId": field("ndcId"),
+        "viewCount": field("viewCount"),
+        "shareUrl": field("shareURLFullPath"),
+        "fansOnly": field("extensions", "fansOnly"),
+        "backgroundColor": field("extensions", "style", "backgroundColor"),
+        "votesCount": field("votesCount"),
+        "endTime": field("endTime"),
+        "refObjectId": field("refObjectId"),
+        "refObject": field("refObject"),
+        "votedValue": field("votedValue"),
+        "content": field("content"),
+        "createdTime": field("createdTime"),
+        "extensions": field("extensions"),
+        "commentsCount": field("commentsCount"),
+        "featuredType": field("extensions", "featuredType"),
+        "disabledTime": field("extensions", "__disabledTime__"),
+        "quizPlayedTimes": field("extensions", "quizPlayedTimes"),
+        "quizTotalQuestionCount": field("extensions", "quizTotalQuestionCount"),
+        "quizTrendingTimes": field("extensions", "quizTrendingTimes"),
+        "quizLastAddQuestionTime": field("extensions", "quizLastAddQuestionTime"),
+        "isIntroPost": field("extensions", "isIntroPost")
+    })
+
     def __init__(self, data):
         self.json = data
 
-        try: self.author: UserProfile = UserProfile(data["author"]).UserProfile
-        except (KeyError, TypeError): self.author: UserProfile = UserProfile([])
-        try: self.quizQuestionList: QuizQuestionList = QuizQuestionList(data["quizQuestionList"]).QuizQuestionList
-        except (KeyError, TypeError): self.quizQuestionList: QuizQuestionList = QuizQuestionList([])
-
         self.createdTime = None
         self.globalVotesCount = None
         self.globalVotedValue = None
@@ -775,94 +770,19 @@ class Blog:
         self.quizLastAddQuestionTime = None
         self.isIntroPost = None
 
+    @lazy
+    def author(self) -> "UserProfile":
+        try: return profile(self.json["author"])
+        except (KeyError, TypeError): return UserProfile([])
+
+    @lazy
+    def quizQuestionList(self) -> "QuizQuestionList":
+        try: return QuizQuestionList(self.json["quizQuestionList"]).QuizQuestionList
+        except (KeyError, TypeError): return QuizQuestionList([])
+
     @property
     def Blog(self):
-        try: self.globalVotesCount = self.json["globalVotesCount"]
-        except (KeyError, TypeError): pass
-        try: self.globalVotedValue = self.json["globalVotedValue"]
-        except (KeyError, TypeError): pass
-        try: self.keywords = self.json["keywords"]
-        except (KeyError, TypeError): pass
-        try: self.mediaList = self.json["mediaList"]
-        except (KeyError, TypeError): pass
-        try: self.style = self.json["style"]
-        except (KeyError, TypeError): pass
-        try: self.totalQuizPlayCount = self.json["totalQuizPlayCount"]
-        except (KeyError, TypeError): pass
-        try: self.title = self.json["title"]
-        except (KeyError, TypeError): pass
-        try: self.tipInfo = self.json["tipInfo"]
-        except (KeyError, TypeError): pass
-        try: self.tippersCount = self.json["tipInfo"]["tippersCount"]
-        except (KeyError, TypeError): pass
-        try: self.tippable = self.json["tipInfo"]["tippable"]
-        except (KeyError, TypeError): pass
-        try: self.tippedCoins = self.json["tipInfo"]["tippedCoins"]
-        except (KeyError, TypeError): pass
-        try: self.contentRating = self.json["contentRating"]
-        except (KeyError, TypeError): pass
-        try: self.needHidden = self.json["needHidden"]
-        except (KeyError, TypeError): pass
-        try: self.guestVotesCount = self.json["guestVotesCount"]
-        except (KeyError, TypeError): pass
-        try: self.type = self.json["type"]
-        except (KeyError, TypeError): pass
-        try: self.status = self.json["status"]
-        except (KeyError, TypeError): pass
-        try: self.globalCommentsCount = self.json["globalCommentsCount"]
-        except (KeyError, TypeError): pass
-        try: self.modifiedTime = self.json["modifiedTime"]
-        except (KeyError, TypeError): pass
-        try: self.widgetDisplayInterval = self.json["widgetDisplayInterval"]
-        except (KeyError, TypeError): pass
-        try: self.totalPollVoteCount = self.json["totalPollVoteCount"]
-        except (KeyError, TypeError): pass
-        try: self.blogId = self.json["blogId"]
-        except (KeyError, TypeError): pass
-        try: self.comId = self.json["ndcId"]
-        except (KeyError, TypeError): pass
-        try: self.viewCount = self.json["viewCount"]
-        except (KeyError, TypeError): pass
-        try: self.shareUrl = self.json["shareURLFullPath"]
-        except (KeyError, TypeError): pass
-        try: self.fansOnly = self.json["extensions"]["fansOnly"]
-        except (KeyError, TypeError): pass
-        try: self.backgroundColor = self.json["extensions"]["style"]["backgroundColor"]
-        except (KeyError, TypeError): pass
-        try: self.votesCount = self.json["votesCount"]
-        except (KeyError, TypeError): pass
-        try: self.endTime = self.json["endTime"]
-        except (KeyError, TypeError): pass
-        try: self.refObjectId = self.json["refObjectId"]
-        except (KeyError, TypeError): pass
-        try: self.refObject = self.json["refObject"]
-        except (KeyError, TypeError): pass
-        try: self.votedValue = self.json["votedValue"]
-        except (KeyError, TypeError): pass
-        try: self.content = self.json["content"]
-        except (KeyError, TypeError): pass
-        try: self.createdTime = self.json["createdTime"]
-        except (KeyError, TypeError): pass
-        try: self.extensions = self.json["extensions"]
-        except (KeyError, TypeError): pass
-        try: self.commentsCount = self.json["commentsCount"]
-        except (KeyError, TypeError): pass
-        try: self.featuredType = self.json["extensions"]["featuredType"]
-        except (KeyError, TypeError): pass
-        try: self.disabledTime = self.json["extensions"]["__disabledTime__"]
-        except (KeyError, TypeError): pass
-        try: self.quizPlayedTimes = self.json["extensions"]["quizPlayedTimes"]
-        except (KeyError, TypeError): pass
-        try: self.quizTotalQuestionCount = self.json["extensions"]["quizTotalQuestionCount"]
-        except (KeyError, TypeError): pass
-        try: self.quizTrendingTimes = self.json["extensions"]["quizTrendingTimes"]
-        except (KeyError, TypeError): pass
-        try: self.quizLastAddQuestionTime = self.json["extensions"]["quizLastAddQuestionTime"]
-        except (KeyError, TypeError): pass
-        try: self.isIntroPost = self.json["extensions"]["isIntroPost"]
-        except (KeyError, TypeError): pass
-
-        return self
+        return self.schema.parse(self)
 
 class Wiki:
     def __init__(self, data):
@@ -1105,14 +1025,63 @@ class RankingTableList:
         return self
 
 class Community:
+    schema = Schema({
+        "name": field("name"),
+        "usersCount": field("membersCount"),
+        "createdTime": field("createdTime"),
+        "aminoId": field("endpoint"),
+        "icon": field("icon"),
+        "link": field("link"),
+        "comId": field("ndcId"),
+        "modifiedTime": field("modifiedTime"),
+        "status": field("status"),
+        "joinType": field("joinType"),
+        "primaryLanguage": field("primaryLanguage"),
+        "heat": field("communityHeat"),
+        "userAddedTopicList": field("userAddedTopicList"),
+        "probationStatus": field("probationStatus"),
+        "listedStatus": field("listedStatus"),
+        "themePack": field("themePack"),
+        "themeColor": field("themePack", "themeColor"),
+        "themeHash": field("themePack", "themePackHash"),
+        "themeVersion": field("themePack", "themePackRevision"),
+        "themeUrl": field("themePack", "themePackUrl"),
+        "themeHomePageAppearance": field("configuration", "appearance", "homePage", "navigation"),
+        "themeLeftSidePanelTop": field("configuration", "appearance", "leftSidePanel", "navigation", "level1"),
+        "themeLeftSidePanelBottom": field("configuration", "appearance", "leftSidePanel", "navigation", "level2"),
+        "themeLeftSidePanelColor": field("configuration", "appearance", "leftSidePanel", "style", "iconColor"),
+        "customList": field("configuration", "page", "customList"),
+        "tagline": field("tagline"),
+        "searchable": field("searchable"),
+        "isStandaloneAppDeprecated": field("isStandaloneAppDeprecated"),
+        "influencerList": field("influencerList"),
+        "keywords": field("keywords"),
+        "mediaList": field("mediaList"),
+        "description": field("content"),
+        "isStandaloneAppMonetizationEnabled": field("isStandaloneAppMonetizationEnabled"),
+        "advancedSettings": field("advancedSettings"),
+        "defaultRankingTypeInLeaderboard": field("advancedSettings", "defaultRankingTypeInLeaderboard"),
+        "frontPageLayout": field("advancedSettings", "frontPageLayout"),
+        "hasPendingReviewRequest": field("advancedSettings", "hasPendingReviewRequest"),
+        "welcomeMessageEnabled": field("advancedSettings", "welcomeMessageEnabled"),
+        "welcomeMessage": field("advancedSettings", "welcomeMessageText"),
+        "pollMinFullBarVoteCount": field("advancedSettings", "pollMinFullBarVoteCount"),
+        "catalogEnabled": field("advancedSettings", "catalogEnabled"),
+        "leaderboardStyle": field("advancedSettings", "leaderboardStyle"),
+        "facebookAppIdList": field("advancedSettings", "facebookAppIdList"),
+        "newsfeedPages": field("advancedSettings", "newsfeedPages"),
+        "joinedBaselineCollectionIdList": field("advancedSettings", "joinedBaselineCollectionIdList"),
+        "activeInfo": field("activeInfo"),
+        "configuration": field("configuration"),
+        "extensions": field("extensions"),
+        "nameAliases": field("extensions", "communityNameAliases"),
+        "templateId": field("templateId"),
+        "promotionalMediaList": field("promotionalMediaList")
+    })
+
     def __init__(self, data):
         self.json = data
 
-        try: self.agent: UserProfile = UserProfile(data["agent"]).UserProfile
-        except (KeyError, TypeError): self.agent: UserProfile = UserProfile([])
-        try: self.rankingTable: RankingTableList = RankingTableList(data["advancedSettings"]["rankingTable"]).RankingTableList
-        except (KeyError, TypeError): self.rankingTable: RankingTableList = RankingTableList([])
-
         self.usersCount = None
         self.createdTime = None
         self.aminoId = None
@@ -1165,127 +1134,24 @@ class Community:
         self.themeLeftSidePanelColor = None
         self.customList = None
 
+    @lazy
+    def agent(self) -> "UserProfile":
+        try: return profile(self.json["agent"])
+        except (KeyError, TypeError): return UserProfile([])
+
+    @lazy
+    def rankingTable(self) -> "RankingTableList":
+        try: return RankingTableList(self.json["advancedSettings"]["rankingTable"]).RankingTableList
+        except (KeyError, TypeError): return RankingTableList([])
+
     @property
     def Community(self):
-        try: self.name = self.json["name"]
-        except (KeyError, TypeError): pass
-        try: self.usersCount = self.json["membersCount"]
-        except (KeyError, TypeError): pass
-        try: self.createdTime = self.json["createdTime"]
-        except (KeyError, TypeError): pass
-        try: self.aminoId = self.json["endpoint"]
-        except (KeyError, TypeError): pass
-        try: self.icon = self.json["icon"]
-        except (KeyError, TypeError): pass
-        try: self.link = self.json["link"]
-        except (KeyError, TypeError): pass
-        try: self.comId = self.json["ndcId"]
-        except (KeyError, TypeError): pass
-        try: self.modifiedTime = self.json["modifiedTime"]
-        except (KeyError, TypeError): pass
-        try: self.status = self.json["status"]
-        except (KeyError, TypeError): pass
-        try: self.joinType = self.json["joinType"]
-        except (KeyError, TypeError): pass
-        try: self.primaryLanguage = self.json["primaryLanguage"]
-        except (KeyError, TypeError): pass
-        try: self.heat = self.json["communityHeat"]
-        except (KeyError, TypeError): pass
-        try: self.userAddedTopicList = self.json["userAddedTopicList"]
-        except (KeyError, TypeError): pass
-        try: self.probationStatus = self.json["probationStatus"]
-        except (KeyError, TypeError): pass
-        try: self.listedStatus = self.json["listedStatus"]
-        except (KeyError, TypeError): pass
-        try: self.themePack = self.json["themePack"]
-        except (KeyError, TypeError): pass
-        try: self.themeColor = self.json["themePack"]["themeColor"]
-        except (KeyError, TypeError): pass
-        try: self.themeHash = self.json["themePack"]["themePackHash"]
-        except (KeyError, TypeError): pass
-        try: self.themeVersion = self.json["themePack"]["themePackRevision"]
-        except (KeyError, TypeError): pass
-        try: self.themeUrl = self.json["themePack"]["themePackUrl"]
-        except (KeyError, TypeError): pass
-        try: self.themeHomePageAppearance = self.json["configuration"]["appearance"]["homePage"]["navigation"]
-        except (KeyError, TypeError): pass
-        try: self.themeLeftSidePanelTop = self.json["configuration"]["appearance"]["leftSidePanel"]["navigation"]["level1"]
-        except (KeyError, TypeError): pass
-        try: self.themeLeftSidePanelBottom = self.json["configuration"]["appearance"]["leftSidePanel"]["navigation"]["level2"]
-        except (KeyError, TypeError): pass
-        try: self.themeLeftSidePanelColor = self.json["configuration"]["appearance"]["leftSidePanel"]["style"]["iconColor"]
-        except (KeyError, TypeError): pass
-        try: self.customList = self.json["configuration"]["page"]["customList"]
-        except (KeyError, TypeError): pass
-        try: self.tagline = self.json["tagline"]
-        except (KeyError, TypeError): pass
-        try: self.searchable = self.json["searchable"]
-        except (KeyError, TypeError): pass
-        try: self.isStandaloneAppDeprecated = self.json["isStandaloneAppDeprecated"]
-        except (KeyError, TypeError): pass
-        try: self.influencerList = self.json["influencerList"]
-        except (KeyError, TypeError): pass
-        try: self.keywords = self.json["keywords"]
-        except (KeyError, TypeError): pass
-        try: self.mediaList = self.json["mediaList"]
-        except (KeyError, TypeError): pass
-        try: self.description = self.json["content"]
-        except (KeyError, TypeError): pass
-        try: self.isStandaloneAppMonetizationEnabled = self.json["isStandaloneAppMonetizationEnabled"]
-        except (KeyError, TypeError): pass
-        try: self.advancedSettings = self.json["advancedSettings"]
-        except (KeyError, TypeError): pass
-        try: self.defaultRankingTypeInLeaderboard = self.json["advancedSettings"]["defaultRankingTypeInLeaderboard"]
-        except (KeyError, TypeError): pass
-        try: self.frontPageLayout = self.json["advancedSettings"]["frontPageLayout"]
-        except (KeyError, TypeError): pass
-        try: self.hasPendingReviewRequest = self.json["advancedSettings"]["hasPendingReviewRequest"]
-        except (KeyError, TypeError): pass
-        try: self.welcomeMessageEnabled = self.json["advancedSettings"]["welcomeMessageEnabled"]
-        except (KeyError, TypeError): pass
-        try: self.welcomeMessage = self.json["advancedSettings"]["welcomeMessageText"]
-        except (KeyError, TypeError): pass
-        try: self.pollMinFullBarVoteCount = self.json["advancedSettings"]["pollMinFullBarVoteCount"]
-        except (KeyError, TypeError): pass
-        try: self.catalogEnabled = self.json["advancedSettings"]["catalogEnabled"]
-        except (KeyError, TypeError): pass
-        try: self.leaderboardStyle = self.json["advancedSettings"]["leaderboardStyle"]
-        except (KeyError, TypeError): pass
-        try: self.facebookAppIdList = self.json["advancedSettings"]["facebookAppIdList"]
-        except (KeyError, TypeError): pass
-        try: self.newsfeedPages = self.json["advancedSettings"]["newsfeedPages"]
-        except (KeyError, TypeError): pass
-        try: self.joinedBaselineCollectionIdList = self.json["advancedSettings"]["joinedBaselineCollectionIdList"]
-        except (KeyError, TypeError): pass
-        try: self.activeInfo = self.json["activeInfo"]
-        except (KeyError, TypeError): pass
-        try: self.configuration = self.json["configuration"]
-        except (KeyError, TypeError): pass
-        try: self.extensions = self.json["extensions"]
-        except (KeyError, TypeError): pass
-        try: self.nameAliases = self.json["extensions"]["communityNameAliases"]
-        except (KeyError, TypeError): pass
-        try: self.templateId = self.json["templateId"]
-        except (KeyError, TypeError): pass
-        try: self.promotionalMediaList = self.json["promotionalMediaList"]
-        except (KeyError, TypeError): pass
-
-        return self
+        return self.schema.parse(self)
 
 class CommunityList:
     def __init__(self, data):
-        _agent, _rankingTable = [], []
-
         self.json = data
 
-        for y in data:
-            try: _agent.append(y["agent"])
-            except (KeyError, TypeError): _agent.append(None)
-            try: _rankingTable.append(RankingTableList(y["advancedSettings"]["rankingTable"]).RankingTableList)
-            except (KeyError, TypeError): _rankingTable.append(None)
-
-        self.agent: UserProfileList = UserProfileList(_agent).UserProfileList
-        self.rankingTable = _rankingTable
         self.usersCount = []
         self.createdTime = []
         self.aminoId = []
@@ -1331,120 +1197,59 @@ class CommunityList:
         self.themeColor = []
         self.themeHash = []
         self.themeVersion = []
-        self.themeUrl = []
-        self.themeHomePageAppearance = []
-        self.themeLeftSidePanelTop = []
-        self.themeLeftSidePanelBottom = []
-        self.themeLeftSidePanelColor = []
-        self.customList = []
-
-    @property
-    def CommunityList(self):
-        for x in self.json:
-            try: self.name.append(x["name"])
-            except (KeyError, TypeError): self.name.append(None)
-            try: self.usersCount.append(x["membersCount"])
-            except (KeyError, TypeError): self.usersCount.append(None)
-            try: self.createdTime.append(x["createdTime"])
-            except (KeyError, TypeError): self.createdTime.append(None)
-            try: self.aminoId.append(x["endpoint"])
-            except (KeyError, TypeError): self.aminoId.append(None)
-            try: self.icon.append(x["icon"])
-            except (KeyError, TypeError): self.icon.append(None)
-            try: self.link.append(x["link"])
-            except (KeyError, TypeError): self.link.append(None)
-            try: self.comId.append(x["ndcId"])
-            except (KeyError, TypeError): self.comId.append(None)
-            try: self.modifiedTime.append(x["modifiedTime"])
-            except (KeyError, TypeError): self.modifiedTime.append(None)
-            try: self.status.append(x["status"])
-            except (KeyError, TypeError): self.status.append(None)
-            try: self.joinType.append(x["joinType"])
-            except (KeyError, TypeError): self.joinType.append(None)
-            try: self.primaryLanguage.append(x["primaryLanguage"])
-            except (KeyError, TypeError): self.primaryLanguage.append(None)
-            try: self.heat.append(x["communityHeat"])
-            except (KeyError, TypeError): self.heat.append(None)
-            try: self.userAddedTopicList.append(x["userAddedTopicList"])
-            except (KeyError, TypeError): self.userAddedTopicList.append(None)
-            try: self.probationStatus.append(x["probationStatus"])
-            except (KeyError, TypeError): self.probationStatus.append(None)
-            try: self.listedStatus.append(x["listedStatus"])
-            except (KeyError, TypeError): self.listedStatus.append(None)
-            try: self.themePack.append(x["themePack"])
-            except (KeyError, TypeError): self.themePack.append(None)
-            try: self.tagline.append(x["tagline"])
-            except (KeyError, TypeError): self.tagline.append(None)
-            try: self.searchable.append(x["searchable"])
-            except (KeyError, TypeError): self.searchable.append(None)
-            try: self.isStandaloneAppDeprecated.append(x["isStandaloneAppDeprecated"])
-            except (KeyError, TypeError): self.isStandaloneAppDeprecated.append(None)
-            try: self.influencerList.append(x["influencerList"])
-            except (KeyError, TypeError): self.influencerList.append(None)
-            try: self.keywords.append(x["keywords"])
-            except (KeyError, TypeError): self.keywords.append(None)
-            try: self.mediaList.append(x["mediaList"])
-            except (KeyError, TypeError): self.mediaList.append(None)
-            try: self.description.append(x["content"])
-            except (KeyError, TypeError): self.description.append(None)
-            try: self.isStandaloneAppMonetizationEnabled.append(x["isStandaloneAppMonetizationEnabled"])
-            except (KeyError, TypeError): self.isStandaloneAppMonetizationEnabled.append(None)
-            try: self.advancedSettings.append(x["advancedSettings"])
-            except (KeyError, TypeError): self.advancedSettings.append(None)
-            try: self.defaultRankingTypeInLeaderboard.append(x["advancedSettings"]["defaultRankingTypeInLeaderboard"])
-            except (KeyError, TypeError): self.defaultRankingTypeInLeaderboard.append(None)
-            try: self.frontPageLayout.append(x["advancedSettings"]["frontPageLayout"])
-            except (KeyError, TypeError): self.frontPageLayout.append(None)
-            try: self.hasPendingReviewRequest.append(x["advancedSettings"]["hasPendingReviewRequest"])
-            except (KeyError, TypeError): self.hasPendingReviewRequest.append(None)
-            try: self.welcomeMessageEnabled.append(x["advancedSettings"]["welcomeMessageEnabled"])
-            except (KeyError, TypeError): self.welcomeMessageEnabled.append(None)
-            try: self.welcomeMessage.append(x["advancedSettings"]["welcomeMessageText"])
-            except (KeyError, TypeError): self.welcomeMessage.append(None)
-            try: self.pollMinFullBarVoteCount.append(x["advancedSettings"]["pollMinFullBarVoteCount"])
-            except (KeyError, TypeError): self.pollMinFullBarVoteCount.append(None)
-            try: self.catalogEnabled.append(x["advancedSettings"]["catalogEnabled"])
-            except (KeyError, TypeError): self.catalogEnabled.append(None)
-            try: self.leaderboardStyle.append(x["advancedSettings"]["leaderboardStyle"])
-            except (KeyError, TypeError): self.leaderboardStyle.append(None)
-            try: self.facebookAppIdList.append(x["advancedSettings"]["facebookAppIdList"])
-            except (KeyError, TypeError): self.facebookAppIdList.append(None)
-            try: self.newsfeedPages.append(x["advancedSettings"]["newsfeedPages"])
-            except (KeyError, TypeError): self.newsfeedPages.append(None)
-            try: self.joinedBaselineCollectionIdList.append(x["advancedSettings"]["joinedBaselineCollectionIdList"])
-            except (KeyError, TypeError): self.joinedBaselineCollectionIdList.append(None)
-            try: self.activeInfo.append(x["activeInfo"])
-            except (KeyError, TypeError): self.activeInfo.append(None)
-            try: self.configuration.append(x["configuration"])
-            except (KeyError, TypeError): self.configuration.append(None)
-            try: self.extensions.append(x["extensions"])
-            except (KeyError, TypeError): self.extensions.append(None)
-            try: self.nameAliases.append(x["extensions"]["communityNameAliases"])
-            except (KeyError, TypeError): self.nameAliases.append(None)
-            try: self.templateId.append(x["templateId"])
-            except (KeyError, TypeError): self.templateId.append(None)
-            try: self.promotionalMediaList.append(x["promotionalMediaList"])
-            except (KeyError, TypeError): self.promotionalMediaList.append(None)
-            try: self.themeColor.append(x["themePack"]["themeColor"])
-            except (KeyError, TypeError): self.themeColor.append(None)
-            try: self.themeHash.append(x["themePack"]["themePackHash"])
-            except (KeyError, TypeError): self.themeHash.append(None)
-            try: self.themeVersion.append(x["themePack"]["themePackRevision"])
-            except (KeyError, TypeError): self.themeVersion.append(None)
-            try: self.themeUrl.append(x["themePack"]["themePackUrl"])
-            except (KeyError, TypeError): self.themeUrl.append(None)
-            try: self.themeHomePageAppearance.append(x["configuration"]["appearance"]["homePage"]["navigation"])
-            except (KeyError, TypeError): self.themeHomePageAppearance.append(None)
-            try: self.themeLeftSidePanelTop.append(x["configuration"]["appearance"]["leftSidePanel"]["navigation"]["level1"])
-            except (KeyError, TypeError): self.themeLeftSidePanelTop.append(None)
-            try: self.themeLeftSidePanelBottom.append(x["configuration"]["appearance"]["leftSidePanel"]["navigation"]["level2"])
-            except (KeyError, TypeError): self.themeLeftSidePanelBottom.append(None)
-            try: self.themeLeftSidePanelColor.append(x["configuration"]["appearance"]["leftSidePanel"]["style"]["iconColor"])
-            except (KeyError, TypeError): self.themeLeftSidePanelColor.append(None)
-            try: self.customList.append(x["configuration"]["page"]["customList"])
-            except (KeyError, TypeError): self.customList.append(None)
+        self.themeUrl = []
+        self.themeHomePageAppearance = []
+        self.themeLeftSidePanelTop = []
+        self.themeLeftSidePanelBottom = []
+        self.themeLeftSidePanelColor = []
+        self.customList = []
 
-        return self
+    @lazy
+    def agent(self) -> "UserProfileList":
+        return profile_column(self.json, "agent")
+
+    @lazy
+    def rankingTable(self) -> list:
+        return nested_column(RankingTableList, self.json, "advancedSettings", "rankingTable")
+
+    def rows(self):
+        """
+        Items of the list as :class:`CommunityRecord` rows, reading the json instead of filling the columns.
+
+        **Returns**
+            - **Success** : :class:`Rows`
+        """
+        return Rows(self.json, CommunityRecord)
+
+    def to_arrow(self, fields: list = None):
+        """
+        Columns of the list as an Arrow table, read from its json. Needs ``pyarrow``.
+
+        **Parameters**
+            - *fields* : Names of the fields to export, all of them by default.
+
+        **Returns**
+            - **Success** : ``pyarrow.Table``, see :func:`to_arrow <amino.lib.util.columnar.to_arrow>`.
+        """
+        from .columnar import to_arrow
+        return to_arrow(self.json, Community.schema, fields)
+
+    def to_numpy(self, fields: list = None) -> dict:
+        """
+        Columns of the list as NumPy arrays, read from its json. Needs ``numpy``.
+
+        **Parameters**
+            - *fields* : Names of the fields to export, all of them by default.
+
+        **Returns**
+            - **Success** : Dict of ``numpy.ndarray`` by field, see :func:`to_numpy <amino.lib.util.columnar.to_numpy>`.
+        """
+        from .columnar import to_numpy
+        return to_numpy(self.json, Community.schema, fields)
+
+    @property
+    def CommunityList(self):
+        return Community.schema.parse_columns(self)
 
 class VisitorsList:
     def __init__(self, data):
@@ -1488,15 +1293,8 @@ class VisitorsList:
 
 class CommentList:
     def __init__(self, data):
-        _author = []
-
         self.json = data
 
-        for y in data:
-            try: _author.append(y["author"])
-            except (KeyError, TypeError): _author.append(None)
-
-        self.author: UserProfileList = UserProfileList(_author).UserProfileList
         self.votesSum = []
         self.votedValue = []
         self.mediaList = []
@@ -1512,6 +1310,10 @@ class CommentList:
         self.subcommentsCount = []
         self.type = []
 
+    @lazy
+    def author(self) -> "UserProfileList":
+        return profile_column(self.json, "author")
+
     @property
     def CommentList(self):
         for x in self.json:
@@ -2004,14 +1806,54 @@ class TippedUsersSummary:
         return self
 
 class Thread:
+    schema = Schema({
+        "userAddedTopicList": field("userAddedTopicList"),
+        "membersQuota": field("membersQuota"),
+        "chatId": field("threadId"),
+        "keywords": field("keywords"),
+        "membersCount": field("membersCount"),
+        "isPinned": field("isPinned"),
+        "title": field("title"),
+        "membershipStatus": field("membershipStatus"),
+        "content": field("content"),
+        "needHidden": field("needHidden"),
+        "alertOption": field("alertOption"),
+        "lastReadTime": field("lastReadTime"),
+        "type": field("type"),
+        "status": field("status"),
+        "publishToGlobal": field("publishToGlobal"),
+        "modifiedTime": field("modifiedTime"),
+        "condition": field("condition"),
+        "icon": field("icon"),
+        "latestActivityTime": field("latestActivityTime"),
+        "comId": field("ndcId"),
+        "createdTime": field("createdTime"),
+        "extensions": field("extensions"),
+        "viewOnly": field("extensions", "viewOnly"),
+        "coHosts": field("extensions", "coHost"),
+        "membersCanInvite": field("extensions", "membersCanInvite"),
+        "language": field("extensions", "language"),
+        "announcement": field("extensions", "announcement"),
+        "backgroundImage": field("extensions", "bm", 1),
+        "lastMembersSummaryUpdateTime": field("extensions", "lastMembersSummaryUpdateTime"),
+        "channelType": field("extensions", "channelType"),
+        "creatorId": field("extensions", "creatorUid"),
+        "bannedUsers": field("extensions", "bannedMemberUidList"),
+        "visibility": field("extensions", "visibility"),
+        "fansOnly": field("extensions", "fansOnly"),
+        "pinAnnouncement": field("extensions", "pinAnnouncement"),
+        "vvChatJoinType": field("extensions", "vvChatJoinType"),
+        "disabledTime": field("extensions", "__disabledTime__"),
+        "tippingPermStatus": field("extensions", "tippingPermStatus"),
+        "screeningRoomHostId": field("extensions", "screeningRoomHostUid"),
+        "screeningRoomPermission": field("extensions", "screeningRoomPermission", "action"),
+        "organizerTransferCreatedTime": field("extensions", "organizerTransferRequest", "createdTime"),
+        "organizerTransferId": field("extensions", "organizerTransferRequest", "requestId")
+    })
+
     def __init__(self, data):
         self.json = data
 
-        try: self.author: UserProfile = UserProfile(data["author"]).UserProfile
-        except (KeyError, TypeError): self.author: UserProfile = UserProfile([])
-        try: self.membersSummary: UserProfileList = UserProfileList(data["membersSummary"]).UserProfileList
-        except (KeyError, TypeError): self.membersSummary: UserProfileList = UserProfileList([])
-
         self.userAddedTopicList = None
         self.membersQuota = None
         self.chatId = None
@@ -2055,110 +1897,23 @@ class Thread:
         self.organizerTransferCreatedTime = None
         self.organizerTransferId = None
 
+    @lazy
+    def author(self) -> "UserProfile":
+        try: return profile(self.json["author"])
+        except (KeyError, TypeError): return UserProfile([])
+
+    @lazy
+    def membersSummary(self) -> "UserProfileList":
+        try: return UserProfileList(self.json["membersSummary"]).UserProfileList
+        except (KeyError, TypeError): return UserProfileList([])
+
     @property
     def Thread(self):
-        try: self.userAddedTopicList = self.json["userAddedTopicList"]
-        except (KeyError, TypeError): pass
-        try: self.membersQuota = self.json["membersQuota"]
-        except (KeyError, TypeError): pass
-        try: self.chatId = self.json["threadId"]
-        except (KeyError, TypeError): pass
-        try: self.keywords = self.json["keywords"]
-        except (KeyError, TypeError): pass
-        try: self.membersCount = self.json["membersCount"]
-        except (KeyError, TypeError): pass
-        try: self.isPinned = self.json["isPinned"]
-        except (KeyError, TypeError): pass
-        try: self.title = self.json["title"]
-        except (KeyError, TypeError): pass
-        try: self.membershipStatus = self.json["membershipStatus"]
-        except (KeyError, TypeError): pass
-        try: self.content = self.json["content"]
-        except (KeyError, TypeError): pass
-        try: self.needHidden = self.json["needHidden"]
-        except (KeyError, TypeError): pass
-        try: self.alertOption = self.json["alertOption"]
-        except (KeyError, TypeError): pass
-        try: self.lastReadTime = self.json["lastReadTime"]
-        except (KeyError, TypeError): pass
-        try: self.type = self.json["type"]
-        except (KeyError, TypeError): pass
-        try: self.status = self.json["status"]
-        except (KeyError, TypeError): pass
-        try: self.publishToGlobal = self.json["publishToGlobal"]
-        except (KeyError, TypeError): pass
-        try: self.modifiedTime = self.json["modifiedTime"]
-        except (KeyError, TypeError): pass
-        try: self.condition = self.json["condition"]
-        except (KeyError, TypeError): pass
-        try: self.icon = self.json["icon"]
-        except (KeyError, TypeError): pass
-        try: self.latestActivityTime = self.json["latestActivityTime"]
-        except (KeyError, TypeError): pass
-        try: self.comId = self.json["ndcId"]
-        except (KeyError, TypeError): pass
-        try: self.createdTime = self.json["createdTime"]
-        except (KeyError, TypeError): pass
-        try: self.extensions = self.json["extensions"]
-        except (KeyError, TypeError): pass
-        try: self.viewOnly = self.json["extensions"]["viewOnly"]
-        except (KeyError, TypeError): pass
-        try: self.coHosts = self.json["extensions"]["coHost"]
-        except (KeyError, TypeError): pass
-        try: self.membersCanInvite = self.json["extensions"]["membersCanInvite"]
-        except (KeyError, TypeError): pass
-        try: self.language = self.json["extensions"]["language"]
-        except (KeyError, TypeError): pass
-        try: self.announcement = self.json["extensions"]["announcement"]
-        except (KeyError, TypeError): pass
-        try: self.backgroundImage = self.json["extensions"]["bm"][1]
-        except (KeyError, TypeError, IndexError): pass
-        try: self.lastMembersSummaryUpdateTime = self.json["extensions"]["lastMembersSummaryUpdateTime"]
-        except (KeyError, TypeError): pass
-        try: self.channelType = self.json["extensions"]["channelType"]
-        except (KeyError, TypeError): pass
-        try: self.creatorId = self.json["extensions"]["creatorUid"]
-        except (KeyError, TypeError): pass
-        try: self.bannedUsers = self.json["extensions"]["bannedMemberUidList"]
-        except (KeyError, TypeError): pass
-        try: self.visibility = self.json["extensions"]["visibility"]
-        except (KeyError, TypeError): pass
-        try: self.fansOnly = self.json["extensions"]["fansOnly"]
-        except (KeyError, TypeError): pass
-        try: self.pinAnnouncement = self.json["extensions"]["pinAnnouncement"]
-        except (KeyError, TypeError): pass
-        try: self.vvChatJoinType = self.json["extensions"]["vvChatJoinType"]
-        except (KeyError, TypeError): pass
-        try: self.disabledTime = self.json["extensions"]["__disabledTime__"]
-        except (KeyError, TypeError): pass
-        try: self.tippingPermStatus = self.json["extensions"]["tippingPermStatus"]
-        except (KeyError, TypeError): pass
-        try: self.screeningRoomHostId = self.json["extensions"]["screeningRoomHostUid"]
-        except (KeyError, TypeError): pass
-        try: self.screeningRoomPermission = self.json["extensions"]["screeningRoomPermission"]["action"]
-        except (KeyError, TypeError): pass
-        try: self.organizerTransferCreatedTime = self.json["extensions"]["organizerTransferRequest"]["createdTime"]
-        except (KeyError, TypeError): pass
-        try: self.organizerTransferId = self.json["extensions"]["organizerTransferRequest"]["requestId"]
-        except (KeyError, TypeError): pass
-
-        return self
+        return self.schema.parse(self)
 
 class ThreadList:
     def __init__(self, data):
-        _author, _membersSummary = [], []
-
         self.json = data
-
-        for y in data:
-            try: _author.append(y["author"])
-            except (KeyError, TypeError): _author.append(None)
-
-            try: _membersSummary.append(UserProfileList(y["membersSummary"]).UserProfileList)
-            except (KeyError, TypeError): _membersSummary.append(None)
-
-        self.author: UserProfileList = UserProfileList(_author).UserProfileList
-        self.membersSummary = _membersSummary
         self.userAddedTopicList = []
         self.membersQuota = []
         self.chatId = []
@@ -2202,95 +1957,52 @@ class ThreadList:
         self.organizerTransferCreatedTime = []
         self.organizerTransferId = []
 
+    @lazy
+    def author(self) -> "UserProfileList":
+        return profile_column(self.json, "author")
+
+    @lazy
+    def membersSummary(self) -> list:
+        return nested_column(UserProfileList, self.json, "membersSummary")
+
+    def rows(self):
+        """
+        Items of the list as :class:`ThreadRecord` rows, reading the json instead of filling the columns.
+
+        **Returns**
+            - **Success** : :class:`Rows`
+        """
+        return Rows(self.json, ThreadRecord)
+
+    def to_arrow(self, fields: list = None):
+        """
+        Columns of the list as an Arrow table, read from its json. Needs ``pyarrow``.
+
+        **Parameters**
+            - *fields* : Names of the fields to export, all of them by default.
+
+        **Returns**
+            - **Success** : ``pyarrow.Table``, see :func:`to_arrow <amino.lib.util.columnar.to_arrow>`.
+        """
+        from .columnar import to_arrow
+        return to_arrow(self.json, Thread.schema, fields)
+
+    def to_numpy(self, fields: list = None) -> dict:
+        """
+        Columns of the list as NumPy arrays, read from its json. Needs ``numpy``.
+
+        **Parameters**
+            - *fields* : Names of the fields to export, all of them by default.
+
+        **Returns**
+            - **Success** : Dict of ``numpy.ndarray`` by field, see :func:`to_numpy <amino.lib.util.columnar.to_numpy>`.
+        """
+        from .columnar import to_numpy
+        return to_numpy(self.json, Thread.schema, fields)
+
     @property
     def ThreadList(self):
-        for chat in self.json:
-            try: self.userAddedTopicList.append(chat["userAddedTopicList"])
-            except (KeyError, TypeError): self.userAddedTopicList.append(None)
-            try: self.membersQuota.append(chat["membersQuota"])
-            except (KeyError, TypeError): self.membersQuota.append(None)
-            try: self.chatId.append(chat["threadId"])
-            except (KeyError, TypeError): self.chatId.append(None)
-            try: self.keywords.append(chat["keywords"])
-            except (KeyError, TypeError): self.keywords.append(None)
-            try: self.membersCount.append(chat["membersCount"])
-            except (KeyError, TypeError): self.membersCount.append(None)
-            try: self.isPinned.append(chat["isPinned"])
-            except (KeyError, TypeError): self.isPinned.append(None)
-            try: self.title.append(chat["title"])
-            except (KeyError, TypeError): self.title.append(None)
-            try: self.membershipStatus.append(chat["membershipStatus"])
-            except (KeyError, TypeError): self.membershipStatus.append(None)
-            try: self.content.append(chat["content"])
-            except (KeyError, TypeError): self.content.append(None)
-            try: self.needHidden.append(chat["needHidden"])
-            except (KeyError, TypeError): self.needHidden.append(None)
-            try: self.alertOption.append(chat["alertOption"])
-            except (KeyError, TypeError): self.alertOption.append(None)
-            try: self.lastReadTime.append(chat["lastReadTime"])
-            except (KeyError, TypeError): self.lastReadTime.append(None)
-            try: self.type.append(chat["type"])
-            except (KeyError, TypeError): self.type.append(None)
-            try: self.status.append(chat["status"])
-            except (KeyError, TypeError): self.status.append(None)
-            try: self.publishToGlobal.append(chat["publishToGlobal"])
-            except (KeyError, TypeError): self.publishToGlobal.append(None)
-            try: self.modifiedTime.append(chat["modifiedTime"])
-            except (KeyError, TypeError): self.modifiedTime.append(None)
-            try: self.condition.append(chat["condition"])
-            except (KeyError, TypeError): self.condition.append(None)
-            try: self.icon.append(chat["icon"])
-            except (KeyError, TypeError): self.icon.append(None)
-            try: self.latestActivityTime.append(chat["latestActivityTime"])
-            except (KeyError, TypeError): self.latestActivityTime.append(None)
-            try: self.comId.append(chat["ndcId"])
-            except (KeyError, TypeError): self.comId.append(None)
-            try: self.createdTime.append(chat["createdTime"])
-            except (KeyError, TypeError): self.createdTime.append(None)
-            try:  self.extensions.append(chat["extensions"])
-            except (KeyError, TypeError): self.extensions.append(None)
-            try:  self.viewOnly.append(chat["extensions"]["viewOnly"])
-            except (KeyError, TypeError): self.viewOnly.append(None)
-            try:  self.coHosts.append(chat["extensions"]["coHost"])
-            except (KeyError, TypeError): self.coHosts.append(None)
-            try:  self.membersCanInvite.append(chat["extensions"]["membersCanInvite"])
-            except (KeyError, TypeError): self.membersCanInvite.append(None)
-            try:  self.language.append(chat["extensions"]["language"])
-            except (KeyError, TypeError): self.language.append(None)
-            try:  self.announcement.append(chat["extensions"]["announcement"])
-            except (KeyError, TypeError): self.announcement.append(None)
-            try:  self.backgroundImage.append(chat["extensions"]["bm"][1])
-            except (KeyError, TypeError, IndexError): self.backgroundImage.append(None)
-            try:  self.lastMembersSummaryUpdateTime.append(chat["extensions"]["lastMembersSummaryUpdateTime"])
-            except (KeyError, TypeError): self.lastMembersSummaryUpdateTime.append(None)
-            try:  self.channelType.append(chat["extensions"]["channelType"])
-            except (KeyError, TypeError): self.channelType.append(None)
-            try:  self.creatorId.append(chat["extensions"]["creatorUid"])
-            except (KeyError, TypeError): self.creatorId.append(None)
-            try:  self.bannedUsers.append(chat["extensions"]["bannedMemberUidList"])
-            except (KeyError, TypeError): self.bannedUsers.append(None)
-            try:  self.visibility.append(chat["extensions"]["visibility"])
-            except (KeyError, TypeError): self.visibility.append(None)
-            try:  self.fansOnly.append(chat["extensions"]["fansOnly"])
-            except (KeyError, TypeError): self.fansOnly.append(None)
-            try:  self.pinAnnouncement.append(chat["extensions"]["pinAnnouncement"])
-            except (KeyError, TypeError): self.pinAnnouncement.append(None)
-            try:  self.vvChatJoinType.append(chat["extensions"]["vvChatJoinType"])
-            except (KeyError, TypeError): self.vvChatJoinType.append(None)
-            try:  self.tippingPermStatus.append(chat["extensions"]["tippingPermStatus"])
-            except (KeyError, TypeError): self.tippingPermStatus.append(None)
-            try:  self.screeningRoomHostId.append(chat["extensions"]["screeningRoomHostUid"])
-            except (KeyError, TypeError): self.screeningRoomHostId.append(None)
-            try:  self.disabledTime.append(chat["extensions"]["__disabledTime__"])
-            except (KeyError, TypeError): self.disabledTime.append(None)
-            try:  self.screeningRoomPermission.append(chat["extensions"]["screeningRoomPermission"]["action"])
-            except (KeyError, TypeError): self.screeningRoomPermission.append(None)
-            try:  self.organizerTransferCreatedTime.append(chat["extensions"]["organizerTransferRequest"]["createdTime"])
-            except (KeyError, TypeError): self.organizerTransferCreatedTime.append(None)
-            try:  self.organizerTransferId.append(chat["extensions"]["organizerTransferRequest"]["requestId"])
-            except (KeyError, TypeError): self.organizerTransferId.append(None)
-
-        return self
+        return Thread.schema.parse_columns(self)
 
 class Sticker:
     def __init__(self, data):
@@ -2593,14 +2305,36 @@ class StickerCollectionList:
         return self
 
 class Message:
+    schema = Schema({
+        "content": field("content"),
+        "includedInSummary": field("includedInSummary"),
+        "isHidden": field("isHidden"),
+        "messageId": field("messageId"),
+        "messageType": field("messageType"),
+        "mediaType": field("mediaType"),
+        "chatBubbleId": field("chatBubbleId"),
+        "clientRefId": field("clientRefId"),
+        "chatId": field("threadId"),
+        "createdTime": field("createdTime"),
+        "chatBubbleVersion": field("chatBubbleVersion"),
+        "type": field("type"),
+        "mediaValue": field("mediaValue"),
+        "extensions": field("extensions"),
+        "duration": field("extensions", "duration"),
+        "videoDuration": field("extensions", "videoExtensions", "duration"),
+        "videoHeight": field("extensions", "videoExtensions", "height"),
+        "videoWidth": field("extensions", "videoExtensions", "width"),
+        "videoCoverImage": field("extensions", "videoExtensions", "coverImage"),
+        "videoExtensions": field("extensions", "videoExtensions"),
+        "originalStickerId": field("extensions", "originalStickerId"),
+        # mentions fixed by enchart
+        "mentionUserIds": lambda data: [m["uid"] for m in data["extensions"]["mentionedArray"]],
+        "tippingCoins": field("extensions", "tippingCoins")
+    })
+
     def __init__(self, data):
         self.json = data
 
-        try: self.author: UserProfile = UserProfile(data["author"]).UserProfile
-        except (KeyError, TypeError): self.author: UserProfile = UserProfile([])
-        try: self.sticker: Sticker = Sticker(data["extensions"]["sticker"]).Sticker
-        except (KeyError, TypeError): self.sticker: Sticker = Sticker([])
-
         self.content = None
         self.includedInSummary = None
         self.isHidden = None
@@ -2625,72 +2359,39 @@ class Message:
         self.mentionUserIds = None
         self.tippingCoins = None
 
+    @lazy
+    def author(self) -> "UserProfile":
+        try: return profile(self.json["author"])
+        except (KeyError, TypeError): return UserProfile([])
+
+    @lazy
+    def sticker(self) -> "Sticker":
+        try: return Sticker(self.json["extensions"]["sticker"]).Sticker
+        except (KeyError, TypeError): return Sticker([])
+
     @property
     def Message(self):
-        try: self.content = self.json["content"]
-        except (KeyError, TypeError): pass
-        try: self.includedInSummary = self.json["includedInSummary"]
-        except (KeyError, TypeError): pass
-        try: self.isHidden = self.json["isHidden"]
-        except (KeyError, TypeError): pass
-        try: self.messageId = self.json["messageId"]
-        except (KeyError, TypeError): pass
-        try: self.messageType = self.json["messageType"]
-        except (KeyError, TypeError): pass
-        try: self.mediaType = self.json["mediaType"]
-        except (KeyError, TypeError): pass
-        try: self.chatBubbleId = self.json["chatBubbleId"]
-        except (KeyError, TypeError): pass
-        try: self.clientRefId = self.json["clientRefId"]
-        except (KeyError, TypeError): pass
-        try: self.chatId = self.json["threadId"]
-        except (KeyError, TypeError): pass
-        try: self.createdTime = self.json["createdTime"]
-        except (KeyError, TypeError): pass
-        try: self.chatBubbleVersion = self.json["chatBubbleVersion"]
-        except (KeyError, TypeError): pass
-        try: self.type = self.json["type"]
-        except (KeyError, TypeError): pass
-        try: self.mediaValue = self.json["mediaValue"]
-        except (KeyError, TypeError): pass
-        try: self.extensions = self.json["extensions"]
-        except (KeyError, TypeError): pass
-        try: self.duration = self.json["extensions"]["duration"]
-        except (KeyError, TypeError): pass
-        try: self.videoDuration = self.json["extensions"]["videoExtensions"]["duration"]
-        except (KeyError, TypeError): pass
-        try: self.videoHeight = self.json["extensions"]["videoExtensions"]["height"]
-        except (KeyError, TypeError): pass
-        try: self.videoWidth = self.json["extensions"]["videoExtensions"]["width"]
-        except (KeyError, TypeError): pass
-        try: self.videoCoverImage = self.json["extensions"]["videoExtensions"]["coverImage"]
-        except (KeyError, TypeError): pass
-        try: self.originalStickerId = self.json["extensions"]["originalStickerId"]
-        except (KeyError, TypeError): pass
-        # mentions fixed by enchart
-        try: self.mentionUserIds = [m["uid"] for m in self.json["extensions"]["mentionedArray"]]
-        except (KeyError, TypeError): pass
-        try: self.tippingCoins = self.json["extensions"]["tippingCoins"]
-        except (KeyError, TypeError): pass
+        return self.schema.parse(self)
+
+class LazyMessage(LazyObject, Message):
+    """
+    :class:`Message` reading each field from its json on first access, used for the socket events.
+    """
+    fields = {
+        **Message.schema.fields,
+        "author": nested(UserProfile, "author"),
+        "sticker": nested(Sticker, "extensions", "sticker")
+    }
 
+    @property
+    def Message(self):
         return self
 
 class MessageList:
     def __init__(self, data, nextPageToken = None, prevPageToken = None):
-        _author, _sticker = [], []
-
         self.json = data
         self.nextPageToken = nextPageToken
         self.prevPageToken = prevPageToken
-
-        for y in data:
-            try: _author.append(y["author"])
-            except (KeyError, TypeError): _author.append(None)
-            try: _sticker.append(y["extensions"]["sticker"])
-            except (KeyError, TypeError): _sticker.append(None)
-
-        self.author: UserProfileList = UserProfileList(_author).UserProfileList
-        self.sticker: StickerList = StickerList(_sticker).StickerList
         self.content = []
         self.includedInSummary = []
         self.isHidden = []
@@ -2715,57 +2416,52 @@ class MessageList:
         self.videoCoverImage = []
         self.tippingCoins = []
 
+    @lazy
+    def author(self) -> "UserProfileList":
+        return profile_column(self.json, "author")
+
+    @lazy
+    def sticker(self) -> "StickerList":
+        return StickerList(column(self.json, "extensions", "sticker")).StickerList
+
+    def rows(self):
+        """
+        Items of the list as :class:`MessageRecord` rows, reading the json instead of filling the columns.
+
+        **Returns**
+            - **Success** : :class:`Rows`
+        """
+        return Rows(self.json, MessageRecord)
+
+    def to_arrow(self, fields: list = None):
+        """
+        Columns of the list as an Arrow table, read from its json. Needs ``pyarrow``.
+
+        **Parameters**
+            - *fields* : Names of the fields to export, all of them by default.
+
+        **Returns**
+            - **Success** : ``pyarrow.Table``, see :func:`to_arrow <amino.lib.util.columnar.to_arrow>`.
+        """
+        from .columnar import to_arrow
+        return to_arrow(self.json, Message.schema, fields)
+
+    def to_numpy(self, fields: list = None) -> dict:
+        """
+        Columns of the list as NumPy arrays, read from its json. Needs ``numpy``.
+
+        **Parameters**
+            - *fields* : Names of the fields to export, all of them by default.
+
+        **Returns**
+            - **Success** : Dict of ``numpy.ndarray`` by field, see :func:`to_numpy <amino.lib.util.columnar.to_numpy>`.
+        """
+        from .columnar import to_numpy
+        return to_numpy(self.json, Message.schema, fields)
+
     @property
     def MessageList(self):
-        for x in self.json:
-            try: self.content.append(x["content"])
-            except (KeyError, TypeError): self.content.append(None)
-            try: self.includedInSummary.append(x["includedInSummary"])
-            except (KeyError, TypeError): self.includedInSummary.append(None)
-            try: self.isHidden.append(x["isHidden"])
-            except (KeyError, TypeError): self.isHidden.append(None)
-            try: self.messageId.append(x["messageId"])
-            except (KeyError, TypeError): self.messageId.append(None)
-            try: self.chatBubbleId.append(x["chatBubbleId"])
-            except (KeyError, TypeError): self.chatBubbleId.append(None)
-            try: self.clientRefId.append(x["clientRefId"])
-            except (KeyError, TypeError): self.clientRefId.append(None)
-            try: self.chatId.append(x["threadId"])
-            except (KeyError, TypeError): self.chatId.append(None)
-            try: self.messageType.append(x["messageType"])
-            except (KeyError, TypeError): self.messageType.append(None)
-            try: self.createdTime.append(x["createdTime"])
-            except (KeyError, TypeError): self.createdTime.append(None)
-            try: self.chatBubbleVersion.append(x["chatBubbleVersion"])
-            except (KeyError, TypeError): self.chatBubbleVersion.append(None)
-            try: self.type.append(x["type"])
-            except (KeyError, TypeError): self.type.append(None)
-            try: self.mediaValue.append(x["mediaValue"])
-            except (KeyError, TypeError): self.mediaValue.append(None)
-            try: self.mediaType.append(x["mediaType"])
-            except (KeyError, TypeError): self.mediaType.append(None)
-            try: self.extensions.append(x["extensions"])
-            except (KeyError, TypeError): self.extensions.append(None)
-            try: self.duration.append(x["extensions"]["duration"])
-            except (KeyError, TypeError): self.duration.append(None)
-            try: self.originalStickerId.append(x["extensions"]["originalStickerId"])
-            except (KeyError, TypeError): self.originalStickerId.append(None)
-            try: self.mentionUserIds.append([m["uid"] for m in x["extensions"]["mentionedArray"]])
-            except (KeyError, TypeError): self.mentionUserIds.append(None)
-            try: self.videoExtensions.append(x["extensions"]["videoExtensions"])
-            except (KeyError, TypeError): self.videoExtensions.append(None)
-            try: self.videoDuration.append(x["extensions"]["videoExtensions"]["duration"])
-            except (KeyError, TypeError): self.videoDuration.append(None)
-            try: self.videoHeight.append(x["extensions"]["videoExtensions"]["height"])
-            except (KeyError, TypeError): self.videoHeight.append(None)
-            try: self.videoWidth.append(x["extensions"]["videoExtensions"]["width"])
-            except (KeyError, TypeError): self.videoWidth.append(None)
-            try: self.videoCoverImage.append(x["extensions"]["videoExtensions"]["coverImage"])
-            except (KeyError, TypeError): self.videoCoverImage.append(None)
-            try: self.tippingCoins.append(x["extensions"]["tippingCoins"])
-            except (KeyError, TypeError): self.tippingCoins.append(None)
-
-        return self
+        return Message.schema.parse_columns(self)
 
 class GetMessages:
     def __init__(self, data):
@@ -2862,11 +2558,71 @@ class NotificationList:
 
         return self
 
-class AdminLogList:
+class AdminLog:
     def __init__(self, data):
+        self.json = data
+
+        try: self.author: UserProfile = UserProfile(data["author"]).UserProfile
+        except (KeyError, TypeError): self.author: UserProfile = UserProfile([])
+
+        self.createdTime = None
+        self.objectType = None
+        self.operationName = None
+        self.comId = None
+        self.referTicketId = None
+        self.extData = None
+        self.operationDetail = None
+        self.operationLevel = None
+        self.moderationLevel = None
+        self.operation = None
+        self.objectId = None
+        self.logId = None
+        self.objectUrl = None
+        self.content = None
+        self.value = None
+
+    @property
+    def AdminLog(self):
+        try: self.createdTime = self.json["createdTime"]
+        except (KeyError, TypeError): pass
+        try: self.objectType = self.json["objectType"]
+        except (KeyError, TypeError): pass
+        try: self.operationName = self.json["operationName"]
+        except (KeyError, TypeError): pass
+        try: self.comId = self.json["ndcId"]
+        except (KeyError, TypeError): pass
+        try: self.referTicketId = self.json["referTicketId"]
+        except (KeyError, TypeError): pass
+        try: self.extData = self.json["extData"]
+        except (KeyError, TypeError): pass
+        try: self.content = self.json["extData"]["note"]
+        except (KeyError, TypeError): pass
+        try: self.value = self.json["extData"]["value"]
+        except (KeyError, TypeError): pass
+        try: self.operationDetail = self.json["operationDetail"]
+        except (KeyError, TypeError): pass
+        try: self.operationLevel = self.json["operationLevel"]
+        except (KeyError, TypeError): pass
+        try: self.moderationLevel = self.json["moderationLevel"]
+        except (KeyError, TypeError): pass
+        try: self.operation = self.json["operation"]
+        except (KeyError, TypeError): pass
+        try: self.objectId = self.json["objectId"]
+        except (KeyError, TypeError): pass
+        try: self.logId = self.json["logId"]
+        except (KeyError, TypeError): pass
+        try: self.objectUrl = self.json["objectUrl"]
+        except (KeyError, TypeError): pass
+
+        return self
+
+class AdminLogList:
+    def __init__(self, data, nextPageToken = None, prevPageToken = None):
         _author = []
 
         self.json = data
+        self.nextPageToken = nextPageToken
+        self.prevPageToken = prevPageToken
 
         for y in data:
             try: _author.append(y["author"])
@@ -3367,43 +3123,25 @@ class SharedFolderFileList:
 
         return self
 
-class Event:
-    def __init__(self, data):
-        self.json = data
-        self.comId = None
-        self.alertOption = None
-        self.membershipStatus = None
-        self.actions = None
-        self.target = None
-        self.params = None
-        self.threadType = None
-        self.id = None
-        self.duration = None
-
-        try: self.message: Message = Message(data["chatMessage"]).Message
-        except (KeyError, TypeError): self.message: Message = Message([])
+class Event(LazyObject):
+    """
+    Socket event, reading each field from its json on first access so handlers only pay for what they use.
+    """
+    fields = {
+        "message": nested(LazyMessage, "chatMessage"),
+        "comId": field("ndcId"),
+        "alertOption": field("alertOption"),
+        "membershipStatus": field("membershipStatus"),
+        "actions": field("actions"),
+        "target": field("target"),
+        "params": field("params"),
+        "threadType": field("params", "threadType"),
+        "duration": field("params", "duration"),
+        "id": field("id")
+    }
 
     @property
     def Event(self):
-        try: self.comId = self.json["ndcId"]
-        except (KeyError, TypeError): pass
-        try: self.alertOption = self.json["alertOption"]
-        except (KeyError, TypeError): pass
-        try: self.membershipStatus = self.json["membershipStatus"]
-        except (KeyError, TypeError): pass
-        try: self.actions = self.json["actions"]
-        except (KeyError, TypeError): pass
-        try: self.target = self.json["target"]
-        except (KeyError, TypeError): pass
-        try: self.params = self.json["params"]
-        except (KeyError, TypeError): pass
-        try: self.threadType = self.json["params"]["threadType"]
-        except (KeyError, TypeError): pass
-        try: self.duration = self.json["params"]["duration"]
-        except (KeyError, TypeError): pass
-        try: self.id = self.json["id"]
-        except (KeyError, TypeError): pass
-
         return self
 
 class JoinRequest:
@@ -3819,4 +3557,110 @@ class AvatarFrameList:
             try: self.availableComIds.append(x["availableNdcIds"])
             except (KeyError, TypeError): self.availableComIds.append(None)
 
-        return self
\ No newline at end of file
+        return self
+
+def record_field(extract):
+    def get(self):
+        try: return extract(self.json)
+        except (KeyError, TypeError, IndexError): return None
+
+    return property(get)
+
+class Record:
+    """
+    Base of the row objects of a list, reading each field from the json of their item on every access instead of copying it.
+    ``fields`` maps the name of each attribute to the extractor of its value, missing values are None.
+    """
+    __slots__ = ("json",)
+    fields = {}
+
+    def __init__(self, data):
+        self.json = data
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name, extract in cls.fields.items(): setattr(cls, name, record_field(extract))
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self.json!r:.80}>"
+
+class Rows:
+    """
+    Items of a list as :class:`Record` rows, built when they are read. Only the json of the list is kept.
+
+    **Parameters**
+        - **data** : List of the json of each item.
+        - **record** : :class:`Record` class of the items.
+    """
+    __slots__ = ("json", "record")
+
+    def __init__(self, data, record):
+        self.json = data
+        self.record = record
+
+    def __len__(self):
+        return len(self.json)
+
+    def __iter__(self):
+        return map(self.record, self.json)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice): return Rows(self.json[index], self.record)
+        return self.record(self.json[index])
+
+    def column(self, name: str) -> list:
+        """
+        Values of the field ``name`` of every row.
+        """
+        get = getattr(self.record, name).fget
+        return [get(row) for row in self]
+
+class UserProfileRecord(Record):
+    """
+    Row of a :class:`UserProfileList`.
+    """
+    __slots__ = ()
+    fields = {
+        **UserProfile.schema.fields,
+        "fanClub": nested(FanClubList, "fanClubList")
+    }
+
+class MessageRecord(Record):
+    """
+    Row of a :class:`MessageList`.
+    """
+    __slots__ = ()
+    fields = LazyMessage.fields
+
+class ThreadRecord(Record):
+    """
+    Row of a :class:`ThreadList`.
+    """
+    __slots__ = ()
+    fields = {
+        **Thread.schema.fields,
+        "author": nested(UserProfile, "author"),
+        "membersSummary": nested(UserProfileList, "membersSummary")
+    }
+
+class BlogRecord(Record):
+    """
+    Row of a :class:`BlogList`.
+    """
+    __slots__ = ()
+    fields = {
+        **Blog.schema.fields,
+        "author": nested(UserProfile, "author"),
+        "quizQuestionList": nested(QuizQuestionList, "quizQuestionList")
+    }
+
+class CommunityRecord(Record):
+    """
+    Row of a :class:`CommunityList`.
+    """
+    __slots__ = ()
+    fields = {
+        **Community.schema.fields,
+        "agent": nested(UserProfile, "agent"),
+        "rankingTable": nested(RankingTableList, "advancedSettings", "rankingTable")
+    }
\ No newline at end of file
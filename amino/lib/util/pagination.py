@@ -0,0 +1,217 @@
+from datetime import datetime
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from . import objects
+
+# asyncio is imported inside the async generators, so importing the library for the sync Client does not load it.
+
+__all__ = ["iter_pages", "aiter_pages", "paginate", "apaginate", "flatten", "records", "paginate_offsets", "apaginate_offsets"]
+
+
+def parse_time(value) -> float:
+    """
+    Convert an API ``createdTime`` (``2021-01-01T00:00:00Z``), a :class:`datetime.datetime` or a unix timestamp to a unix timestamp.
+    """
+    if isinstance(value, datetime): return value.timestamp()
+    if isinstance(value, str): return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    return value
+
+def stop_reached(item, idKey: str, untilTime: float = None, untilId: str = None) -> bool:
+    if untilId is not None and getattr(item, idKey) == untilId: return True
+    if untilTime is not None and item.createdTime is not None and parse_time(item.createdTime) < untilTime: return True
+    return False
+
+def iter_pages(fetch, pageToken: str = None, prefetch: bool = True):
+    """
+    Yield the pages returned by ``fetch(pageToken=pageToken)``, following their ``nextPageToken``.
+
+    With ``prefetch`` the next page is requested in the background as soon as the current one arrives.
+    """
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    future = None
+
+    try:
+        page = fetch(pageToken=pageToken)
+
+        while True:
+            pageToken = page.nextPageToken
+            if executor is not None and pageToken: future = executor.submit(fetch, pageToken=pageToken)
+
+            yield page
+
+            if not pageToken: return
+            if future is not None: page = future.result()
+            else: page = fetch(pageToken=pageToken)
+
+    finally:
+        if executor is not None: executor.shutdown(wait=False)
+
+async def aiter_pages(fetch, pageToken: str = None, prefetch: bool = True):
+    """
+    Asyncio version of :func:`iter_pages`, ``fetch`` is a coroutine function.
+    """
+    import asyncio
+
+    task = None
+
+    try:
+        page = await fetch(pageToken=pageToken)
+
+        while True:
+            pageToken = page.nextPageToken
+            if prefetch and pageToken: task = asyncio.ensure_future(fetch(pageToken=pageToken))
+
+            yield page
+
+            if not pageToken: return
+            if task is not None: page = await task
+            else: page = await fetch(pageToken=pageToken)
+
+            task = None
+
+    finally:
+        if task is not None: task.cancel()
+
+def paginate(fetch, parse, idKey: str, pageToken: str = None, untilTime = None, untilId: str = None, maxItems: int = None, prefetch: bool = True):
+    """
+    Yield every item of the pages returned by ``fetch(pageToken=pageToken)``, newest first.
+
+    **Parameters**
+        - **fetch** : Function returning a page from its page token.
+        - **parse** : Function returning the objects of a page.
+        - **idKey** : Attribute holding the ID of an object.
+        - *pageToken* : Page Token to start from.
+        - *untilTime* : Stop at the first object created before this unix timestamp, :class:`datetime.datetime` or ``createdTime``.
+        - *untilId* : Stop at the object with this ID, without yielding it.
+        - *maxItems* : Maximum number of objects to yield.
+        - *prefetch* : Request the next page while the current one is consumed.
+    """
+    if untilTime is not None: untilTime = parse_time(untilTime)
+    if maxItems is not None and maxItems <= 0: return
+    pages = iter_pages(fetch, pageToken, prefetch)
+    count = 0
+
+    try:
+        for page in pages:
+            items = parse(page)
+            if not items: return
+
+            for item in items:
+                if stop_reached(item, idKey, untilTime, untilId): return
+
+                yield item
+                count += 1
+                if maxItems is not None and count >= maxItems: return
+
+    finally:
+        pages.close()
+
+async def apaginate(fetch, parse, idKey: str, pageToken: str = None, untilTime = None, untilId: str = None, maxItems: int = None, prefetch: bool = True):
+    """
+    Asyncio version of :func:`paginate`, ``fetch`` is a coroutine function.
+    """
+    if untilTime is not None: untilTime = parse_time(untilTime)
+    if maxItems is not None and maxItems <= 0: return
+    pages = aiter_pages(fetch, pageToken, prefetch)
+    count = 0
+
+    try:
+        async for page in pages:
+            items = parse(page)
+            if not items: return
+
+            for item in items:
+                if stop_reached(item, idKey, untilTime, untilId): return
+
+                yield item
+                count += 1
+                if maxItems is not None and count >= maxItems: return
+
+    finally:
+        await pages.aclose()
+
+def flatten(page) -> list:
+    """
+    Objects of a list returned by the API.
+    ``XList`` becomes a list of ``X`` when the class exists, raw dicts otherwise, and a :class:`UserProfileCountList <amino.lib.util.objects.UserProfileCountList>` its profiles.
+    """
+    if isinstance(page, objects.UserProfileCountList): page = page.profile
+
+    single = getattr(objects, type(page).__name__[:-4], None) if type(page).__name__.endswith("List") else None
+    if single is None: return list(page.json)
+    return [getattr(single(x), single.__name__) for x in page.json]
+
+def records(page):
+    """
+    Rows of a list returned by the API, reading the json of each item instead of parsing it.
+    ``XList`` gives :class:`Rows <amino.lib.util.objects.Rows>` of ``XRecord`` when the class exists, raw dicts otherwise.
+    """
+    if isinstance(page, objects.UserProfileCountList): page = page.profile
+
+    record = getattr(objects, type(page).__name__[:-4] + "Record", None) if type(page).__name__.endswith("List") else None
+    if record is None: return list(page.json)
+    return objects.Rows(page.json, record)
+
+def paginate_offsets(fetch, parse, start: int = 0, size: int = 100, concurrency: int = 8, maxItems: int = None):
+    """
+    Yield every item of a ``start``/``size`` list in order, requesting up to ``concurrency`` pages at once.
+    The list ends at the first page shorter than the size asked.
+
+    **Parameters**
+        - **fetch** : Function returning a page from ``start`` and ``size``.
+        - **parse** : Function returning the objects of a page.
+        - *start* : Offset to start from.
+        - *size* : Size of each page.
+        - *concurrency* : Maximum number of pages requested at once.
+        - *maxItems* : Maximum number of objects to yield.
+    """
+    end = start + maxItems if maxItems is not None else None
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    pending = deque()
+
+    try:
+        while True:
+            while len(pending) < concurrency and (end is None or start < end):
+                pageSize = size if end is None else min(size, end - start)
+                pending.append((executor.submit(fetch, start=start, size=pageSize), pageSize))
+                start += pageSize
+
+            if not pending: return
+
+            future, pageSize = pending.popleft()
+            items = parse(future.result())
+            yield from items
+
+            if len(items) < pageSize: return
+
+    finally:
+        for future, pageSize in pending: future.cancel()
+        executor.shutdown(wait=False)
+
+async def apaginate_offsets(fetch, parse, start: int = 0, size: int = 100, concurrency: int = 8, maxItems: int = None):
+    """
+    Asyncio version of :func:`paginate_offsets`, ``fetch`` is a coroutine function.
+    """
+    import asyncio
+
+    end = start + maxItems if maxItems is not None else None
+    pending = deque()
+
+    try:
+        while True:
+            while len(pending) < concurrency and (end is None or start < end):
+                pageSize = size if end is None else min(size, end - start)
+                pending.append((asyncio.ensure_future(fetch(start=start, size=pageSize)), pageSize))
+                start += pageSize
+
+            if not pending: return
+
+            task, pageSize = pending.popleft()
+            items = parse(await task)
+            for item in items: yield item
+
+            if len(items) < pageSize: return
+
+    finally:
+        for task, pageSize in pending: task.cancel()
@@ -1,81 +1,215 @@
+import re
 import time
 import json
+import random
+import inspect
 import websocket
 import threading
 import contextlib
 
-from sys import _getframe as getframe
+from collections import OrderedDict
 
-from .lib.util import objects
+from .lib.util import objects, pagination, dispatch
 
 
 class SocketHandler:
-    def __init__(self, client, socket_trace = False, debug = False):
+    def __init__(self, client, socket_trace = False, debug = False, frameQueue = None, socketManager = None):
         if socket_trace: websocket.enableTrace(True)
         self.socket_url = "wss://ws1.narvii.com"
         self.client = client
         self.debug = debug
         self.active = True
+        self.connected = False
         self.headers = None
         self.socket = None
         self.socket_thread = None
+        self.reconnect_thread = None
+        self.send_lock = threading.Lock()
         self.reconnect = True
         self.socket_stop = False
-        self.socketDelay = 0
         self.socket_trace = socket_trace
-        self.socketDelayFetch = 120  # Reconnects every 120 seconds.
+
+        self.pingInterval = 30  # Pings every 30 seconds.
+        self.livenessTimeout = 75  # No frame nor pong for 75 seconds means the socket is dead.
+        self.connectTimeout = 15  # Time given to a new socket to open.
+        self.checkInterval = 5
+        self.backoffBase = 1
+        self.backoffMax = 60
+
+        self.backfillMessages = True  # Fetch the messages sent while the socket was down after a reconnect.
+        self.backfillPageSize = 100
+        self.backfillLimit = 500  # Per Chat.
+        self.backfill_thread = None
+
+        self.frameQueue = frameQueue  # Frames are handled on the socket thread without one.
+        self.frame_thread = None
+        self.socketManager = socketManager  # Runs the socket on its event loop instead of threads of its own.
+
+        self.lastFrame = 0
+        self.lastPing = 0
+        self.startedAt = 0
+        self.disconnectedAt = None
+        self.failures = 0
+        self.reconnects = 0
+        self.downtime = 0.0
 
     def run_socket(self):
-        threading.Thread(target=self.reconnect_handler).start()
+        if self.socketManager is not None: return  # Reconnected by the manager.
+        if self.reconnect_thread is None or not self.reconnect_thread.is_alive():
+            self.reconnect_thread = threading.Thread(target=self.reconnect_handler)
+            self.reconnect_thread.start()
+
         websocket.enableTrace(self.socket_trace)
 
+    def alive(self):
+        now = time.monotonic()
+        thread = self.socket_thread
+        if thread is None: return False
+
+        running = thread.ident is None or thread.is_alive()  # Not started yet while start() is running.
+        if not self.connected: return now - self.startedAt < self.connectTimeout and running
+        return running and now - self.lastFrame < self.livenessTimeout
+
+    def ping(self):
+        self.lastPing = time.monotonic()
+
+        try:
+            with self.send_lock: self.socket.sock.ping()
+        except Exception as pingError:
+            if self.debug:
+                print(f"[socket][ping] Error while pinging Socket : {pingError}")
+
+    def backoff(self):
+        # Full jitter, so a fleet of bots does not reconnect in lockstep after an outage.
+        return random.uniform(0, min(self.backoffMax, self.backoffBase * 2 ** self.failures))
+
     def reconnect_handler(self):
         # Made by enchart#3410 thx
         # Fixed by The_Phoenix#3967
         # Fixed by enchart again lmao
         # Fixed by Phoenix one more time lol
-        while True:
-            if self.debug:
-                print(f"[socket][reconnect_handler] socketDelay : {self.socketDelay}")
+        while self.reconnect:
+            if self.socket is None: pass
 
-            if self.socketDelay >= self.socketDelayFetch and self.active:
+            elif self.alive():
+                if self.connected and time.monotonic() - self.lastPing >= self.pingInterval: self.ping()
+
+            else:
+                self.disconnected()
+                delay = self.backoff()
                 if self.debug:
-                    print(f"[socket][reconnect_handler] socketDelay >= {self.socketDelayFetch}, Reconnecting Socket")
+                    print(f"[socket][reconnect_handler] Socket is dead, reconnecting in {delay:.1f}s (failures : {self.failures})")
 
-                self.close()
-                self.start()
-                self.socketDelay = 0
+                self.failures += 1
+                time.sleep(delay)
+                if not self.reconnect: break
 
-            self.socketDelay += 5
+                self.reconnects += 1
+                self.restart()
 
-            if not self.reconnect:
-                if self.debug:
-                    print(f"[socket][reconnect_handler] reconnect is False, breaking")
-                break
+            time.sleep(self.checkInterval)
 
-            time.sleep(5)
+        if self.debug:
+            print(f"[socket][reconnect_handler] reconnect is False, breaking")
+
+    def stats(self):
+        """
+        **Returns**
+            - **Success** : Dict with the number of ``reconnects``, the total ``downtime`` in seconds and whether the socket is ``connected``.
+        """
+        if self.socketManager is not None and self.socketManager.get(self.client) is not None: return self.socketManager.get(self.client).stats()
+        downtime = self.downtime
+        if self.disconnectedAt is not None: downtime += time.monotonic() - self.disconnectedAt
+        return {"connected": self.connected, "reconnects": self.reconnects, "downtime": downtime, "failures": self.failures}
 
     def on_open(self):
         if self.debug:
             print("[socket][on_open] Socket Opened")
 
-    def on_close(self):
+        now = time.monotonic()
+        self.lastFrame = now
+        self.connected = True
+        self.failures = 0
+
+        if self.disconnectedAt is not None:
+            self.downtime += now - self.disconnectedAt
+            self.disconnectedAt = None
+
+            if self.backfillMessages:
+                # Chats are held before the first frame of the new socket is read, so live Messages wait for the missed ones.
+                targets = self.client.backfill_targets()
+                if targets:
+                    self.backfill_thread = threading.Thread(target=self.backfill, args=[targets])
+                    self.backfill_thread.start()
+
+    def backfill(self, targets):
+        """
+        Fetch the Messages sent while the socket was down and replay them through the :class:`Callbacks`, oldest first.
+
+        **Parameters**
+            - **targets** : List of ``(comId, chatId, createdTime, messageId)`` of the last Message seen in each Chat.
+        """
+        replayed = 0
+
+        try:
+            for comId, chatId, createdTime, messageId in targets:
+                messages = []
+
+                try:
+                    for message in pagination.paginate(
+                        lambda pageToken: self.client.get_chat_messages(chatId, self.backfillPageSize, pageToken=pageToken, comId=comId),
+                        lambda page: [objects.LazyMessage(x) for x in page.json],
+                        "messageId", untilTime=createdTime, untilId=messageId, maxItems=self.backfillLimit
+                    ): messages.append(message.json)
+
+                except Exception as backfillError:
+                    if self.debug:
+                        print(f"[socket][backfill] Error while fetching the Messages of {chatId} : {backfillError}")
+
+                if self.debug:
+                    print(f"[socket][backfill] {len(messages)} missed Messages in {chatId}")
+
+                messages.reverse()
+                self.client.replay_messages(comId, chatId, messages)
+                replayed += 1
+
+        finally:
+            # The Chats a failed or cancelled backfill did not reach get their live Messages back.
+            for comId, chatId, createdTime, messageId in targets[replayed:]: self.client.replay_messages(comId, chatId, [])
+
+    def disconnected(self):
+        self.connected = False
+        if self.disconnectedAt is None: self.disconnectedAt = time.monotonic()
+
+    def on_close(self, *args):
         if self.debug:
             print("[socket][on_close] Socket Closed")
 
+        if threading.current_thread() is not self.socket_thread: return  # A replaced socket closing late
         self.active = False
+        self.disconnected()
 
         if self.reconnect:
             if self.debug:
                 print("[socket][on_close] reconnect is True, Opening Socket")
 
+    def on_error(self, error):
+        if self.debug:
+            print(f"[socket][on_error] Socket Error : {error}")
+
     def on_ping(self, data):
         if self.debug:
             print("[socket][on_ping] Socket Pinged")
 
-        contextlib.suppress(self.socket.sock.pong(data))
+        self.lastFrame = time.monotonic()
+        with self.send_lock: contextlib.suppress(self.socket.sock.pong(data))
+
+    def on_pong(self, data):
+        self.lastFrame = time.monotonic()
 
     def handle_message(self, data):
+        self.lastFrame = time.monotonic()
+        if self.frameQueue is not None: return self.frameQueue.put(data, frame_t(data))
         self.client.handle_socket_message(data)
         return
 
@@ -83,40 +217,72 @@ class SocketHandler:
         if self.debug:
             print(f"[socket][send] Sending Data : {data}")
 
-        self.socket.send(data)
+        if self.socketManager is not None: return self.socketManager.send(self.client, data)
+        with self.send_lock: self.socket.send(data)
 
     def start(self):
         if self.debug:
             print(f"[socket][start] Starting Socket")
 
+        if self.socketManager is not None: return self.socketManager.add(self.client)
+
         self.headers = {
             "NDCDEVICEID": self.client.device_id,
             "NDCAUTH": f"sid={self.client.sid}"
         }
 
-        self.socket = websocket.WebSocketApp(
+        socket = websocket.WebSocketApp(
             f"{self.socket_url}/?signbody={self.client.device_id}%7C{int(time.time() * 1000)}",
             on_message = self.handle_message,
             on_open = self.on_open,
             on_close = self.on_close,
+            on_error = self.on_error,
             on_ping = self.on_ping,
+            on_pong = self.on_pong,
             header = self.headers
         )
 
-        threading.Thread(target = self.socket.run_forever, kwargs = {"ping_interval": 60}).start()
+        if self.frameQueue is not None and (self.frame_thread is None or not self.frame_thread.is_alive()):
+            self.frameQueue.open()
+            self.frame_thread = threading.Thread(target=self.frameQueue.run, args=[self.client.handle_socket_message])
+            self.frame_thread.start()
+
+        # Pings are sent by reconnect_handler, run_forever's own ping thread breaks its teardown on Python 3.9+ with websocket-client 0.57.
+        # The thread is set before the socket, so reconnect_handler never checks a socket without its thread.
+        self.startedAt = time.monotonic()
+        self.socket_thread = threading.Thread(target = socket.run_forever)
+        self.socket = socket
+        self.socket_thread.start()
         self.reconnect = True
         self.active = True
+        self.socket_stop = False
 
         if self.debug:
             print(f"[socket][start] Socket Started")
 
+    def restart(self):
+        if self.debug:
+            print("[socket][restart] Restarting Socket")
+
+        try:
+            self.socket.close()
+        except Exception as closeError:
+            if self.debug:
+                print(f"[socket][restart] Error while closing Socket : {closeError}")
+
+        self.start()
+
     def close(self):
         if self.debug:
             print(f"[socket][close] Closing Socket")
 
+        if self.socketManager is not None: return self.socketManager.remove(self.client)
+
         self.reconnect = False
         self.active = False
+        self.connected = False
         self.socket_stop = True
+        if self.frameQueue is not None: self.frameQueue.close()
         try:
             self.socket.close()
         except Exception as closeError:
@@ -125,161 +291,446 @@ class SocketHandler:
 
         return
 
+# Routing key of a frame to the name of its event: (t, type, mediaType) for Messages, (t, actions) for chat actions.
+events = {
+    (1000, 0, 0): "on_text_message",
+    (1000, 0, 100): "on_image_message",
+    (1000, 0, 103): "on_youtube_message",
+    (1000, 1, 0): "on_strike_message",
+    (1000, 2, 110): "on_voice_message",
+    (1000, 3, 113): "on_sticker_message",
+    (1000, 50, 0): "TYPE_USER_SHARE_EXURL",
+    (1000, 51, 0): "TYPE_USER_SHARE_USER",
+    (1000, 52, 0): "on_voice_chat_not_answered",
+    (1000, 53, 0): "on_voice_chat_not_cancelled",
+    (1000, 54, 0): "on_voice_chat_not_declined",
+    (1000, 55, 0): "on_video_chat_not_answered",
+    (1000, 56, 0): "on_video_chat_not_cancelled",
+    (1000, 57, 0): "on_video_chat_not_declined",
+    (1000, 58, 0): "on_avatar_chat_not_answered",
+    (1000, 59, 0): "on_avatar_chat_not_cancelled",
+    (1000, 60, 0): "on_avatar_chat_not_declined",
+    (1000, 100, 0): "on_delete_message",
+    (1000, 101, 0): "on_group_member_join",
+    (1000, 102, 0): "on_group_member_leave",
+    (1000, 103, 0): "on_chat_invite",
+    (1000, 104, 0): "on_chat_background_changed",
+    (1000, 105, 0): "on_chat_title_changed",
+    (1000, 106, 0): "on_chat_icon_changed",
+    (1000, 107, 0): "on_voice_chat_start",
+    (1000, 108, 0): "on_video_chat_start",
+    (1000, 109, 0): "on_avatar_chat_start",
+    (1000, 110, 0): "on_voice_chat_end",
+    (1000, 111, 0): "on_video_chat_end",
+    (1000, 112, 0): "on_avatar_chat_end",
+    (1000, 113, 0): "on_chat_content_changed",
+    (1000, 114, 0): "on_screen_room_start",
+    (1000, 115, 0): "on_screen_room_end",
+    (1000, 116, 0): "on_chat_host_transfered",
+    (1000, 117, 0): "on_text_message_force_removed",
+    (1000, 118, 0): "on_chat_removed_message",
+    (1000, 119, 0): "on_text_message_removed_by_admin",
+    (1000, 120, 0): "on_chat_tip",
+    (1000, 121, 0): "on_chat_pin_announcement",
+    (1000, 122, 0): "on_voice_chat_permission_open_to_everyone",
+    (1000, 123, 0): "on_voice_chat_permission_invited_and_requested",
+    (1000, 124, 0): "on_voice_chat_permission_invite_only",
+    (1000, 125, 0): "on_chat_view_only_enabled",
+    (1000, 126, 0): "on_chat_view_only_disabled",
+    (1000, 127, 0): "on_chat_unpin_announcement",
+    (1000, 128, 0): "on_chat_tipping_enabled",
+    (1000, 129, 0): "on_chat_tipping_disabled",
+    (1000, 65281, 0): "on_timestamp_message",
+    (1000, 65282, 0): "on_welcome_message",
+    (1000, 65283, 0): "on_invite_message",
+    (304, "Typing"): "on_user_typing_start",
+    (306, "Typing"): "on_user_typing_end"
+}
+
+# "t" of a frame when it is its first or last key, and every "type" in it, read without parsing the json.
+frame_head = re.compile(r'\s*{\s*"t"\s*:\s*(\d+)')
+frame_tail = re.compile(r'"t"\s*:\s*(\d+)\s*}\s*$')
+message_type = re.compile(r'"type"\s*:\s*(-?\d+)')
+
+def frame_t(data: str):
+    """
+    "t" of a raw frame read without parsing it, None if it is not its first or last key.
+    """
+    match = frame_head.match(data) or frame_tail.search(data, max(0, len(data) - 32))
+    if match is not None: return int(match.group(1))
+
+
 class Callbacks:
-    def __init__(self, client):
+    def __init__(self, client, dispatcher = None):
         self.client = client
         self.handlers = {}
+        self.dispatcher = dispatcher  # Handlers run on the socket thread without one.
+
+        # Last Message seen and recently delivered Message IDs of each (comId, chatId), to backfill and de-duplicate after a reconnect.
+        self.lastSeen = {}
+        self.trackedChats = set()  # chatId of the keys of lastSeen, looked up by track_skipped on the raw frames.
+        self.lastSkipped = {}  # Raw frame of the last skipped Message of each chatId, newer than its lastSeen.
+        self.delivered = {}
+        self.deliveredSize = 256
+        self.held = {}
+        self.track_lock = threading.Lock()
+
+        # Routing key of a frame to the tuple of its handlers, compiled by event().
+        self.routes = {}
+        self.defaults = ()
+
+        # Routing key of a frame to the on_* method overridden by a subclass, called with the frame instead of the handlers. "default" for the other frames.
+        self.overrides = {}
+
+        # Handlers registered with filters: event name to the number of handlers of each filter shape in use and the index of (shape, comId, chatId, userId) to handlers.
+        self.subscriptions = {}
+        self.routeSubscriptions = {}
+
+        # Frames of a "t", or Messages of a type, that no handler wants are dropped before being parsed.
+        self.subscribedFrames = frozenset()
+        self.subscribedMessages = frozenset()
+        self.skipped = 0
+        self.parsed = 0
+        self.dispatched = 0
+        self.compile_routes()
 
-        self.methods = {
-            304: self._resolve_chat_action_start,
-            306: self._resolve_chat_action_end,
-            1000: self._resolve_chat_message
-        }
-
-        self.chat_methods = {
-            "0:0": self.on_text_message,
-            "0:100": self.on_image_message,
-            "0:103": self.on_youtube_message,
-            "1:0": self.on_strike_message,
-            "2:110": self.on_voice_message,
-            "3:113": self.on_sticker_message,
-            "50:0": self.TYPE_USER_SHARE_EXURL,
-            "51:0": self.TYPE_USER_SHARE_USER,
-            "52:0": self.on_voice_chat_not_answered,
-            "53:0": self.on_voice_chat_not_cancelled,
-            "54:0": self.on_voice_chat_not_declined,
-            "55:0": self.on_video_chat_not_answered,
-            "56:0": self.on_video_chat_not_cancelled,
-            "57:0": self.on_video_chat_not_declined,
-            "58:0": self.on_avatar_chat_not_answered,
-            "59:0": self.on_avatar_chat_not_cancelled,
-            "60:0": self.on_avatar_chat_not_declined,
-            "100:0": self.on_delete_message,
-            "101:0": self.on_group_member_join,
-            "102:0": self.on_group_member_leave,
-            "103:0": self.on_chat_invite,
-            "104:0": self.on_chat_background_changed,
-            "105:0": self.on_chat_title_changed,
-            "106:0": self.on_chat_icon_changed,
-            "107:0": self.on_voice_chat_start,
-            "108:0": self.on_video_chat_start,
-            "109:0": self.on_avatar_chat_start,
-            "110:0": self.on_voice_chat_end,
-            "111:0": self.on_video_chat_end,
-            "112:0": self.on_avatar_chat_end,
-            "113:0": self.on_chat_content_changed,
-            "114:0": self.on_screen_room_start,
-            "115:0": self.on_screen_room_end,
-            "116:0": self.on_chat_host_transfered,
-            "117:0": self.on_text_message_force_removed,
-            "118:0": self.on_chat_removed_message,
-            "119:0": self.on_text_message_removed_by_admin,
-            "120:0": self.on_chat_tip,
-            "121:0": self.on_chat_pin_announcement,
-            "122:0": self.on_voice_chat_permission_open_to_everyone,
-            "123:0": self.on_voice_chat_permission_invited_and_requested,
-            "124:0": self.on_voice_chat_permission_invite_only,
-            "125:0": self.on_chat_view_only_enabled,
-            "126:0": self.on_chat_view_only_disabled,
-            "127:0": self.on_chat_unpin_announcement,
-            "128:0": self.on_chat_tipping_enabled,
-            "129:0": self.on_chat_tipping_disabled,
-            "65281:0": self.on_timestamp_message,
-            "65282:0": self.on_welcome_message,
-            "65283:0": self.on_invite_message
-        }
-
-        self.chat_actions_start = {
-            "Typing": self.on_user_typing_start,
-        }
+    def _resolve_chat_message(self, data):
+        if not self.track_message(data): return
+        return self._dispatch_chat_message(data)
+
+    def _dispatch_chat_message(self, data):
+        message = data["o"]["chatMessage"]
+        return self.route((1000, message["type"], message.get("mediaType", 0)), data)
+
+    def track_message(self, data, hold: bool = True):
+        """
+        Remember a Message frame as the last one seen in its Chat.
+
+        **Returns**
+            - ``False`` if the Message was already delivered, or is held until its Chat is backfilled, ``True`` otherwise.
+        """
+        message = data["o"]["chatMessage"]
+        messageId = message.get("messageId")
+        if messageId is None: return True
+        chat = (data["o"].get("ndcId", 0), message.get("threadId"))
+
+        with self.track_lock:
+            delivered = self.delivered.get(chat)
+            if delivered is not None and messageId in delivered: return False
+
+            if hold and chat in self.held:
+                self.held[chat].append(data)
+                return False
+
+            self._remember(chat, messageId, message.get("createdTime"))
+
+        return True
+
+    def track_skipped(self, data: str):
+        """
+        Keep a Message frame no handler wants as the last one seen in its Chat, so the backfill after a reconnect starts after it.
+        Only the last one of each Chat already tracked is kept, when the client backfills its Messages. It is parsed by :meth:`backfill_targets`.
+
+        **Returns**
+            - ``False`` if the frame has to be parsed to be held during the backfill of its Chat, ``True`` otherwise.
+        """
+        if not self.trackedChats or not getattr(self.client, "backfillMessages", False): return True
+        chatId = dispatch.thread_id.search(data)
+        if chatId is None or chatId.group(1) not in self.trackedChats: return True
+
+        with self.track_lock:
+            if any(chat[1] == chatId.group(1) for chat in self.held): return False
+            self.lastSkipped[chatId.group(1)] = data
+
+        return True
+
+    def _remember(self, chat: tuple, messageId: str, createdTime):
+        # Called with track_lock held.
+        delivered = self.delivered.get(chat)
+        if delivered is None: delivered = self.delivered[chat] = OrderedDict()
+        delivered[messageId] = None
+        if len(delivered) > self.deliveredSize: delivered.popitem(last=False)
+        self.lastSeen[chat] = (createdTime, messageId)
+        self.trackedChats.add(chat[1])
+        self.lastSkipped.pop(chat[1], None)  # Older than this Message.
+
+    def backfill_targets(self):
+        """
+        Start holding the live Messages of every Chat seen so far, until :meth:`replay_messages` is called for it.
+
+        **Returns**
+            - **Success** : List of ``(comId, chatId, createdTime, messageId)`` of the last Message seen in each Chat.
+        """
+        with self.track_lock:
+            for data in list(self.lastSkipped.values()):
+                data = json.loads(data)
+                message = data["o"]["chatMessage"]
+                if message.get("messageId") is not None: self._remember((data["o"].get("ndcId", 0), message.get("threadId")), message["messageId"], message.get("createdTime"))
+
+            self.lastSkipped.clear()
+            for chat in self.lastSeen: self.held.setdefault(chat, [])
+            return [(comId, chatId, createdTime, messageId) for (comId, chatId), (createdTime, messageId) in self.lastSeen.items()]
+
+    def replay_messages(self, comId, chatId: str, messages: list):
+        """
+        Deliver the missed Messages of a Chat, oldest first, then the live ones held during the backfill.
+
+        **Parameters**
+            - **comId** : ID of the Community of the Chat, ``0`` for a global Chat.
+            - **chatId** : ID of the Chat.
+            - **messages** : Messages json of the API, oldest first.
+        """
+        try:
+            for message in messages:
+                message.setdefault("threadId", chatId)
+                data = {"t": 1000, "o": {"ndcId": comId, "chatMessage": message}}
+                if self.track_message(data, hold=False): self._replay_chat_message(data)
 
-        self.chat_actions_end = {
-            "Typing": self.on_user_typing_end,
-        }
+        finally:
+            # The live Messages are released even if the replay failed, or the Chat would stay held.
+            while True:
+                with self.track_lock:
+                    held = self.held.pop((comId, chatId), [])
+                    if held: self.held[(comId, chatId)] = []
 
-    def _resolve_chat_message(self, data):
-        key = f"{data['o']['chatMessage']['type']}:{data['o']['chatMessage'].get('mediaType', 0)}"
-        return self.chat_methods.get(key, self.default)(data)
+                if not held: break
 
-    def _resolve_chat_action_start(self, data):
-        key = data['o'].get('actions', 0)
-        return self.chat_actions_start.get(key, self.default)(data)
+                for data in held:
+                    if self.track_message(data, hold=False): self._replay_chat_message(data)
 
-    def _resolve_chat_action_end(self, data):
-        key = data['o'].get('actions', 0)
-        return self.chat_actions_end.get(key, self.default)(data)
+    def _replay_chat_message(self, data):
+        # A failing handler is reported like on the live frames, the other Messages are still replayed.
+        try: self._dispatch_chat_message(data)
+        except Exception as error: dispatch.report(error)
 
     def resolve(self, data):
+        if self.skip_frame(data):
+            self.skipped += 1
+            return
+
+        self.parsed += 1
         data = json.loads(data)
-        return self.methods.get(data["t"], self.default)(data)
+        t = data["t"]
 
-    def call(self, type, data):
-        if type in self.handlers:
-            for handler in self.handlers[type]:
-                handler(data)
+        if t == 1000: return self._resolve_chat_message(data)
+        if t == 304 or t == 306: return self.route((t, data["o"].get("actions", 0)), data)
+        return self.fallback(data)
+
+    def route(self, key, data):
+        if self.overrides:
+            method = self.overrides.get(key)
+            if method is not None: return method(data)
 
-    def event(self, type):
+        handlers = self.routes.get(key)
+
+        if handlers is not None:
+            subscriptions = self.routeSubscriptions.get(key)
+            if subscriptions is not None: handlers = self.match(handlers, subscriptions, data["o"])
+            if handlers: return self.call_handlers(handlers, objects.Event(data["o"]).Event)
+
+        elif key not in events: return self.fallback(data)
+
+    def fallback(self, data):
+        method = self.overrides.get("default")
+        if method is not None: return method(data)
+        return self.call_handlers(self.defaults, data)
+
+    def match(self, handlers: tuple, subscriptions: tuple, data: dict):
+        """
+        Add the filtered handlers matching a frame to ``handlers``, one index lookup per filter shape in use.
+        """
+        shapes, index = subscriptions
+        message = data.get("chatMessage") or data
+        comId = data.get("ndcId")
+        chatId = message.get("threadId")
+        userId = message.get("uid") or (message.get("author") or {}).get("uid")
+
+        for shape in shapes:
+            hasComId, hasChatId, hasUserId = shape
+            matched = index.get((shape, comId if hasComId else None, chatId if hasChatId else None, userId if hasUserId else None))
+            if matched: handlers += matched
+
+        return handlers
+
+    def call(self, type, data):
+        if type in self.handlers: self.call_handlers(self.handlers[type], data)
+
+    def skip_frame(self, data: str):
+        """
+        Tell from the raw frame, without parsing it, that no handler wants it.
+        Frames are only skipped when it is certain, the others are parsed. The skipped Messages are still tracked, see :meth:`track_skipped`.
+        """
+        if self.defaults or "default" in self.overrides: return False
+        t = frame_t(data)
+        if t is None: return False
+        if t != 1000: return t not in self.subscribedFrames
+
+        # The type of the Message is one of the "type" in the frame.
+        if self.subscribedMessages and any(int(type) in self.subscribedMessages for type in message_type.findall(data)): return False
+        return self.track_skipped(data)
+
+    def frame_stats(self):
+        """
+        **Returns**
+            - **Success** : Dict with the number of frames ``skipped`` without being parsed, ``parsed``, and ``dispatched`` to handlers.
+        """
+        return {"skipped": self.skipped, "parsed": self.parsed, "dispatched": self.dispatched}
+
+    def call_handlers(self, handlers, data):
+        if not handlers: return
+        self.dispatched += 1
+
+        if self.dispatcher is not None:
+            key = dispatch.chat_key(data)
+            for handler in handlers:
+                self.dispatcher.submit(key, handler, data)
+
+        else:
+            for handler in handlers:
+                result = handler(data)
+                if inspect.isawaitable(result): dispatch.schedule(result)
+
+    def compile_routes(self):
+        # The methods a subclass overrides are called like before the routing table, their frames are never skipped.
+        overridden = {name for name in set(events.values()) | {"default"} if getattr(type(self), name) is not getattr(Callbacks, name)}
+        self.overrides = {key: getattr(self, name) for key, name in events.items() if name in overridden}
+        if "default" in overridden: self.overrides["default"] = self.default
+
+        self.routes = {key: tuple(self.handlers.get(name, ())) for key, name in events.items() if name in self.handlers or name in self.subscriptions}
+        self.routeSubscriptions = {key: self.subscriptions[name] for key, name in events.items() if name in self.subscriptions}
+        self.defaults = tuple(self.handlers.get("default", ()))
+        self.subscribedFrames = frozenset(key[0] for key in (*self.routes, *self.overrides) if key != "default")
+        self.subscribedMessages = frozenset(key[1] for key in (*self.routes, *self.overrides) if key != "default" and key[0] == 1000)
+
+    def event(self, type, comId = None, chatId: str = None, userId: str = None):
+        """
+        Register a handler of an event, used as a decorator.
+        Handlers can be coroutine functions: the asyncio clients run them on their loop, the sync ones on :func:`handler_loop <amino.lib.util.dispatch.handler_loop>`, use :func:`run_blocking <amino.lib.util.dispatch.run_blocking>` to await the methods of a sync client.
+
+        Filtered handlers are indexed, an event only reaches the ones it matches whatever their number. They run after the handlers without filters.
+        :meth:`remove_event` unregisters a handler.
+
+        **Parameters**
+            - **type** : Name of the event, like ``"on_text_message"``.
+            - *comId* : Only the events of this Community.
+            - *chatId* : Only the events of this Chat.
+            - *userId* : Only the events of this user.
+        """
         def registerHandler(handler):
-            if type in self.handlers:
+            if comId is not None or chatId is not None or userId is not None: self._add_subscription(type, handler, comId, chatId, userId)
+            elif type in self.handlers:
                 self.handlers[type].append(handler)
             else:
                 self.handlers[type] = [handler]
+            self.compile_routes()
             return handler
 
         return registerHandler
 
-    def on_text_message(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_image_message(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_youtube_message(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_strike_message(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_voice_message(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_sticker_message(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def TYPE_USER_SHARE_EXURL(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def TYPE_USER_SHARE_USER(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_voice_chat_not_answered(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_voice_chat_not_cancelled(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_voice_chat_not_declined(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_video_chat_not_answered(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_video_chat_not_cancelled(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_video_chat_not_declined(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_avatar_chat_not_answered(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_avatar_chat_not_cancelled(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_avatar_chat_not_declined(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_delete_message(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_group_member_join(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_group_member_leave(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_chat_invite(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_chat_background_changed(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_chat_title_changed(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_chat_icon_changed(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_voice_chat_start(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_video_chat_start(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_avatar_chat_start(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_voice_chat_end(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_video_chat_end(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_avatar_chat_end(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_chat_content_changed(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_screen_room_start(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_screen_room_end(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_chat_host_transfered(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_text_message_force_removed(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_chat_removed_message(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_text_message_removed_by_admin(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_chat_tip(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_chat_pin_announcement(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_voice_chat_permission_open_to_everyone(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_voice_chat_permission_invited_and_requested(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_voice_chat_permission_invite_only(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_chat_view_only_enabled(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_chat_view_only_disabled(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_chat_unpin_announcement(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_chat_tipping_enabled(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_chat_tipping_disabled(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_timestamp_message(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_welcome_message(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_invite_message(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-
-    def on_user_typing_start(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_user_typing_end(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-
-    def default(self, data): self.call(getframe(0).f_code.co_name, data)
\ No newline at end of file
+    def remove_event(self, type, handler, comId = None, chatId: str = None, userId: str = None):
+        """
+        Unregister a handler registered with :meth:`event`, given the same filters.
+
+        **Parameters**
+            - **type** : Name of the event, like ``"on_text_message"``.
+            - **handler** : The handler.
+            - *comId* : Community filter of the handler.
+            - *chatId* : Chat filter of the handler.
+            - *userId* : User filter of the handler.
+
+        **Returns**
+            - ``True`` if the handler was registered, ``False`` otherwise.
+        """
+        if comId is not None or chatId is not None or userId is not None: removed = self._remove_subscription(type, handler, comId, chatId, userId)
+        else:
+            handlers = self.handlers.get(type, [])
+            removed = handler in handlers
+            if removed: handlers.remove(handler)
+            if not handlers: self.handlers.pop(type, None)
+
+        if removed: self.compile_routes()
+        return removed
+
+    # The dict of shapes is replaced instead of changing size, match() may be iterating it on the socket thread.
+    def _add_subscription(self, type, handler, comId = None, chatId: str = None, userId: str = None):
+        if comId is not None: comId = int(comId)
+        shape = (comId is not None, chatId is not None, userId is not None)
+        shapes, index = self.subscriptions.get(type, ({}, {}))
+        if shape in shapes: shapes[shape] += 1
+        else: self.subscriptions[type] = ({**shapes, shape: 1}, index)
+
+        key = (shape, comId, chatId, userId)
+        index[key] = index.get(key, ()) + (handler,)
+
+    def _remove_subscription(self, type, handler, comId = None, chatId: str = None, userId: str = None):
+        if comId is not None: comId = int(comId)
+        shape = (comId is not None, chatId is not None, userId is not None)
+        shapes, index = self.subscriptions.get(type, ({}, {}))
+        key = (shape, comId, chatId, userId)
+        handlers = list(index.get(key, ()))
+        if handler not in handlers: return False
+
+        handlers.remove(handler)
+        if handlers: index[key] = tuple(handlers)
+        else: del index[key]
+
+        if shapes[shape] > 1: shapes[shape] -= 1
+        elif len(shapes) > 1: self.subscriptions[type] = ({other: count for other, count in shapes.items() if other != shape}, index)
+        else: del self.subscriptions[type]
+        return True
+
+    def on_text_message(self, data): self.call("on_text_message", objects.Event(data["o"]).Event)
+    def on_image_message(self, data): self.call("on_image_message", objects.Event(data["o"]).Event)
+    def on_youtube_message(self, data): self.call("on_youtube_message", objects.Event(data["o"]).Event)
+    def on_strike_message(self, data): self.call("on_strike_message", objects.Event(data["o"]).Event)
+    def on_voice_message(self, data): self.call("on_voice_message", objects.Event(data["o"]).Event)
+    def on_sticker_message(self, data): self.call("on_sticker_message", objects.Event(data["o"]).Event)
+    def TYPE_USER_SHARE_EXURL(self, data): self.call("TYPE_USER_SHARE_EXURL", objects.Event(data["o"]).Event)
+    def TYPE_USER_SHARE_USER(self, data): self.call("TYPE_USER_SHARE_USER", objects.Event(data["o"]).Event)
+    def on_voice_chat_not_answered(self, data): self.call("on_voice_chat_not_answered", objects.Event(data["o"]).Event)
+    def on_voice_chat_not_cancelled(self, data): self.call("on_voice_chat_not_cancelled", objects.Event(data["o"]).Event)
+    def on_voice_chat_not_declined(self, data): self.call("on_voice_chat_not_declined", objects.Event(data["o"]).Event)
+    def on_video_chat_not_answered(self, data): self.call("on_video_chat_not_answered", objects.Event(data["o"]).Event)
+    def on_video_chat_not_cancelled(self, data): self.call("on_video_chat_not_cancelled", objects.Event(data["o"]).Event)
+    def on_video_chat_not_declined(self, data): self.call("on_video_chat_not_declined", objects.Event(data["o"]).Event)
+    def on_avatar_chat_not_answered(self, data): self.call("on_avatar_chat_not_answered", objects.Event(data["o"]).Event)
+    def on_avatar_chat_not_cancelled(self, data): self.call("on_avatar_chat_not_cancelled", objects.Event(data["o"]).Event)
+    def on_avatar_chat_not_declined(self, data): self.call("on_avatar_chat_not_declined", objects.Event(data["o"]).Event)
+    def on_delete_message(self, data): self.call("on_delete_message", objects.Event(data["o"]).Event)
+    def on_group_member_join(self, data): self.call("on_group_member_join", objects.Event(data["o"]).Event)
+    def on_group_member_leave(self, data): self.call("on_group_member_leave", objects.Event(data["o"]).Event)
+    def on_chat_invite(self, data): self.call("on_chat_invite", objects.Event(data["o"]).Event)
+    def on_chat_background_changed(self, data): self.call("on_chat_background_changed", objects.Event(data["o"]).Event)
+    def on_chat_title_changed(self, data): self.call("on_chat_title_changed", objects.Event(data["o"]).Event)
+    def on_chat_icon_changed(self, data): self.call("on_chat_icon_changed", objects.Event(data["o"]).Event)
+    def on_voice_chat_start(self, data): self.call("on_voice_chat_start", objects.Event(data["o"]).Event)
+    def on_video_chat_start(self, data): self.call("on_video_chat_start", objects.Event(data["o"]).Event)
+    def on_avatar_chat_start(self, data): self.call("on_avatar_chat_start", objects.Event(data["o"]).Event)
+    def on_voice_chat_end(self, data): self.call("on_voice_chat_end", objects.Event(data["o"]).Event)
+    def on_video_chat_end(self, data): self.call("on_video_chat_end", objects.Event(data["o"]).Event)
+    def on_avatar_chat_end(self, data): self.call("on_avatar_chat_end", objects.Event(data["o"]).Event)
+    def on_chat_content_changed(self, data): self.call("on_chat_content_changed", objects.Event(data["o"]).Event)
+    def on_screen_room_start(self, data): self.call("on_screen_room_start", objects.Event(data["o"]).Event)
+    def on_screen_room_end(self, data): self.call("on_screen_room_end", objects.Event(data["o"]).Event)
+    def on_chat_host_transfered(self, data): self.call("on_chat_host_transfered", objects.Event(data["o"]).Event)
+    def on_text_message_force_removed(self, data): self.call("on_text_message_force_removed", objects.Event(data["o"]).Event)
+    def on_chat_removed_message(self, data): self.call("on_chat_removed_message", objects.Event(data["o"]).Event)
+    def on_text_message_removed_by_admin(self, data): self.call("on_text_message_removed_by_admin", objects.Event(data["o"]).Event)
+    def on_chat_tip(self, data): self.call("on_chat_tip", objects.Event(data["o"]).Event)
+    def on_chat_pin_announcement(self, data): self.call("on_chat_pin_announcement", objects.Event(data["o"]).Event)
+    def on_voice_chat_permission_open_to_everyone(self, data): self.call("on_voice_chat_permission_open_to_everyone", objects.Event(data["o"]).Event)
+    def on_voice_chat_permission_invited_and_requested(self, data): self.call("on_voice_chat_permission_invited_and_requested", objects.Event(data["o"]).Event)
+    def on_voice_chat_permission_invite_only(self, data): self.call("on_voice_chat_permission_invite_only", objects.Event(data["o"]).Event)
+    def on_chat_view_only_enabled(self, data): self.call("on_chat_view_only_enabled", objects.Event(data["o"]).Event)
+    def on_chat_view_only_disabled(self, data): self.call("on_chat_view_only_disabled", objects.Event(data["o"]).Event)
+    def on_chat_unpin_announcement(self, data): self.call("on_chat_unpin_announcement", objects.Event(data["o"]).Event)
+    def on_chat_tipping_enabled(self, data): self.call("on_chat_tipping_enabled", objects.Event(data["o"]).Event)
+    def on_chat_tipping_disabled(self, data): self.call("on_chat_tipping_disabled", objects.Event(data["o"]).Event)
+    def on_timestamp_message(self, data): self.call("on_timestamp_message", objects.Event(data["o"]).Event)
+    def on_welcome_message(self, data): self.call("on_welcome_message", objects.Event(data["o"]).Event)
+    def on_invite_message(self, data): self.call("on_invite_message", objects.Event(data["o"]).Event)
+
+    def on_user_typing_start(self, data): self.call("on_user_typing_start", objects.Event(data["o"]).Event)
+    def on_user_typing_end(self, data): self.call("on_user_typing_end", objects.Event(data["o"]).Event)
+
+    def default(self, data): self.call("default", data)
\ No newline at end of file
@@ -0,0 +1,225 @@
+import time
+import asyncio
+import aiohttp
+import threading
+
+from .async_socket import AsyncSocketHandler
+from .lib.util import dispatch
+
+
+class ManagedSocket(AsyncSocketHandler):
+    """
+    Socket of a sync :meth:`Client <amino.client.Client>` run on the event loop of a :class:`SocketManager`.
+    """
+    def __init__(self, manager, client):
+        AsyncSocketHandler.__init__(self, client, socket_trace=manager.socket_trace, debug=manager.debug)
+        self.manager = manager
+        self.socket_url = client.socket_url
+        self.busy = True  # Connecting, the manager leaves it alone.
+        self.retryAt = None
+        self.backfillMessages = client.backfillMessages
+
+    def alive(self):
+        return self.socket is not None and self.socket_task is not None and AsyncSocketHandler.alive(self)
+
+    async def connect(self, url: str):
+        return await self.manager.session.ws_connect(
+            url,
+            headers = self.headers,
+            proxy = self.manager.proxy,
+            ssl = self.manager.ssl,
+            heartbeat = self.pingInterval
+        )
+
+    async def open(self):
+        try:
+            async with self.manager.connecting:
+                if self.socket is not None: await self.socket.close()
+                await self.start()
+
+        except Exception as openError:
+            if self.debug:
+                print(f"[socket][open] Error while opening Socket : {openError}")
+
+        finally:
+            self.busy = False
+
+    async def handle_message(self, data):
+        if self.socket_trace:
+            print(f"[socket][handle_message] Received Data : {data}")
+
+        # Frames of an account are handled in order, on the workers of the manager. Only this socket waits when they are all busy.
+        await self.manager.acquire_slot()
+        self.manager.dispatcher.enqueue(id(self.client), self.client.handle_socket_message, (data,))
+
+    async def backfill(self, targets):
+        await asyncio.get_event_loop().run_in_executor(None, self.client.backfill, targets)
+
+
+class SocketManager:
+    """
+    Runs the sockets of many sync :meth:`Clients <amino.client.Client>` on one event loop thread, instead of two threads per account.
+    The frames of each account go to its :class:`Callbacks <amino.socket.Callbacks>` in order, on a shared pool of ``workers`` threads.
+    Dead sockets are reconnected by a single supervisor with the backoff of each socket.
+
+    Pass it to the clients with ``Client(socketManager=manager)``, their ``frameQueue`` is not used.
+
+    **Parameters**
+        - *workers* : Number of threads running the handlers of every account.
+        - *maxPending* : Maximum number of frames waiting for a worker. A socket waits when it is reached.
+        - *maxConnecting* : Maximum number of sockets connecting at once.
+        - *checkInterval* : Seconds between two checks of the sockets.
+        - *proxy* : Proxy url of the sockets.
+        - *ssl* : SSL context of the sockets.
+    """
+    def __init__(self, workers: int = 8, maxPending: int = 10000, maxConnecting: int = 20, checkInterval: float = 5, proxy: str = None, ssl = None, socket_trace = False, debug = False):
+        self.dispatcher = dispatch.ThreadDispatcher(workers=workers, maxPending=maxPending, onRelease=self.released)
+        self.maxConnecting = maxConnecting
+        self.checkInterval = checkInterval
+        self.proxy = proxy
+        self.ssl = ssl
+        self.socket_trace = socket_trace
+        self.debug = debug
+
+        self.sockets = {}
+        self.lock = threading.Lock()
+        self.loop = None
+        self.thread = None
+        self.session = None
+        self.connecting = None
+        self.supervisor = None
+        # Set from the workers when a slot is released while sockets wait for one, see acquire_slot.
+        self.freed = None
+        self.waiting = 0
+
+    def run(self):
+        """
+        Start the event loop thread, done by the first :meth:`add`.
+        """
+        with self.lock:
+            if self.thread is not None: return
+
+            self.loop = asyncio.new_event_loop()
+            self.thread = threading.Thread(target=self.loop.run_forever, name="amino-sockets", daemon=True)
+            self.thread.start()
+
+        self.call(self.setup()).result()
+
+    def call(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+    async def setup(self):
+        # Every socket holds a connection, so the pool must not be limited.
+        self.session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=0))
+        self.connecting = asyncio.Semaphore(self.maxConnecting)
+        self.freed = asyncio.Event()
+        self.supervisor = asyncio.ensure_future(self.supervise())
+
+    async def acquire_slot(self):
+        """
+        Take one of the ``slots`` of the dispatcher, waiting on the loop while they are all taken so no thread is held (the backfills run on the default executor).
+        """
+        slots = self.dispatcher.slots
+        if slots.acquire(blocking=False): return
+
+        # Counted before trying again, a slot released after the failed try is then always signalled.
+        self.waiting += 1
+        try:
+            while True:
+                self.freed.clear()
+                if slots.acquire(blocking=False): return
+                await self.freed.wait()
+        finally:
+            self.waiting -= 1
+
+    def released(self):
+        # Called on a worker thread, the loop is only woken up when a socket waits. It may be closed already when the manager is.
+        if not self.waiting: return
+        try: self.loop.call_soon_threadsafe(self.freed.set)
+        except RuntimeError: pass
+
+    async def supervise(self):
+        while True:
+            now = time.monotonic()
+
+            for socket in list(self.sockets.values()):
+                if socket.busy or socket.alive(): continue
+
+                if socket.retryAt is None:
+                    socket.disconnected()
+                    socket.retryAt = now + socket.backoff()
+                    socket.failures += 1
+
+                    if self.debug:
+                        print(f"[socket][supervise] Socket of {socket.client.userId} is dead, reconnecting in {socket.retryAt - now:.1f}s (failures : {socket.failures})")
+
+                elif now >= socket.retryAt:
+                    socket.retryAt = None
+                    socket.reconnects += 1
+                    socket.busy = True
+                    asyncio.ensure_future(socket.open())
+
+            await asyncio.sleep(self.checkInterval)
+
+    def add(self, client):
+        """
+        Open the socket of a logged in ``client``, replacing the one it had.
+
+        **Returns**
+            - **Success** : :class:`ManagedSocket`
+        """
+        self.run()
+        socket = ManagedSocket(self, client)
+        previous = self.sockets.get(id(client))
+        self.sockets[id(client)] = socket
+
+        if previous is not None: self.call(previous.close())
+        self.call(socket.open())
+        return socket
+
+    def remove(self, client):
+        """
+        Close the socket of ``client``.
+        """
+        socket = self.sockets.pop(id(client), None)
+        if socket is not None: self.call(socket.close()).result()
+
+    def get(self, client):
+        return self.sockets.get(id(client))
+
+    def send(self, client, data):
+        return self.call(self.sockets[id(client)].send(data)).result()
+
+    def stats(self):
+        """
+        **Returns**
+            - **Success** : Dict with the number of ``sockets``, of ``connected`` ones, their ``reconnects``, the number of ``threads`` of the process and the stats of the ``dispatcher``.
+        """
+        sockets = list(self.sockets.values())
+
+        return {
+            "sockets": len(sockets),
+            "connected": sum(socket.connected for socket in sockets),
+            "reconnects": sum(socket.reconnects for socket in sockets),
+            "threads": threading.active_count(),
+            "dispatcher": self.dispatcher.stats()
+        }
+
+    async def shutdown(self):
+        self.supervisor.cancel()
+        await asyncio.gather(*(socket.close() for socket in self.sockets.values()), return_exceptions=True)
+        await self.session.close()
+
+    def close(self):
+        """
+        Close every socket and stop the event loop thread.
+        """
+        if self.thread is None: return
+
+        self.call(self.shutdown()).result()
+        self.sockets.clear()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+        self.dispatcher.close()
+        self.thread = None
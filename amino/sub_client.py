@@ -9,14 +9,12 @@ from hashlib import sha1
 from time import timezone
 from typing import BinaryIO
 from binascii import hexlify
+from functools import partial
 from time import time as timestamp
 from json_minify import json_minify
 
 from . import client
-from .lib.util import exceptions, headers, device, objects
-
-device = device.DeviceGenerator()
-headers.sid = client.Client().sid
+from .lib.util import exceptions, headers, objects, pagination
 
 
 class VCHeaders:
@@ -36,17 +34,23 @@ class VCHeaders:
 
 
 class SubClient(client.Client):
-    def __init__(self, comId: str = None, aminoId: str = None, *, profile: objects.UserProfile):
-        client.Client.__init__(self)
+    def __init__(self, comId: str = None, aminoId: str = None, *, profile: objects.UserProfile, deviceId: str = None, proxies: dict = None, certificatePath = None, session: requests.Session = None, middlewares: list = None, sid: str = None):
+        client.Client.__init__(self, deviceId=deviceId, proxies=proxies, certificatePath=certificatePath, session=session, middlewares=middlewares)
         self.vc_connect = False
 
+        if sid is not None: self.sid = sid
+        else: self.sid = headers.sid
+
+        self.authenticated = self.sid is not None
+        self.userId = getattr(profile, "userId", None)
+
         if comId is not None:
             self.comId = comId
             self.community: objects.Community = self.get_community_info(comId)
 
         if aminoId is not None:
-            self.comId = client.Client().search_community(aminoId).comId[0]
-            self.community: objects.Community = client.Client().get_community_info(self.comId)
+            self.comId = self.search_community(aminoId).comId[0]
+            self.community: objects.Community = self.get_community_info(self.comId)
 
         if comId is None and aminoId is None: raise exceptions.NoCommunity()
 
@@ -54,17 +58,9 @@ class SubClient(client.Client):
         except AttributeError: raise exceptions.FailedLogin()
         except exceptions.UserUnavailable: pass
 
-    def parse_headers(self, data = None):
-        if data is not None:
-            return headers.Headers(data=data, deviceId=self.device_id).headers
-        else:
-            return headers.Headers(deviceId=self.device_id).headers
-
-
     def get_invite_codes(self, status: str = "normal", start: int = 0, size: int = 25):
-        response = requests.get(f"{self.api}/g/s-x{self.comId}/community/invitation?status={status}&start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.InviteCodeList(json.loads(response.text)["communityInvitationList"]).InviteCodeList
+        response = self.request("GET", f"/g/s-x{self.comId}/community/invitation?status={status}&start={start}&size={size}")
+        return objects.InviteCodeList(json.loads(response.text)["communityInvitationList"]).InviteCodeList
 
     def generate_invite_code(self, duration: int = 0, force: bool = True):
         data = json.dumps({
@@ -73,14 +69,12 @@ class SubClient(client.Client):
             "timestamp": int(timestamp() * 1000)
         })
 
-        response = requests.post(f"{self.api}/g/s-x{self.comId}/community/invitation", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.InviteCode(json.loads(response.text)["communityInvitation"]).InviteCode
+        response = self.request("POST", f"/g/s-x{self.comId}/community/invitation", data=data)
+        return objects.InviteCode(json.loads(response.text)["communityInvitation"]).InviteCode
 
     def delete_invite_code(self, inviteId: str):
-        response = requests.delete(f"{self.api}/g/s-x{self.comId}/community/invitation/{inviteId}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("DELETE", f"/g/s-x{self.comId}/community/invitation/{inviteId}")
+        return response.status_code
 
     def post_blog(self, title: str, content: str, imageList: list = None, captionList: list = None, categoriesList: list = None, backgroundColor: str = None, fansOnly: bool = False, extensions: dict = None, crash: bool = False):
         mediaList = []
@@ -112,9 +106,8 @@ class SubClient(client.Client):
         if categoriesList: data["taggedBlogCategoryIdList"] = categoriesList
 
         data = json.dumps(data)
-        response = requests.post(f"{self.api}/x{self.comId}/s/blog", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/x{self.comId}/s/blog", data=data)
+        return response.status_code
 
     def post_wiki(self, title: str, content: str, icon: str = None, imageList: list = None, keywords: str = None, backgroundColor: str = None, fansOnly: bool = False):
         mediaList = []
@@ -135,9 +128,8 @@ class SubClient(client.Client):
         if fansOnly: data["extensions"] = {"fansOnly": fansOnly}
         if backgroundColor: data["extensions"] = {"style": {"backgroundColor": backgroundColor}}
         data = json.dumps(data)
-        response = requests.post(f"{self.api}/x{self.comId}/s/item", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/x{self.comId}/s/item", data=data)
+        return response.status_code
 
     def edit_blog(self, blogId: str, title: str = None, content: str = None, imageList: list = None, categoriesList: list = None, backgroundColor: str = None, fansOnly: bool = False):
         mediaList = []
@@ -160,19 +152,16 @@ class SubClient(client.Client):
         if backgroundColor: data["extensions"] = {"style": {"backgroundColor": backgroundColor}}
         if categoriesList: data["taggedBlogCategoryIdList"] = categoriesList
         data = json.dumps(data)
-        response = requests.post(f"{self.api}/x{self.comId}/s/blog/{blogId}", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/x{self.comId}/s/blog/{blogId}", data=data)
+        return response.status_code
 
     def delete_blog(self, blogId: str):
-        response = requests.delete(f"{self.api}/x{self.comId}/s/blog/{blogId}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("DELETE", f"/x{self.comId}/s/blog/{blogId}")
+        return response.status_code
 
     def delete_wiki(self, wikiId: str):
-        response = requests.delete(f"{self.api}/x{self.comId}/s/item/{wikiId}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("DELETE", f"/x{self.comId}/s/item/{wikiId}")
+        return response.status_code
 
     def repost_blog(self, content: str = None, blogId: str = None, wikiId: str = None):
         if blogId is not None: refObjectId, refObjectType = blogId, 1
@@ -187,9 +176,8 @@ class SubClient(client.Client):
             "timestamp": int(timestamp() * 1000)
         })
 
-        response = requests.post(f"{self.api}/x{self.comId}/s/blog", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/x{self.comId}/s/blog", data=data)
+        return response.status_code
 
     def check_in(self, tz: int = -timezone // 1000):
         data = json.dumps({
@@ -197,9 +185,8 @@ class SubClient(client.Client):
             "timestamp": int(timestamp() * 1000)
         })
 
-        response = requests.post(f"{self.api}/x{self.comId}/s/check-in", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/x{self.comId}/s/check-in", data=data)
+        return response.status_code
 
     def repair_check_in(self, method: int = 0):
         data = {"timestamp": int(timestamp() * 1000)}
@@ -207,9 +194,8 @@ class SubClient(client.Client):
         if method == 1: data["repairMethod"] = "2"  # Amino+
 
         data = json.dumps(data)
-        response = requests.post(f"{self.api}/x{self.comId}/s/check-in/repair", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/x{self.comId}/s/check-in/repair", data=data)
+        return response.status_code
 
     def lottery(self, tz: int = -timezone // 1000):
         data = json.dumps({
@@ -217,9 +203,8 @@ class SubClient(client.Client):
             "timestamp": int(timestamp() * 1000)
         })
 
-        response = requests.post(f"{self.api}/x{self.comId}/s/check-in/lottery", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.LotteryLog(json.loads(response.text)["lotteryLog"]).LotteryLog
+        response = self.request("POST", f"/x{self.comId}/s/check-in/lottery", data=data)
+        return objects.LotteryLog(json.loads(response.text)["lotteryLog"]).LotteryLog
 
     def edit_profile(self, nickname: str = None, content: str = None, icon: BinaryIO = None, chatRequestPrivilege: str = None, imageList: list = None, captionList: list = None, backgroundImage: str = None, backgroundColor: str = None, titles: list = None, colors: list = None, defaultBubbleId: str = None):
         mediaList = []
@@ -255,9 +240,8 @@ class SubClient(client.Client):
             data["extensions"] = {"customTitles": tlt}
 
         data = json.dumps(data)
-        response = requests.post(f"{self.api}/x{self.comId}/s/user-profile/{self.profile.userId}", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/x{self.comId}/s/user-profile/{self.profile.userId}", data=data)
+        return response.status_code
 
     def vote_poll(self, blogId: str, optionId: str):
         data = json.dumps({
@@ -266,9 +250,8 @@ class SubClient(client.Client):
             "timestamp": int(timestamp() * 1000)
         })
 
-        response = requests.post(f"{self.api}/x{self.comId}/s/blog/{blogId}/poll/option/{optionId}/vote", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/x{self.comId}/s/blog/{blogId}/poll/option/{optionId}/vote", data=data)
+        return response.status_code
 
     def comment(self, message: str, userId: str = None, blogId: str = None, wikiId: str = None, replyTo: str = None, isGuest: bool = False):
         data = {
@@ -286,30 +269,28 @@ class SubClient(client.Client):
         if userId:
             data["eventSource"] = "UserProfileView"
             data = json.dumps(data)
-            response = requests.post(f"{self.api}/x{self.comId}/s/user-profile/{userId}/{comType}", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
+            response = self.request("POST", f"/x{self.comId}/s/user-profile/{userId}/{comType}", data=data)
 
         elif blogId:
             data["eventSource"] = "PostDetailView"
             data = json.dumps(data)
-            response = requests.post(f"{self.api}/x{self.comId}/s/blog/{blogId}/{comType}", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
+            response = self.request("POST", f"/x{self.comId}/s/blog/{blogId}/{comType}", data=data)
 
         elif wikiId:
             data["eventSource"] = "PostDetailView"
             data = json.dumps(data)
-            response = requests.post(f"{self.api}/x{self.comId}/s/item/{wikiId}/{comType}", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
+            response = self.request("POST", f"/x{self.comId}/s/item/{wikiId}/{comType}", data=data)
 
         else: raise exceptions.SpecifyType()
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        return response.status_code
 
     def delete_comment(self, commentId: str, userId: str = None, blogId: str = None, wikiId: str = None):
-        if userId: response = requests.delete(f"{self.api}/x{self.comId}/s/user-profile/{userId}/comment/{commentId}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        elif blogId: response = requests.delete(f"{self.api}/x{self.comId}/s/blog/{blogId}/comment/{commentId}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        elif wikiId: response = requests.delete(f"{self.api}/x{self.comId}/s/item/{wikiId}/comment/{commentId}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
+        if userId: response = self.request("DELETE", f"/x{self.comId}/s/user-profile/{userId}/comment/{commentId}")
+        elif blogId: response = self.request("DELETE", f"/x{self.comId}/s/blog/{blogId}/comment/{commentId}")
+        elif wikiId: response = self.request("DELETE", f"/x{self.comId}/s/item/{wikiId}/comment/{commentId}")
         else: raise exceptions.SpecifyType()
 
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        return response.status_code
 
     def like_blog(self, blogId: [str, list] = None, wikiId: str = None):
         """
@@ -333,31 +314,29 @@ class SubClient(client.Client):
             if isinstance(blogId, str):
                 data["eventSource"] = "UserProfileView"
                 data = json.dumps(data)
-                response = requests.post(f"{self.api}/x{self.comId}/s/blog/{blogId}/vote?cv=1.2", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
+                response = self.request("POST", f"/x{self.comId}/s/blog/{blogId}/vote?cv=1.2", data=data)
 
             elif isinstance(blogId, list):
                 data["targetIdList"] = blogId
                 data = json.dumps(data)
-                response = requests.post(f"{self.api}/x{self.comId}/s/feed/vote", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
+                response = self.request("POST", f"/x{self.comId}/s/feed/vote", data=data)
 
             else: raise exceptions.WrongType
 
         elif wikiId:
             data["eventSource"] = "PostDetailView"
             data = json.dumps(data)
-            response = requests.post(f"{self.api}/x{self. comId}/s/item/{wikiId}/vote?cv=1.2", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
+            response = self.request("POST", f"/x{self. comId}/s/item/{wikiId}/vote?cv=1.2", data=data)
 
         else: raise exceptions.SpecifyType()
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        return response.status_code
 
     def unlike_blog(self, blogId: str = None, wikiId: str = None):
-        if blogId: response = requests.delete(f"{self.api}/x{self.comId}/s/blog/{blogId}/vote?eventSource=UserProfileView", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        elif wikiId: response = requests.delete(f"{self.api}/x{self.comId}/s/item/{wikiId}/vote?eventSource=PostDetailView", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
+        if blogId: response = self.request("DELETE", f"/x{self.comId}/s/blog/{blogId}/vote?eventSource=UserProfileView")
+        elif wikiId: response = self.request("DELETE", f"/x{self.comId}/s/item/{wikiId}/vote?eventSource=PostDetailView")
         else: raise exceptions.SpecifyType()
 
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        return response.status_code
 
     def like_comment(self, commentId: str, userId: str = None, blogId: str = None, wikiId: str = None):
         data = {
@@ -368,30 +347,28 @@ class SubClient(client.Client):
         if userId:
             data["eventSource"] = "UserProfileView"
             data = json.dumps(data)
-            response = requests.post(f"{self.api}/x{self.comId}/s/user-profile/{userId}/comment/{commentId}/vote?cv=1.2&value=1", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
+            response = self.request("POST", f"/x{self.comId}/s/user-profile/{userId}/comment/{commentId}/vote?cv=1.2&value=1", data=data)
 
         elif blogId:
             data["eventSource"] = "PostDetailView"
             data = json.dumps(data)
-            response = requests.post(f"{self.api}/x{self.comId}/s/blog/{blogId}/comment/{commentId}/vote?cv=1.2&value=1", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
+            response = self.request("POST", f"/x{self.comId}/s/blog/{blogId}/comment/{commentId}/vote?cv=1.2&value=1", data=data)
 
         elif wikiId:
             data["eventSource"] = "PostDetailView"
             data = json.dumps(data)
-            response = requests.post(f"{self.api}/x{self.comId}/s/item/{wikiId}/comment/{commentId}/g-vote?cv=1.2&value=1", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
+            response = self.request("POST", f"/x{self.comId}/s/item/{wikiId}/comment/{commentId}/g-vote?cv=1.2&value=1", data=data)
 
         else: raise exceptions.SpecifyType()
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        return response.status_code
 
     def unlike_comment(self, commentId: str, userId: str = None, blogId: str = None, wikiId: str = None):
-        if userId: response = requests.delete(f"{self.api}/x{self.comId}/s/user-profile/{userId}/comment/{commentId}/g-vote?eventSource=UserProfileView", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        elif blogId: response = requests.delete(f"{self.api}/x{self.comId}/s/blog/{blogId}/comment/{commentId}/g-vote?eventSource=PostDetailView", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        elif wikiId: response = requests.delete(f"{self.api}/x{self.comId}/s/item/{wikiId}/comment/{commentId}/g-vote?eventSource=PostDetailView", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
+        if userId: response = self.request("DELETE", f"/x{self.comId}/s/user-profile/{userId}/comment/{commentId}/g-vote?eventSource=UserProfileView")
+        elif blogId: response = self.request("DELETE", f"/x{self.comId}/s/blog/{blogId}/comment/{commentId}/g-vote?eventSource=PostDetailView")
+        elif wikiId: response = self.request("DELETE", f"/x{self.comId}/s/item/{wikiId}/comment/{commentId}/g-vote?eventSource=PostDetailView")
         else: raise exceptions.SpecifyType()
 
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        return response.status_code
 
     def upvote_comment(self, blogId: str, commentId: str):
         data = json.dumps({
@@ -400,9 +377,8 @@ class SubClient(client.Client):
             "timestamp": int(timestamp() * 1000)
         })
 
-        response = requests.post(f"{self.api}/x{self.comId}/s/blog/{blogId}/comment/{commentId}/vote?cv=1.2&value=1", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/x{self.comId}/s/blog/{blogId}/comment/{commentId}/vote?cv=1.2&value=1", data=data)
+        return response.status_code
 
     def downvote_comment(self, blogId: str, commentId: str):
         data = json.dumps({
@@ -411,14 +387,12 @@ class SubClient(client.Client):
             "timestamp": int(timestamp() * 1000)
         })
 
-        response = requests.post(f"{self.api}/x{self.comId}/s/blog/{blogId}/comment/{commentId}/vote?cv=1.2&value=-1", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/x{self.comId}/s/blog/{blogId}/comment/{commentId}/vote?cv=1.2&value=-1", data=data)
+        return response.status_code
 
     def unvote_comment(self, blogId: str, commentId: str):
-        response = requests.delete(f"{self.api}/x{self.comId}/s/blog/{blogId}/comment/{commentId}/vote?eventSource=PostDetailView", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("DELETE", f"/x{self.comId}/s/blog/{blogId}/comment/{commentId}/vote?eventSource=PostDetailView")
+        return response.status_code
 
     def reply_wall(self, userId: str, commentId: str, message: str):
         data = json.dumps({
@@ -430,9 +404,8 @@ class SubClient(client.Client):
             "timestamp": int(timestamp() * 1000)
         })
 
-        response = requests.post(f"{self.api}/x{self.comId}/s/user-profile/{userId}/comment", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/x{self.comId}/s/user-profile/{userId}/comment", data=data)
+        return response.status_code
 
     def send_active_obj(self, startTime: int = None, endTime: int = None, optInAdsFlags: int = 2147483647, tz: int = -timezone // 1000, timers: list = None, timestamp: int = int(timestamp() * 1000)):
         data = {
@@ -451,9 +424,8 @@ class SubClient(client.Client):
         data = json_minify(json.dumps(data))
         mac = hmac.new(bytes.fromhex("715ffccf8c0536f186bf127a16c14682827fc581"), data.encode("utf-8"), sha1)
         signature = base64.b64encode(bytes.fromhex("01") + mac.digest()).decode("utf-8")
-        response = requests.post(f"{self.api}/x{self.comId}/s/community/stats/user-active-time", headers=headers.Headers(data=data, sig=signature, deviceId=self.device_id).headers, data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/x{self.comId}/s/community/stats/user-active-time", data=data, headers=self.parse_headers(data=data, sig=signature))
+        return response.status_code
 
     def activity_status(self, status: str):
         if "on" in status.lower(): status = 1
@@ -466,30 +438,25 @@ class SubClient(client.Client):
             "timestamp": int(timestamp() * 1000)
         })
 
-        response = requests.post(f"{self.api}/x{self.comId}/s/user-profile/{self.profile.userId}/online-status", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/x{self.comId}/s/user-profile/{self.profile.userId}/online-status", data=data)
+        return response.status_code
 
     # TODO : Finish this
     def watch_ad(self):
-        response = requests.post(f"{self.api}/g/s/wallet/ads/video/start", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", "/g/s/wallet/ads/video/start")
+        return response.status_code
 
     def check_notifications(self):
-        response = requests.post(f"{self.api}/x{self.comId}/s/notification/checked", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/x{self.comId}/s/notification/checked")
+        return response.status_code
 
     def delete_notification(self, notificationId: str):
-        response = requests.delete(f"{self.api}/x{self.comId}/s/notification/{notificationId}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("DELETE", f"/x{self.comId}/s/notification/{notificationId}")
+        return response.status_code
 
     def clear_notifications(self):
-        response = requests.delete(f"{self.api}/x{self.comId}/s/notification", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("DELETE", f"/x{self.comId}/s/notification")
+        return response.status_code
 
     def start_chat(self, userId: [str, list], message: str, title: str = None, content: str = None, isGlobal: bool = False, publishToGlobal: bool = False):
         if isinstance(userId, str): userIds = [userId]
@@ -512,9 +479,8 @@ class SubClient(client.Client):
 
         data = json.dumps(data)
 
-        response = requests.post(f"{self.api}/x{self.comId}/s/chat/thread", data=data, headers=self.parse_headers(data=data), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/x{self.comId}/s/chat/thread", data=data)
+        return response.status_code
 
     def invite_to_chat(self, userId: [str, list], chatId: str):
         if isinstance(userId, str): userIds = [userId]
@@ -526,14 +492,12 @@ class SubClient(client.Client):
             "timestamp": int(timestamp() * 1000)
         })
 
-        response = requests.post(f"{self.api}/x{self.comId}/s/chat/thread/{chatId}/member/invite", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/x{self.comId}/s/chat/thread/{chatId}/member/invite", data=data)
+        return response.status_code
 
     def add_to_favorites(self, userId: str):
-        response = requests.post(f"{self.api}/x{self.comId}/s/user-group/quick-access/{userId}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/x{self.comId}/s/user-group/quick-access/{userId}")
+        return response.status_code
 
     def send_coins(self, coins: int, blogId: str = None, chatId: str = None, objectId: str = None, transactionId: str = None):
         url = None
@@ -545,24 +509,22 @@ class SubClient(client.Client):
             "timestamp": int(timestamp() * 1000)
         }
 
-        if blogId is not None: url = f"{self.api}/x{self.comId}/s/blog/{blogId}/tipping"
-        if chatId is not None: url = f"{self.api}/x{self.comId}/s/chat/thread/{chatId}/tipping"
+        if blogId is not None: url = f"/x{self.comId}/s/blog/{blogId}/tipping"
+        if chatId is not None: url = f"/x{self.comId}/s/chat/thread/{chatId}/tipping"
         if objectId is not None:
             data["objectId"] = objectId
             data["objectType"] = 2
-            url = f"{self.api}/x{self.comId}/s/tipping"
+            url = f"/x{self.comId}/s/tipping"
 
         if url is None: raise exceptions.SpecifyType()
 
         data = json.dumps(data)
-        response = requests.post(url, headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", url, data=data)
+        return response.status_code
 
     def thank_tip(self, chatId: str, userId: str):
-        response = requests.post(f"{self.api}/x{self.comId}/s/chat/thread/{chatId}/tipping/tipped-users/{userId}/thank", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/x{self.comId}/s/chat/thread/{chatId}/tipping/tipped-users/{userId}/thank")
+        return response.status_code
 
     def follow(self, userId: [str, list]):
         """
@@ -577,16 +539,15 @@ class SubClient(client.Client):
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
         if isinstance(userId, str):
-            response = requests.post(f"{self.api}/x{self.comId}/s/user-profile/{userId}/member", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
+            response = self.request("POST", f"/x{self.comId}/s/user-profile/{userId}/member")
 
         elif isinstance(userId, list):
             data = json.dumps({"targetUidList": userId, "timestamp": int(timestamp() * 1000)})
-            response = requests.post(f"{self.api}/x{self.comId}/s/user-profile/{self.profile.userId}/joined", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
+            response = self.request("POST", f"/x{self.comId}/s/user-profile/{self.profile.userId}/joined", data=data)
 
         else: raise exceptions.WrongType(type(userId))
 
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        return response.status_code
 
     def unfollow(self, userId: str):
         """
@@ -600,9 +561,8 @@ class SubClient(client.Client):
 
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
-        response = requests.delete(f"{self.api}/x{self.comId}/s/user-profile/{self.profile.userId}/joined/{userId}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("DELETE", f"/x{self.comId}/s/user-profile/{self.profile.userId}/joined/{userId}")
+        return response.status_code
 
     def block(self, userId: str):
         """
@@ -616,9 +576,8 @@ class SubClient(client.Client):
 
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
-        response = requests.post(f"{self.api}/x{self.comId}/s/block/{userId}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/x{self.comId}/s/block/{userId}")
+        return response.status_code
 
     def unblock(self, userId: str):
         """
@@ -632,9 +591,8 @@ class SubClient(client.Client):
 
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
-        response = requests.delete(f"{self.api}/x{self.comId}/s/block/{userId}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("DELETE", f"/x{self.comId}/s/block/{userId}")
+        return response.status_code
 
     def visit(self, userId: str):
         """
@@ -648,9 +606,8 @@ class SubClient(client.Client):
 
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
-        response = requests.get(f"{self.api}/x{self.comId}/s/user-profile/{userId}?action=visit", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("GET", f"/x{self.comId}/s/user-profile/{userId}?action=visit")
+        return response.status_code
 
     def flag(self, reason: str, flagType: int, userId: str = None, blogId: str = None, wikiId: str = None, asGuest: bool = False):
         """
@@ -696,9 +653,8 @@ class SubClient(client.Client):
         else: flg = "flag"
 
         data = json.dumps(data)
-        response = requests.post(f"{self.api}/x{self.comId}/s/{flg}", data=data, headers=self.parse_headers(data=data), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/x{self.comId}/s/{flg}", data=data)
+        return response.status_code
 
     def send_message(self, chatId: str, message: str = None, messageType: int = 0, file: BinaryIO = None, fileType: str = None, replyTo: str = None, mentionUserIds: list = None, stickerId: str = None, embedId: str = None, embedType: int = None, embedLink: str = None, embedTitle: str = None, embedContent: str = None, embedImage: BinaryIO = None):
         """
@@ -781,9 +737,8 @@ class SubClient(client.Client):
             data["mediaUploadValue"] = base64.b64encode(file.read()).decode()
 
         data = json.dumps(data)
-        response = requests.post(f"{self.api}/x{self.comId}/s/chat/thread/{chatId}/message", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/x{self.comId}/s/chat/thread/{chatId}/message", data=data)
+        return response.status_code
 
     def delete_message(self, chatId: str, messageId: str, asStaff: bool = False, reason: str = None):
         """
@@ -809,10 +764,9 @@ class SubClient(client.Client):
             data["adminOpNote"] = {"content": reason}
 
         data = json.dumps(data)
-        if not asStaff: response = requests.delete(f"{self.api}/x{self.comId}/s/chat/thread/{chatId}/message/{messageId}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        else: response = requests.post(f"{self.api}/x{self.comId}/s/chat/thread/{chatId}/message/{messageId}/admin", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        if not asStaff: response = self.request("DELETE", f"/x{self.comId}/s/chat/thread/{chatId}/message/{messageId}")
+        else: response = self.request("POST", f"/x{self.comId}/s/chat/thread/{chatId}/message/{messageId}/admin", data=data)
+        return response.status_code
 
     def mark_as_read(self, chatId: str, messageId: str):
         """
@@ -831,9 +785,8 @@ class SubClient(client.Client):
             "messageId": messageId,
             "timestamp": int(timestamp() * 1000)
         })
-        response = requests.post(f"{self.api}/x{self.comId}/s/chat/thread/{chatId}/mark-as-read", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/x{self.comId}/s/chat/thread/{chatId}/mark-as-read", data=data)
+        return response.status_code
 
     def edit_chat(self, chatId: str, doNotDisturb: bool = None, pinChat: bool = None, title: str = None, icon: str = None, backgroundImage: str = None, content: str = None, announcement: str = None, coHosts: list = None, keywords: list = None, pinAnnouncement: bool = None, publishToGlobal: bool = None, canTip: bool = None, viewOnly: bool = None, canInvite: bool = None, fansOnly: bool = None):
         """
@@ -880,76 +833,63 @@ class SubClient(client.Client):
         if doNotDisturb is not None:
             if doNotDisturb:
                 data = json.dumps({"alertOption": 2, "timestamp": int(timestamp() * 1000)})
-                response = requests.post(f"{self.api}/x{self.comId}/s/chat/thread/{chatId}/member/{self.profile.userId}/alert", data=data, headers=self.parse_headers(data=data), proxies=self.proxies, verify=self.certificatePath)
-                if response.status_code != 200: res.append(exceptions.CheckException(json.loads(response.text)))
-                else: res.append(response.status_code)
+                response = self.request("POST", f"/x{self.comId}/s/chat/thread/{chatId}/member/{self.profile.userId}/alert", data=data)
+                res.append(response.status_code)
 
             if not doNotDisturb:
                 data = json.dumps({"alertOption": 1, "timestamp": int(timestamp() * 1000)})
-                response = requests.post(f"{self.api}/x{self.comId}/s/chat/thread/{chatId}/member/{self.profile.userId}/alert", data=data, headers=self.parse_headers(data=data), proxies=self.proxies, verify=self.certificatePath)
-                if response.status_code != 200: res.append(exceptions.CheckException(json.loads(response.text)))
-                else: res.append(response.status_code)
+                response = self.request("POST", f"/x{self.comId}/s/chat/thread/{chatId}/member/{self.profile.userId}/alert", data=data)
+                res.append(response.status_code)
 
         if pinChat is not None:
             if pinChat:
-                response = requests.post(f"{self.api}/x{self.comId}/s/chat/thread/{chatId}/pin", data=data, headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-                if response.status_code != 200: res.append(exceptions.CheckException(json.loads(response.text)))
-                else: res.append(response.status_code)
+                response = self.request("POST", f"/x{self.comId}/s/chat/thread/{chatId}/pin", data=data)
+                res.append(response.status_code)
 
             if not pinChat:
-                response = requests.post(f"{self.api}/x{self.comId}/s/chat/thread/{chatId}/unpin", data=data, headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-                if response.status_code != 200: res.append(exceptions.CheckException(json.loads(response.text)))
-                else: res.append(response.status_code)
+                response = self.request("POST", f"/x{self.comId}/s/chat/thread/{chatId}/unpin", data=data)
+                res.append(response.status_code)
 
         if backgroundImage is not None:
             data = json.dumps({"media": [100, backgroundImage, None], "timestamp": int(timestamp() * 1000)})
-            response = requests.post(f"{self.api}/x{self.comId}/s/chat/thread/{chatId}/member/{self.profile.userId}/background", data=data, headers=self.parse_headers(data=data), proxies=self.proxies, verify=self.certificatePath)
-            if response.status_code != 200: res.append(exceptions.CheckException(json.loads(response.text)))
-            else: res.append(response.status_code)
+            response = self.request("POST", f"/x{self.comId}/s/chat/thread/{chatId}/member/{self.profile.userId}/background", data=data)
+            res.append(response.status_code)
 
         if coHosts is not None:
             data = json.dumps({"uidList": coHosts, "timestamp": int(timestamp() * 1000)})
-            response = requests.post(f"{self.api}/x{self.comId}/s/chat/thread/{chatId}/co-host", data=data, headers=self.parse_headers(data=data), proxies=self.proxies, verify=self.certificatePath)
-            if response.status_code != 200: res.append(exceptions.CheckException(json.loads(response.text)))
-            else: res.append(response.status_code)
+            response = self.request("POST", f"/x{self.comId}/s/chat/thread/{chatId}/co-host", data=data)
+            res.append(response.status_code)
 
         if viewOnly is not None:
             if viewOnly:
-                response = requests.post(f"{self.api}/x{self.comId}/s/chat/thread/{chatId}/view-only/enable", data=data, headers=self.parse_headers(data=data), proxies=self.proxies, verify=self.certificatePath)
-                if response.status_code != 200: res.append(exceptions.CheckException(json.loads(response.text)))
-                else: res.append(response.status_code)
+                response = self.request("POST", f"/x{self.comId}/s/chat/thread/{chatId}/view-only/enable", data=data)
+                res.append(response.status_code)
 
             if not viewOnly:
-                response = requests.post(f"{self.api}/x{self.comId}/s/chat/thread/{chatId}/view-only/disable", data=data, headers=self.parse_headers(data=data), proxies=self.proxies, verify=self.certificatePath)
-                if response.status_code != 200: res.append(exceptions.CheckException(json.loads(response.text)))
-                else: res.append(response.status_code)
+                response = self.request("POST", f"/x{self.comId}/s/chat/thread/{chatId}/view-only/disable", data=data)
+                res.append(response.status_code)
 
         if canInvite is not None:
             if canInvite:
-                response = requests.post(f"{self.api}/x{self.comId}/s/chat/thread/{chatId}/members-can-invite/enable", data=data, headers=self.parse_headers(data=data), proxies=self.proxies, verify=self.certificatePath)
-                if response.status_code != 200: res.append(exceptions.CheckException(json.loads(response.text)))
-                else: res.append(response.status_code)
+                response = self.request("POST", f"/x{self.comId}/s/chat/thread/{chatId}/members-can-invite/enable", data=data)
+                res.append(response.status_code)
 
             if not canInvite:
-                response = requests.post(f"{self.api}/x{self.comId}/s/chat/thread/{chatId}/members-can-invite/disable", data=data, headers=self.parse_headers(data=data), proxies=self.proxies, verify=self.certificatePath)
-                if response.status_code != 200: res.append(exceptions.CheckException(json.loads(response.text)))
-                else: res.append(response.status_code)
+                response = self.request("POST", f"/x{self.comId}/s/chat/thread/{chatId}/members-can-invite/disable", data=data)
+                res.append(response.status_code)
 
         if canTip is not None:
             if canTip:
-                response = requests.post(f"{self.api}/x{self.comId}/s/chat/thread/{chatId}/tipping-perm-status/enable", data=data, headers=self.parse_headers(data=data), proxies=self.proxies, verify=self.certificatePath)
-                if response.status_code != 200: res.append(exceptions.CheckException(json.loads(response.text)))
-                else: res.append(response.status_code)
+                response = self.request("POST", f"/x{self.comId}/s/chat/thread/{chatId}/tipping-perm-status/enable", data=data)
+                res.append(response.status_code)
 
             if not canTip:
-                response = requests.post(f"{self.api}/x{self.comId}/s/chat/thread/{chatId}/tipping-perm-status/disable", data=data, headers=self.parse_headers(data=data), proxies=self.proxies, verify=self.certificatePath)
-                if response.status_code != 200: res.append(exceptions.CheckException(json.loads(response.text)))
-                else: res.append(response.status_code)
+                response = self.request("POST", f"/x{self.comId}/s/chat/thread/{chatId}/tipping-perm-status/disable", data=data)
+                res.append(response.status_code)
 
         data = json.dumps(data)
-        response = requests.post(f"{self.api}/x{self.comId}/s/chat/thread/{chatId}", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: res.append(exceptions.CheckException(json.loads(response.text)))
-        else: res.append(response.status_code)
+        response = self.request("POST", f"/x{self.comId}/s/chat/thread/{chatId}", data=data)
+        res.append(response.status_code)
 
         return res
 
@@ -959,9 +899,8 @@ class SubClient(client.Client):
             "timestamp": int(timestamp() * 1000)
         })
 
-        response = requests.post(f"{self.api}/x{self.comId}/s/chat/thread/{chatId}/transfer-organizer", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/x{self.comId}/s/chat/thread/{chatId}/transfer-organizer", data=data)
+        return response.status_code
 
     def transfer_organizer(self, chatId: str, userIds: list):
         self.transfer_host(chatId, userIds)
@@ -969,9 +908,8 @@ class SubClient(client.Client):
     def accept_host(self, chatId: str, requestId: str):
         data = json.dumps({})
 
-        response = requests.post(f"{self.api}/x{self.comId}/s/chat/thread/{chatId}/transfer-organizer/{requestId}/accept", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/x{self.comId}/s/chat/thread/{chatId}/transfer-organizer/{requestId}/accept", data=data)
+        return response.status_code
 
     def accept_organizer(self, chatId: str, requestId: str):
         self.accept_host(chatId, requestId)
@@ -979,9 +917,8 @@ class SubClient(client.Client):
     def kick(self, userId: str, chatId: str, allowRejoin: bool = True):
         if allowRejoin: allowRejoin = 1
         if not allowRejoin: allowRejoin = 0
-        response = requests.delete(f"{self.api}/x{self.comId}/s/chat/thread/{chatId}/member/{userId}?allowRejoin={allowRejoin}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("DELETE", f"/x{self.comId}/s/chat/thread/{chatId}/member/{userId}?allowRejoin={allowRejoin}")
+        return response.status_code
 
     def join_chat(self, chatId: str):
         """
@@ -995,9 +932,8 @@ class SubClient(client.Client):
 
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
-        response = requests.post(f"{self.api}/x{self.comId}/s/chat/thread/{chatId}/member/{self.profile.userId}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/x{self.comId}/s/chat/thread/{chatId}/member/{self.profile.userId}")
+        return response.status_code
 
     def leave_chat(self, chatId: str):
         """
@@ -1011,9 +947,8 @@ class SubClient(client.Client):
 
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
-        response = requests.delete(f"{self.api}/x{self.comId}/s/chat/thread/{chatId}/member/{self.profile.userId}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("DELETE", f"/x{self.comId}/s/chat/thread/{chatId}/member/{self.profile.userId}")
+        return response.status_code
         
     def delete_chat(self, chatId: str):
         """
@@ -1027,9 +962,8 @@ class SubClient(client.Client):
 
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
-        response = requests.delete(f"{self.api}/x{self.comId}/s/chat/thread/{chatId}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("DELETE", f"/x{self.comId}/s/chat/thread/{chatId}")
+        return response.status_code
         
     def subscribe(self, userId: str, autoRenew: str = False, transactionId: str = None):
         if transactionId is None: transactionId = str(UUID(hexlify(urandom(16)).decode('ascii')))
@@ -1042,14 +976,12 @@ class SubClient(client.Client):
             "timestamp": int(timestamp() * 1000)
         })
 
-        response = requests.post(f"{self.api}/x{self.comId}/s/influencer/{userId}/subscribe", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/x{self.comId}/s/influencer/{userId}/subscribe", data=data)
+        return response.status_code
 
     def promotion(self, noticeId: str, type: str = "accept"):
-        response = requests.post(f"{self.api}/x{self.comId}/s/notice/{noticeId}/{type}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/x{self.comId}/s/notice/{noticeId}/{type}")
+        return response.status_code
 
     def play_quiz_raw(self, quizId: str, quizAnswerList: list, quizMode: int = 0):
         data = json.dumps({
@@ -1058,9 +990,8 @@ class SubClient(client.Client):
             "timestamp": int(timestamp() * 1000)
         })
 
-        response = requests.post(f"{self.api}/x{self.comId}/s/blog/{quizId}/quiz/result", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/x{self.comId}/s/blog/{quizId}/quiz/result", data=data)
+        return response.status_code
 
     def play_quiz(self, quizId: str, questionIdsList: list, answerIdsList: list, quizMode: int = 0):
         quizAnswerList = []
@@ -1080,9 +1011,8 @@ class SubClient(client.Client):
             "timestamp": int(timestamp() * 1000)
         })
 
-        response = requests.post(f"{self.api}/x{self.comId}/s/blog/{quizId}/quiz/result", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/x{self.comId}/s/blog/{quizId}/quiz/result", data=data)
+        return response.status_code
 
     def vc_permission(self, chatId: str, permission: int):
         """Voice Chat Join Permissions
@@ -1095,40 +1025,34 @@ class SubClient(client.Client):
             "timestamp": int(timestamp() * 1000)
         })
 
-        response = requests.post(f"{self.api}/x{self.comId}/s/chat/thread/{chatId}/vvchat-permission", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/x{self.comId}/s/chat/thread/{chatId}/vvchat-permission", data=data)
+        return response.status_code
 
     def get_vc_reputation_info(self, chatId: str):
-        response = requests.get(f"{self.api}/x{self.comId}/s/chat/thread/{chatId}/avchat-reputation", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.VcReputation(json.loads(response.text)).VcReputation
+        response = self.request("GET", f"/x{self.comId}/s/chat/thread/{chatId}/avchat-reputation")
+        return objects.VcReputation(json.loads(response.text)).VcReputation
 
     def claim_vc_reputation(self, chatId: str):
-        response = requests.post(f"{self.api}/x{self.comId}/s/chat/thread/{chatId}/avchat-reputation", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.VcReputation(json.loads(response.text)).VcReputation
+        response = self.request("POST", f"/x{self.comId}/s/chat/thread/{chatId}/avchat-reputation")
+        return objects.VcReputation(json.loads(response.text)).VcReputation
 
     def get_all_users(self, type: str = "recent", start: int = 0, size: int = 25):
-        if type == "recent": response = requests.get(f"{self.api}/x{self.comId}/s/user-profile?type=recent&start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        elif type == "banned": response = requests.get(f"{self.api}/x{self.comId}/s/user-profile?type=banned&start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        elif type == "featured": response = requests.get(f"{self.api}/x{self.comId}/s/user-profile?type=featured&start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        elif type == "leaders": response = requests.get(f"{self.api}/x{self.comId}/s/user-profile?type=leaders&start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        elif type == "curators": response = requests.get(f"{self.api}/x{self.comId}/s/user-profile?type=curators&start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
+        if type == "recent": response = self.request("GET", f"/x{self.comId}/s/user-profile?type=recent&start={start}&size={size}")
+        elif type == "banned": response = self.request("GET", f"/x{self.comId}/s/user-profile?type=banned&start={start}&size={size}")
+        elif type == "featured": response = self.request("GET", f"/x{self.comId}/s/user-profile?type=featured&start={start}&size={size}")
+        elif type == "leaders": response = self.request("GET", f"/x{self.comId}/s/user-profile?type=leaders&start={start}&size={size}")
+        elif type == "curators": response = self.request("GET", f"/x{self.comId}/s/user-profile?type=curators&start={start}&size={size}")
         else: raise exceptions.WrongType(type)
 
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.UserProfileCountList(json.loads(response.text)).UserProfileCountList
+        return objects.UserProfileCountList(json.loads(response.text)).UserProfileCountList
 
     def get_online_users(self, start: int = 0, size: int = 25):
-        response = requests.get(f"{self.api}/x{self.comId}/s/live-layer?topic=ndtopic:x{self.comId}:online-members&start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.UserProfileCountList(json.loads(response.text)).UserProfileCountList
+        response = self.request("GET", f"/x{self.comId}/s/live-layer?topic=ndtopic:x{self.comId}:online-members&start={start}&size={size}")
+        return objects.UserProfileCountList(json.loads(response.text)).UserProfileCountList
 
     def get_online_favorite_users(self, start: int = 0, size: int = 25):
-        response = requests.get(f"{self.api}/x{self.comId}/s/user-group/quick-access?type=online&start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.UserProfileCountList(json.loads(response.text)).UserProfileCountList
+        response = self.request("GET", f"/x{self.comId}/s/user-group/quick-access?type=online&start={start}&size={size}")
+        return objects.UserProfileCountList(json.loads(response.text)).UserProfileCountList
 
     def get_user_info(self, userId: str):
         """
@@ -1142,9 +1066,8 @@ class SubClient(client.Client):
 
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
-        response = requests.get(f"{self.api}/x{self.comId}/s/user-profile/{userId}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.UserProfile(json.loads(response.text)["userProfile"]).UserProfile
+        response = self.request("GET", f"/x{self.comId}/s/user-profile/{userId}")
+        return objects.UserProfile(json.loads(response.text)["userProfile"]).UserProfile
 
     def get_user_following(self, userId: str, start: int = 0, size: int = 25):
         """
@@ -1160,9 +1083,8 @@ class SubClient(client.Client):
 
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
-        response = requests.get(f"{self.api}/x{self.comId}/s/user-profile/{userId}/joined?start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.UserProfileList(json.loads(response.text)["userProfileList"]).UserProfileList
+        response = self.request("GET", f"/x{self.comId}/s/user-profile/{userId}/joined?start={start}&size={size}")
+        return objects.UserProfileList(json.loads(response.text)["userProfileList"]).UserProfileList
 
     def get_user_followers(self, userId: str, start: int = 0, size: int = 25):
         """
@@ -1178,9 +1100,8 @@ class SubClient(client.Client):
 
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
-        response = requests.get(f"{self.api}/x{self.comId}/s/user-profile/{userId}/member?start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.UserProfileList(json.loads(response.text)["userProfileList"]).UserProfileList
+        response = self.request("GET", f"/x{self.comId}/s/user-profile/{userId}/member?start={start}&size={size}")
+        return objects.UserProfileList(json.loads(response.text)["userProfileList"]).UserProfileList
 
     def get_user_visitors(self, userId: str, start: int = 0, size: int = 25):
         """
@@ -1196,34 +1117,28 @@ class SubClient(client.Client):
 
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
-        response = requests.get(f"{self.api}/x{self.comId}/s/user-profile/{userId}/visitors?start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.VisitorsList(json.loads(response.text)).VisitorsList
+        response = self.request("GET", f"/x{self.comId}/s/user-profile/{userId}/visitors?start={start}&size={size}")
+        return objects.VisitorsList(json.loads(response.text)).VisitorsList
 
     def get_user_checkins(self, userId: str):
-        response = requests.get(f"{self.api}/x{self.comId}/s/check-in/stats/{userId}?timezone={-timezone // 1000}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.UserCheckIns(json.loads(response.text)).UserCheckIns
+        response = self.request("GET", f"/x{self.comId}/s/check-in/stats/{userId}?timezone={-timezone // 1000}")
+        return objects.UserCheckIns(json.loads(response.text)).UserCheckIns
 
     def get_user_blogs(self, userId: str, start: int = 0, size: int = 25):
-        response = requests.get(f"{self.api}/x{self.comId}/s/blog?type=user&q={userId}&start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.BlogList(json.loads(response.text)["blogList"]).BlogList
+        response = self.request("GET", f"/x{self.comId}/s/blog?type=user&q={userId}&start={start}&size={size}")
+        return objects.BlogList(json.loads(response.text)["blogList"]).BlogList
 
     def get_user_wikis(self, userId: str, start: int = 0, size: int = 25):
-        response = requests.get(f"{self.api}/x{self.comId}/s/item?type=user-all&start={start}&size={size}&cv=1.2&uid={userId}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.WikiList(json.loads(response.text)["itemList"]).WikiList
+        response = self.request("GET", f"/x{self.comId}/s/item?type=user-all&start={start}&size={size}&cv=1.2&uid={userId}")
+        return objects.WikiList(json.loads(response.text)["itemList"]).WikiList
 
     def get_user_achievements(self, userId: str):
-        response = requests.get(f"{self.api}/x{self.comId}/s/user-profile/{userId}/achievements", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.UserAchievements(json.loads(response.text)["achievements"]).UserAchievements
+        response = self.request("GET", f"/x{self.comId}/s/user-profile/{userId}/achievements")
+        return objects.UserAchievements(json.loads(response.text)["achievements"]).UserAchievements
 
     def get_influencer_fans(self, userId: str, start: int = 0, size: int = 25):
-        response = requests.get(f"{self.api}/x{self.comId}/s/influencer/{userId}/fans?start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.InfluencerFans(json.loads(response.text)).InfluencerFans
+        response = self.request("GET", f"/x{self.comId}/s/influencer/{userId}/fans?start={start}&size={size}")
+        return objects.InfluencerFans(json.loads(response.text)).InfluencerFans
 
     def get_blocked_users(self, start: int = 0, size: int = 25):
         """
@@ -1238,9 +1153,8 @@ class SubClient(client.Client):
 
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
-        response = requests.get(f"{self.api}/x{self.comId}/s/block?start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.UserProfileList(json.loads(response.text)["userProfileList"]).UserProfileList
+        response = self.request("GET", f"/x{self.comId}/s/block?start={start}&size={size}")
+        return objects.UserProfileList(json.loads(response.text)["userProfileList"]).UserProfileList
 
     def get_blocker_users(self, start: int = 0, size: int = 25):
         """
@@ -1256,60 +1170,51 @@ class SubClient(client.Client):
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
 
-        response = requests.get(f"{self.api}/x{self.comId}/s/block?start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return json.loads(response.text)["blockerUidList"]
+        response = self.request("GET", f"/x{self.comId}/s/block?start={start}&size={size}")
+        return json.loads(response.text)["blockerUidList"]
 
     def search_users(self, nickname: str, start: int = 0, size: int = 25):
-        response = requests.get(f"{self.api}/x{self.comId}/s/user-profile?type=name&q={nickname}&start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.UserProfileList(json.loads(response.text)["userProfileList"]).UserProfileList
+        response = self.request("GET", f"/x{self.comId}/s/user-profile?type=name&q={nickname}&start={start}&size={size}")
+        return objects.UserProfileList(json.loads(response.text)["userProfileList"]).UserProfileList
 
     def get_saved_blogs(self, start: int = 0, size: int = 25):
-        response = requests.get(f"{self.api}/x{self.comId}/s/bookmark?start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.UserSavedBlogs(json.loads(response.text)["bookmarkList"]).UserSavedBlogs
+        response = self.request("GET", f"/x{self.comId}/s/bookmark?start={start}&size={size}")
+        return objects.UserSavedBlogs(json.loads(response.text)["bookmarkList"]).UserSavedBlogs
 
     def get_leaderboard_info(self, type: str, start: int = 0, size: int = 25):
-        if "24" in type or "hour" in type: response = requests.get(f"{self.api}/g/s-x{self.comId}/community/leaderboard?rankingType=1&start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        elif "7" in type or "day" in type: response = requests.get(f"{self.api}/g/s-x{self.comId}/community/leaderboard?rankingType=2&start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        elif "rep" in type: response = requests.get(f"{self.api}/g/s-x{self.comId}/community/leaderboard?rankingType=3&start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        elif "check" in type: response = requests.get(f"{self.api}/g/s-x{self.comId}/community/leaderboard?rankingType=4", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        elif "quiz" in type: response = requests.get(f"{self.api}/g/s-x{self.comId}/community/leaderboard?rankingType=5&start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
+        if "24" in type or "hour" in type: response = self.request("GET", f"/g/s-x{self.comId}/community/leaderboard?rankingType=1&start={start}&size={size}")
+        elif "7" in type or "day" in type: response = self.request("GET", f"/g/s-x{self.comId}/community/leaderboard?rankingType=2&start={start}&size={size}")
+        elif "rep" in type: response = self.request("GET", f"/g/s-x{self.comId}/community/leaderboard?rankingType=3&start={start}&size={size}")
+        elif "check" in type: response = self.request("GET", f"/g/s-x{self.comId}/community/leaderboard?rankingType=4")
+        elif "quiz" in type: response = self.request("GET", f"/g/s-x{self.comId}/community/leaderboard?rankingType=5&start={start}&size={size}")
         else: raise exceptions.WrongType(type)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.UserProfileList(json.loads(response.text)["userProfileList"]).UserProfileList
+        return objects.UserProfileList(json.loads(response.text)["userProfileList"]).UserProfileList
 
     def get_wiki_info(self, wikiId: str):
-        response = requests.get(f"{self.api}/x{self.comId}/s/item/{wikiId}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.GetWikiInfo(json.loads(response.text)).GetWikiInfo
+        response = self.request("GET", f"/x{self.comId}/s/item/{wikiId}")
+        return objects.GetWikiInfo(json.loads(response.text)).GetWikiInfo
 
     def get_recent_wiki_items(self, start: int = 0, size: int = 25):
-        response = requests.get(f"{self.api}/x{self.comId}/s/item?type=catalog-all&start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.WikiList(json.loads(response.text)["itemList"]).WikiList
+        response = self.request("GET", f"/x{self.comId}/s/item?type=catalog-all&start={start}&size={size}")
+        return objects.WikiList(json.loads(response.text)["itemList"]).WikiList
 
     def get_wiki_categories(self, start: int = 0, size: int = 25):
-        response = requests.get(f"{self.api}/x{self.comId}/s/item-category?start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.WikiCategoryList(json.loads(response.text)["itemCategoryList"]).WikiCategoryList
+        response = self.request("GET", f"/x{self.comId}/s/item-category?start={start}&size={size}")
+        return objects.WikiCategoryList(json.loads(response.text)["itemCategoryList"]).WikiCategoryList
 
     def get_wiki_category(self, categoryId: str, start: int = 0, size: int = 25):
-        response = requests.get(f"{self.api}/x{self.comId}/s/item-category/{categoryId}?start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.WikiCategory(json.loads(response.text)).WikiCategory
+        response = self.request("GET", f"/x{self.comId}/s/item-category/{categoryId}?start={start}&size={size}")
+        return objects.WikiCategory(json.loads(response.text)).WikiCategory
 
     def get_tipped_users(self, blogId: str = None, wikiId: str = None, quizId: str = None, fileId: str = None, chatId: str = None, start: int = 0, size: int = 25):
         if blogId or quizId:
             if quizId is not None: blogId = quizId
-            response = requests.get(f"{self.api}/x{self.comId}/s/blog/{blogId}/tipping/tipped-users-summary?start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        elif wikiId: response = requests.get(f"{self.api}/x{self.comId}/s/item/{wikiId}/tipping/tipped-users-summary?start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        elif chatId: response = requests.get(f"{self.api}/x{self.comId}/s/chat/thread/{chatId}/tipping/tipped-users-summary?start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        elif fileId: response = requests.get(f"{self.api}/x{self.comId}/s/shared-folder/files/{fileId}/tipping/tipped-users-summary?start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
+            response = self.request("GET", f"/x{self.comId}/s/blog/{blogId}/tipping/tipped-users-summary?start={start}&size={size}")
+        elif wikiId: response = self.request("GET", f"/x{self.comId}/s/item/{wikiId}/tipping/tipped-users-summary?start={start}&size={size}")
+        elif chatId: response = self.request("GET", f"/x{self.comId}/s/chat/thread/{chatId}/tipping/tipped-users-summary?start={start}&size={size}")
+        elif fileId: response = self.request("GET", f"/x{self.comId}/s/shared-folder/files/{fileId}/tipping/tipped-users-summary?start={start}&size={size}")
         else: raise exceptions.SpecifyType()
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.TippedUsersSummary(json.loads(response.text)).TippedUsersSummary
+        return objects.TippedUsersSummary(json.loads(response.text)).TippedUsersSummary
 
     def get_chat_threads(self, start: int = 0, size: int = 25):
         """
@@ -1324,9 +1229,8 @@ class SubClient(client.Client):
 
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
-        response = requests.get(f"{self.api}/x{self.comId}/s/chat/thread?type=joined-me&start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.ThreadList(json.loads(response.text)["threadList"]).ThreadList
+        response = self.request("GET", f"/x{self.comId}/s/chat/thread?type=joined-me&start={start}&size={size}")
+        return objects.ThreadList(json.loads(response.text)["threadList"]).ThreadList
 
     def get_public_chat_threads(self, type: str = "recommended", start: int = 0, size: int = 25):
         """
@@ -1341,9 +1245,8 @@ class SubClient(client.Client):
 
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
-        response = requests.get(f"{self.api}/x{self.comId}/s/chat/thread?type=public-all&filterType={type}&start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.ThreadList(json.loads(response.text)["threadList"]).ThreadList
+        response = self.request("GET", f"/x{self.comId}/s/chat/thread?type=public-all&filterType={type}&start={start}&size={size}")
+        return objects.ThreadList(json.loads(response.text)["threadList"]).ThreadList
 
     def get_chat_thread(self, chatId: str):
         """
@@ -1357,9 +1260,8 @@ class SubClient(client.Client):
 
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
-        response = requests.get(f"{self.api}/x{self.comId}/s/chat/thread/{chatId}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.Thread(json.loads(response.text)["thread"]).Thread
+        response = self.request("GET", f"/x{self.comId}/s/chat/thread/{chatId}")
+        return objects.Thread(json.loads(response.text)["thread"]).Thread
 
     def get_chat_messages(self, chatId: str, size: int = 25, pageToken: str = None):
         """
@@ -1376,12 +1278,11 @@ class SubClient(client.Client):
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
 
-        if pageToken is not None: url = f"{self.api}/x{self.comId}/s/chat/thread/{chatId}/message?v=2&pagingType=t&pageToken={pageToken}&size={size}"
-        else: url = f"{self.api}/x{self.comId}/s/chat/thread/{chatId}/message?v=2&pagingType=t&size={size}"
+        if pageToken is not None: url = f"/x{self.comId}/s/chat/thread/{chatId}/message?v=2&pagingType=t&pageToken={pageToken}&size={size}"
+        else: url = f"/x{self.comId}/s/chat/thread/{chatId}/message?v=2&pagingType=t&size={size}"
 
-        response = requests.get(url, headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.GetMessages(json.loads(response.text)).GetMessages
+        response = self.request("GET", url)
+        return objects.GetMessages(json.loads(response.text)).GetMessages
 
     def get_message_info(self, chatId: str, messageId: str):
         """
@@ -1396,26 +1297,22 @@ class SubClient(client.Client):
 
             - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
         """
-        response = requests.get(f"{self.api}/x{self.comId}/s/chat/thread/{chatId}/message/{messageId}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.Message(json.loads(response.text)["message"]).Message
+        response = self.request("GET", f"/x{self.comId}/s/chat/thread/{chatId}/message/{messageId}")
+        return objects.Message(json.loads(response.text)["message"]).Message
 
     def get_blog_info(self, blogId: str = None, wikiId: str = None, quizId: str = None, fileId: str = None):
         if blogId or quizId:
             if quizId is not None: blogId = quizId
-            response = requests.get(f"{self.api}/x{self.comId}/s/blog/{blogId}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-            if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-            else: return objects.GetBlogInfo(json.loads(response.text)).GetBlogInfo
+            response = self.request("GET", f"/x{self.comId}/s/blog/{blogId}")
+            return objects.GetBlogInfo(json.loads(response.text)).GetBlogInfo
 
         elif wikiId:
-            response = requests.get(f"{self.api}/x{self.comId}/s/item/{wikiId}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-            if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-            else: return objects.GetWikiInfo(json.loads(response.text)).GetWikiInfo
+            response = self.request("GET", f"/x{self.comId}/s/item/{wikiId}")
+            return objects.GetWikiInfo(json.loads(response.text)).GetWikiInfo
 
         elif fileId:
-            response = requests.get(f"{self.api}/x{self.comId}/s/shared-folder/files/{fileId}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-            if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-            else: return objects.SharedFolderFile(json.loads(response.text)["file"]).SharedFolderFile
+            response = self.request("GET", f"/x{self.comId}/s/shared-folder/files/{fileId}")
+            return objects.SharedFolderFile(json.loads(response.text)["file"]).SharedFolderFile
 
         else: raise exceptions.SpecifyType()
 
@@ -1426,28 +1323,24 @@ class SubClient(client.Client):
 
         if blogId or quizId:
             if quizId is not None: blogId = quizId
-            response = requests.get(f"{self.api}/x{self.comId}/s/blog/{blogId}/comment?sort={sorting}&start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        elif wikiId: response = requests.get(f"{self.api}/x{self.comId}/s/item/{wikiId}/comment?sort={sorting}&start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        elif fileId: response = requests.get(f"{self.api}/x{self.comId}/s/shared-folder/files/{fileId}/comment?sort={sorting}&start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
+            response = self.request("GET", f"/x{self.comId}/s/blog/{blogId}/comment?sort={sorting}&start={start}&size={size}")
+        elif wikiId: response = self.request("GET", f"/x{self.comId}/s/item/{wikiId}/comment?sort={sorting}&start={start}&size={size}")
+        elif fileId: response = self.request("GET", f"/x{self.comId}/s/shared-folder/files/{fileId}/comment?sort={sorting}&start={start}&size={size}")
         else: raise exceptions.SpecifyType()
 
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.CommentList(json.loads(response.text)["commentList"]).CommentList
+        return objects.CommentList(json.loads(response.text)["commentList"]).CommentList
 
     def get_blog_categories(self, size: int = 25):
-        response = requests.get(f"{self.api}/x{self.comId}/s/blog-category?size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.BlogCategoryList(json.loads(response.text)["blogCategoryList"]).BlogCategoryList
+        response = self.request("GET", f"/x{self.comId}/s/blog-category?size={size}")
+        return objects.BlogCategoryList(json.loads(response.text)["blogCategoryList"]).BlogCategoryList
 
     def get_blogs_by_category(self, categoryId: str,start: int = 0, size: int = 25):
-        response = requests.get(f"{self.api}/x{self.comId}/s/blog-category/{categoryId}/blog-list?start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.BlogList(json.loads(response.text)["blogList"]).BlogList
+        response = self.request("GET", f"/x{self.comId}/s/blog-category/{categoryId}/blog-list?start={start}&size={size}")
+        return objects.BlogList(json.loads(response.text)["blogList"]).BlogList
 
     def get_quiz_rankings(self, quizId: str, start: int = 0, size: int = 25):
-        response = requests.get(f"{self.api}/x{self.comId}/s/blog/{quizId}/quiz/result?start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.QuizRankings(json.loads(response.text)).QuizRankings
+        response = self.request("GET", f"/x{self.comId}/s/blog/{quizId}/quiz/result?start={start}&size={size}")
+        return objects.QuizRankings(json.loads(response.text)).QuizRankings
 
     def get_wall_comments(self, userId: str, sorting: str, start: int = 0, size: int = 25):
         """
@@ -1470,27 +1363,42 @@ class SubClient(client.Client):
         elif sorting == "top": sorting = "vote"
         else: raise exceptions.WrongType(sorting)
 
-        response = requests.get(f"{self.api}/x{self.comId}/s/user-profile/{userId}/comment?sort={sorting}&start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.CommentList(json.loads(response.text)["commentList"]).CommentList
+        response = self.request("GET", f"/x{self.comId}/s/user-profile/{userId}/comment?sort={sorting}&start={start}&size={size}")
+        return objects.CommentList(json.loads(response.text)["commentList"]).CommentList
 
     def get_recent_blogs(self, pageToken: str = None, start: int = 0, size: int = 25):
-        if pageToken is not None: url = f"{self.api}/x{self.comId}/s/feed/blog-all?pagingType=t&pageToken={pageToken}&size={size}"
-        else: url = f"{self.api}/x{self.comId}/s/feed/blog-all?pagingType=t&start={start}&size={size}"
+        if pageToken is not None: url = f"/x{self.comId}/s/feed/blog-all?pagingType=t&pageToken={pageToken}&size={size}"
+        else: url = f"/x{self.comId}/s/feed/blog-all?pagingType=t&start={start}&size={size}"
 
-        response = requests.get(url, headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.RecentBlogs(json.loads(response.text)).RecentBlogs
+        response = self.request("GET", url)
+        return objects.RecentBlogs(json.loads(response.text)).RecentBlogs
+
+    def iter_recent_blogs(self, size: int = 100, pageToken: str = None, untilTime = None, untilBlogId: str = None, maxItems: int = None, prefetch: bool = True):
+        """
+        Iterate over the recent Blogs of the Community, newest first, fetching the pages as needed.
+
+        **Parameters**
+            - *size* : Size of each page.
+            - *pageToken* : Page Token to start from.
+            - *untilTime* : Stop at the first Blog created before this unix timestamp or :class:`datetime.datetime`.
+            - *untilBlogId* : Stop at this Blog, without yielding it.
+            - *maxItems* : Maximum number of Blogs.
+            - *prefetch* : Request the next page while the current one is consumed.
+
+        **Returns**
+            - **Success** : Generator of :meth:`Blog <amino.lib.util.objects.Blog>`
+
+            - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
+        """
+        return pagination.paginate(partial(self.get_recent_blogs, size=size), lambda page: [objects.Blog(x).Blog for x in page.json], "blogId", pageToken, untilTime, untilBlogId, maxItems, prefetch)
 
     def get_chat_users(self, chatId: str, start: int = 0, size: int = 25):
-        response = requests.get(f"{self.api}/x{self.comId}/s/chat/thread/{chatId}/member?start={start}&size={size}&type=default&cv=1.2", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.UserProfileList(json.loads(response.text)["memberList"]).UserProfileList
+        response = self.request("GET", f"/x{self.comId}/s/chat/thread/{chatId}/member?start={start}&size={size}&type=default&cv=1.2")
+        return objects.UserProfileList(json.loads(response.text)["memberList"]).UserProfileList
 
     def get_notifications(self, start: int = 0, size: int = 25):
-        response = requests.get(f"{self.api}/x{self.comId}/s/notification?pagingType=t&start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.NotificationList(json.loads(response.text)["notificationList"]).NotificationList
+        response = self.request("GET", f"/x{self.comId}/s/notification?pagingType=t&start={start}&size={size}")
+        return objects.NotificationList(json.loads(response.text)["notificationList"]).NotificationList
 
     # TODO : Get notice to finish this
     def get_notices(self, start: int = 0, size: int = 25):
@@ -1499,71 +1407,85 @@ class SubClient(client.Client):
         :param size: Amount of Notices to Show
         :return: Notices List
         """
-        response = requests.get(f"{self.api}/x{self.comId}/s/notice?type=usersV2&status=1&start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return json.loads(response.text)["noticeList"]
+        response = self.request("GET", f"/x{self.comId}/s/notice?type=usersV2&status=1&start={start}&size={size}")
+        return json.loads(response.text)["noticeList"]
 
     def get_sticker_pack_info(self, sticker_pack_id: str):
-        response = requests.get(f"{self.api}/x{self.comId}/s/sticker-collection/{sticker_pack_id}?includeStickers=true", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.StickerCollection(json.loads(response.text)["stickerCollection"]).StickerCollection
+        response = self.request("GET", f"/x{self.comId}/s/sticker-collection/{sticker_pack_id}?includeStickers=true")
+        return objects.StickerCollection(json.loads(response.text)["stickerCollection"]).StickerCollection
 
     def get_sticker_packs(self):
-        response = requests.get(f"{self.api}/x{self.comId}/s/sticker-collection?includeStickers=false&type=my-active-collection", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
+        response = self.request("GET", f"/x{self.comId}/s/sticker-collection?includeStickers=false&type=my-active-collection")
         return objects.StickerCollection(json.loads(response.text)["stickerCollection"]).StickerCollection
 
     # TODO : Finish this
     def get_store_chat_bubbles(self, start: int = 0, size: int = 25):
-        response = requests.get(f"{self.api}/x{self.comId}/s/store/items?sectionGroupId=chat-bubble&start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else:
-            response = json.loads(response.text)
-            del response["api:message"], response["api:statuscode"], response["api:duration"], response["api:timestamp"]
-            return response
+        response = self.request("GET", f"/x{self.comId}/s/store/items?sectionGroupId=chat-bubble&start={start}&size={size}")
+        response = json.loads(response.text)
+        del response["api:message"], response["api:statuscode"], response["api:duration"], response["api:timestamp"]
+        return response
 
     # TODO : Finish this
     def get_store_stickers(self, start: int = 0, size: int = 25):
-        response = requests.get(f"{self.api}/x{self.comId}/s/store/items?sectionGroupId=sticker&start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else:
-            response = json.loads(response.text)
-            del response["api:message"], response["api:statuscode"], response["api:duration"], response["api:timestamp"]
-            return response
+        response = self.request("GET", f"/x{self.comId}/s/store/items?sectionGroupId=sticker&start={start}&size={size}")
+        response = json.loads(response.text)
+        del response["api:message"], response["api:statuscode"], response["api:duration"], response["api:timestamp"]
+        return response
 
     def get_community_stickers(self):
-        response = requests.get(f"{self.api}/x{self.comId}/s/sticker-collection?type=community-shared", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.CommunityStickerCollection(json.loads(response.text)).CommunityStickerCollection
+        response = self.request("GET", f"/x{self.comId}/s/sticker-collection?type=community-shared")
+        return objects.CommunityStickerCollection(json.loads(response.text)).CommunityStickerCollection
 
     def get_sticker_collection(self, collectionId: str):
-        response = requests.get(f"{self.api}/x{self.comId}/s/sticker-collection/{collectionId}?includeStickers=true", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.StickerCollection(json.loads(response.text)["stickerCollection"]).StickerCollection
+        response = self.request("GET", f"/x{self.comId}/s/sticker-collection/{collectionId}?includeStickers=true")
+        return objects.StickerCollection(json.loads(response.text)["stickerCollection"]).StickerCollection
 
     def get_shared_folder_info(self):
-        response = requests.get(f"{self.api}/x{self.comId}/s/shared-folder/stats", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.GetSharedFolderInfo(json.loads(response.text)["stats"]).GetSharedFolderInfo
+        response = self.request("GET", f"/x{self.comId}/s/shared-folder/stats")
+        return objects.GetSharedFolderInfo(json.loads(response.text)["stats"]).GetSharedFolderInfo
 
     def get_shared_folder_files(self, type: str = "latest", start: int = 0, size: int = 25):
-        response = requests.get(f"{self.api}/x{self.comId}/s/shared-folder/files?type={type}&start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.SharedFolderFileList(json.loads(response.text)["fileList"]).SharedFolderFileList
+        response = self.request("GET", f"/x{self.comId}/s/shared-folder/files?type={type}&start={start}&size={size}")
+        return objects.SharedFolderFileList(json.loads(response.text)["fileList"]).SharedFolderFileList
 
     #
     # MODERATION MENU
     #
 
-    def moderation_history(self, userId: str = None, blogId: str = None, wikiId: str = None, quizId: str = None, fileId: str = None, size: int = 25):
-        if userId: response = requests.get(f"{self.api}/x{self.comId}/s/admin/operation?objectId={userId}&objectType=0&pagingType=t&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        elif blogId: response = requests.get(f"{self.api}/x{self.comId}/s/admin/operation?objectId={blogId}&objectType=1&pagingType=t&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        elif quizId: response = requests.get(f"{self.api}/x{self.comId}/s/admin/operation?objectId={quizId}&objectType=1&pagingType=t&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        elif wikiId: response = requests.get(f"{self.api}/x{self.comId}/s/admin/operation?objectId={wikiId}&objectType=2&pagingType=t&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        elif fileId: response = requests.get(f"{self.api}/x{self.comId}/s/admin/operation?objectId={fileId}&objectType=109&pagingType=t&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        else: response = requests.get(f"{self.api}/x{self.comId}/s/admin/operation?pagingType=t&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.AdminLogList(json.loads(response.text)["adminLogList"]).AdminLogList
+    def moderation_history(self, userId: str = None, blogId: str = None, wikiId: str = None, quizId: str = None, fileId: str = None, size: int = 25, pageToken: str = None):
+        if userId: url = f"/x{self.comId}/s/admin/operation?objectId={userId}&objectType=0&pagingType=t&size={size}"
+        elif blogId: url = f"/x{self.comId}/s/admin/operation?objectId={blogId}&objectType=1&pagingType=t&size={size}"
+        elif quizId: url = f"/x{self.comId}/s/admin/operation?objectId={quizId}&objectType=1&pagingType=t&size={size}"
+        elif wikiId: url = f"/x{self.comId}/s/admin/operation?objectId={wikiId}&objectType=2&pagingType=t&size={size}"
+        elif fileId: url = f"/x{self.comId}/s/admin/operation?objectId={fileId}&objectType=109&pagingType=t&size={size}"
+        else: url = f"/x{self.comId}/s/admin/operation?pagingType=t&size={size}"
+
+        if pageToken is not None: url += f"&pageToken={pageToken}"
+
+        response = self.request("GET", url)
+        data = json.loads(response.text)
+        paging = data.get("paging") or {}
+        return objects.AdminLogList(data["adminLogList"], paging.get("nextPageToken"), paging.get("prevPageToken")).AdminLogList
+
+    def iter_moderation_history(self, userId: str = None, blogId: str = None, wikiId: str = None, quizId: str = None, fileId: str = None, size: int = 100, pageToken: str = None, untilTime = None, untilLogId: str = None, maxItems: int = None, prefetch: bool = True):
+        """
+        Iterate over the moderation history, newest first, fetching the pages as needed.
+
+        **Parameters**
+            - *userId*, *blogId*, *wikiId*, *quizId*, *fileId* : Object to get the history of, the whole Community if none.
+            - *size* : Size of each page.
+            - *pageToken* : Page Token to start from.
+            - *untilTime* : Stop at the first log created before this unix timestamp or :class:`datetime.datetime`.
+            - *untilLogId* : Stop at this log, without yielding it.
+            - *maxItems* : Maximum number of logs.
+            - *prefetch* : Request the next page while the current one is consumed.
+
+        **Returns**
+            - **Success** : Generator of :meth:`Admin Log <amino.lib.util.objects.AdminLog>`
+
+            - **Fail** : :meth:`Exceptions <amino.lib.util.exceptions>`
+        """
+        return pagination.paginate(partial(self.moderation_history, userId=userId, blogId=blogId, wikiId=wikiId, quizId=quizId, fileId=fileId, size=size), lambda page: [objects.AdminLog(x).AdminLog for x in page.json], "logId", pageToken, untilTime, untilLogId, maxItems, prefetch)
 
     def feature(self, time: int, userId: str = None, chatId: str = None, blogId: str = None, wikiId: str = None):
         if chatId:
@@ -1588,26 +1510,25 @@ class SubClient(client.Client):
         if userId:
             data["adminOpValue"] = {"featuredType": 4}
             data = json.dumps(data)
-            response = requests.post(f"{self.api}/x{self.comId}/s/user-profile/{userId}/admin", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
+            response = self.request("POST", f"/x{self.comId}/s/user-profile/{userId}/admin", data=data)
 
         elif blogId:
             data["adminOpValue"] = {"featuredType": 1}
             data = json.dumps(data)
-            response = requests.post(f"{self.api}/x{self.comId}/s/blog/{blogId}/admin", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
+            response = self.request("POST", f"/x{self.comId}/s/blog/{blogId}/admin", data=data)
 
         elif wikiId:
             data["adminOpValue"] = {"featuredType": 1}
             data = json.dumps(data)
-            response = requests.post(f"{self.api}/x{self.comId}/s/item/{wikiId}/admin", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
+            response = self.request("POST", f"/x{self.comId}/s/item/{wikiId}/admin", data=data)
 
         elif chatId:
             data["adminOpValue"] = {"featuredType": 5}
             data = json.dumps(data)
-            response = requests.post(f"{self.api}/x{self.comId}/s/chat/thread/{chatId}/admin", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
+            response = self.request("POST", f"/x{self.comId}/s/chat/thread/{chatId}/admin", data=data)
 
         else: raise exceptions.SpecifyType()
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return json.loads(response.text)
+        return json.loads(response.text)
 
     def unfeature(self, userId: str = None, chatId: str = None, blogId: str = None, wikiId: str = None):
         data = {
@@ -1619,26 +1540,25 @@ class SubClient(client.Client):
         if userId:
             data["adminOpValue"] = {"featuredType": 0}
             data = json.dumps(data)
-            response = requests.post(f"{self.api}/x{self.comId}/s/user-profile/{userId}/admin", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
+            response = self.request("POST", f"/x{self.comId}/s/user-profile/{userId}/admin", data=data)
 
         elif blogId:
             data["adminOpValue"] = {"featuredType": 0}
             data = json.dumps(data)
-            response = requests.post(f"{self.api}/x{self.comId}/s/blog/{blogId}/admin", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
+            response = self.request("POST", f"/x{self.comId}/s/blog/{blogId}/admin", data=data)
 
         elif wikiId:
             data["adminOpValue"] = {"featuredType": 0}
             data = json.dumps(data)
-            response = requests.post(f"{self.api}/x{self.comId}/s/item/{wikiId}/admin", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
+            response = self.request("POST", f"/x{self.comId}/s/item/{wikiId}/admin", data=data)
 
         elif chatId:
             data["adminOpValue"] = {"featuredType": 0}
             data = json.dumps(data)
-            response = requests.post(f"{self.api}/x{self.comId}/s/chat/thread/{chatId}/admin", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
+            response = self.request("POST", f"/x{self.comId}/s/chat/thread/{chatId}/admin", data=data)
 
         else: raise exceptions.SpecifyType()
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return json.loads(response.text)
+        return json.loads(response.text)
 
     def hide(self, userId: str = None, chatId: str = None, blogId: str = None, wikiId: str = None, quizId: str = None, fileId: str = None, reason: str = None):
         data = {
@@ -1651,41 +1571,40 @@ class SubClient(client.Client):
         if userId:
             data["adminOpName"] = 18
             data = json.dumps(data)
-            response = requests.post(f"{self.api}/x{self.comId}/s/user-profile/{userId}/admin", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
+            response = self.request("POST", f"/x{self.comId}/s/user-profile/{userId}/admin", data=data)
 
         elif blogId:
             data["adminOpName"] = 110
             data["adminOpValue"] = 9
             data = json.dumps(data)
-            response = requests.post(f"{self.api}/x{self.comId}/s/blog/{blogId}/admin", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
+            response = self.request("POST", f"/x{self.comId}/s/blog/{blogId}/admin", data=data)
 
         elif quizId:
             data["adminOpName"] = 110
             data["adminOpValue"] = 9
             data = json.dumps(data)
-            response = requests.post(f"{self.api}/x{self.comId}/s/blog/{quizId}/admin", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
+            response = self.request("POST", f"/x{self.comId}/s/blog/{quizId}/admin", data=data)
 
         elif wikiId:
             data["adminOpName"] = 110
             data["adminOpValue"] = 9
             data = json.dumps(data)
-            response = requests.post(f"{self.api}/x{self.comId}/s/item/{wikiId}/admin", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
+            response = self.request("POST", f"/x{self.comId}/s/item/{wikiId}/admin", data=data)
 
         elif chatId:
             data["adminOpName"] = 110
             data["adminOpValue"] = 9
             data = json.dumps(data)
-            response = requests.post(f"{self.api}/x{self.comId}/s/chat/thread/{chatId}/admin", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
+            response = self.request("POST", f"/x{self.comId}/s/chat/thread/{chatId}/admin", data=data)
 
         elif fileId:
             data["adminOpName"] = 110
             data["adminOpValue"] = 9
             data = json.dumps(data)
-            response = requests.post(f"{self.api}/x{self.comId}/s/shared-folder/files/{fileId}/admin", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
+            response = self.request("POST", f"/x{self.comId}/s/shared-folder/files/{fileId}/admin", data=data)
 
         else: raise exceptions.SpecifyType()
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return json.loads(response.text)
+        return json.loads(response.text)
 
     def unhide(self, userId: str = None, chatId: str = None, blogId: str = None, wikiId: str = None, quizId: str = None, fileId: str = None, reason: str = None):
         data = {
@@ -1698,41 +1617,40 @@ class SubClient(client.Client):
         if userId:
             data["adminOpName"] = 19
             data = json.dumps(data)
-            response = requests.post(f"{self.api}/x{self.comId}/s/user-profile/{userId}/admin", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
+            response = self.request("POST", f"/x{self.comId}/s/user-profile/{userId}/admin", data=data)
 
         elif blogId:
             data["adminOpName"] = 110
             data["adminOpValue"] = 0
             data = json.dumps(data)
-            response = requests.post(f"{self.api}/x{self.comId}/s/blog/{blogId}/admin", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
+            response = self.request("POST", f"/x{self.comId}/s/blog/{blogId}/admin", data=data)
 
         elif quizId:
             data["adminOpName"] = 110
             data["adminOpValue"] = 0
             data = json.dumps(data)
-            response = requests.post(f"{self.api}/x{self.comId}/s/blog/{quizId}/admin", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
+            response = self.request("POST", f"/x{self.comId}/s/blog/{quizId}/admin", data=data)
 
         elif wikiId:
             data["adminOpName"] = 110
             data["adminOpValue"] = 0
             data = json.dumps(data)
-            response = requests.post(f"{self.api}/x{self.comId}/s/item/{wikiId}/admin", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
+            response = self.request("POST", f"/x{self.comId}/s/item/{wikiId}/admin", data=data)
 
         elif chatId:
             data["adminOpName"] = 110
             data["adminOpValue"] = 0
             data = json.dumps(data)
-            response = requests.post(f"{self.api}/x{self.comId}/s/chat/thread/{chatId}/admin", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
+            response = self.request("POST", f"/x{self.comId}/s/chat/thread/{chatId}/admin", data=data)
 
         elif fileId:
             data["adminOpName"] = 110
             data["adminOpValue"] = 0
             data = json.dumps(data)
-            response = requests.post(f"{self.api}/x{self.comId}/s/shared-folder/files/{fileId}/admin", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
+            response = self.request("POST", f"/x{self.comId}/s/shared-folder/files/{fileId}/admin", data=data)
 
         else: raise exceptions.SpecifyType()
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return json.loads(response.text)
+        return json.loads(response.text)
 
     def edit_titles(self, userId: str, titles: list, colors: list):
         tlt = []
@@ -1747,9 +1665,8 @@ class SubClient(client.Client):
             "timestamp": int(timestamp() * 1000)
         })
 
-        response = requests.post(f"{self.api}/x{self.comId}/s/user-profile/{userId}/admin", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return json.loads(response.text)
+        response = self.request("POST", f"/x{self.comId}/s/user-profile/{userId}/admin", data=data)
+        return json.loads(response.text)
 
     # TODO : List all warning texts
     def warn(self, userId: str, reason: str = None):
@@ -1767,9 +1684,8 @@ class SubClient(client.Client):
             "timestamp": int(timestamp() * 1000)
         })
 
-        response = requests.post(f"{self.api}/x{self.comId}/s/notice", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return json.loads(response.text)
+        response = self.request("POST", f"/x{self.comId}/s/notice", data=data)
+        return json.loads(response.text)
 
     # TODO : List all strike texts
     def strike(self, userId: str, time: int, title: str = None, reason: str = None):
@@ -1795,9 +1711,8 @@ class SubClient(client.Client):
             "timestamp": int(timestamp() * 1000)
         })
 
-        response = requests.post(f"{self.api}/x{self.comId}/s/notice", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return json.loads(response.text)
+        response = self.request("POST", f"/x{self.comId}/s/notice", data=data)
+        return json.loads(response.text)
 
     def ban(self, userId: str, reason: str, banType: int = None):
         data = json.dumps({
@@ -1808,9 +1723,8 @@ class SubClient(client.Client):
             "timestamp": int(timestamp() * 1000)
         })
 
-        response = requests.post(f"{self.api}/x{self.comId}/s/user-profile/{userId}/ban", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return json.loads(response.text)
+        response = self.request("POST", f"/x{self.comId}/s/user-profile/{userId}/ban", data=data)
+        return json.loads(response.text)
 
     def unban(self, userId: str, reason: str):
         data = json.dumps({
@@ -1820,9 +1734,8 @@ class SubClient(client.Client):
             "timestamp": int(timestamp() * 1000)
         })
 
-        response = requests.post(f"{self.api}/x{self.comId}/s/user-profile/{userId}/unban", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return json.loads(response.text)
+        response = self.request("POST", f"/x{self.comId}/s/user-profile/{userId}/unban", data=data)
+        return json.loads(response.text)
 
     def reorder_featured_users(self, userIds: list):
         data = json.dumps({
@@ -1830,39 +1743,32 @@ class SubClient(client.Client):
             "timestamp": int(timestamp() * 1000)
         })
 
-        response = requests.post(f"{self.api}/x{self.comId}/s/user-profile/featured/reorder", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return json.loads(response.text)
+        response = self.request("POST", f"/x{self.comId}/s/user-profile/featured/reorder", data=data)
+        return json.loads(response.text)
 
     def get_hidden_blogs(self, start: int = 0, size: int = 25):
-        response = requests.get(f"{self.api}/x{self.comId}/s/feed/blog-disabled?start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.BlogList(json.loads(response.text)["blogList"]).BlogList
+        response = self.request("GET", f"/x{self.comId}/s/feed/blog-disabled?start={start}&size={size}")
+        return objects.BlogList(json.loads(response.text)["blogList"]).BlogList
 
     def get_featured_users(self, start: int = 0, size: int = 25):
-        response = requests.get(f"{self.api}/x{self.comId}/s/user-profile?type=featured&start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.UserProfileCountList(json.loads(response.text)).UserProfileCountList
+        response = self.request("GET", f"/x{self.comId}/s/user-profile?type=featured&start={start}&size={size}")
+        return objects.UserProfileCountList(json.loads(response.text)).UserProfileCountList
 
     def review_quiz_questions(self, quizId: str):
-        response = requests.get(f"{self.api}/x{self.comId}/s/blog/{quizId}?action=review", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.QuizQuestionList(json.loads(response.text)["blog"]["quizQuestionList"]).QuizQuestionList
+        response = self.request("GET", f"/x{self.comId}/s/blog/{quizId}?action=review")
+        return objects.QuizQuestionList(json.loads(response.text)["blog"]["quizQuestionList"]).QuizQuestionList
 
     def get_recent_quiz(self, start: int = 0, size: int = 25):
-        response = requests.get(f"{self.api}/x{self.comId}/s/blog?type=quizzes-recent&start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.BlogList(json.loads(response.text)["blogList"]).BlogList
+        response = self.request("GET", f"/x{self.comId}/s/blog?type=quizzes-recent&start={start}&size={size}")
+        return objects.BlogList(json.loads(response.text)["blogList"]).BlogList
 
     def get_trending_quiz(self, start: int = 0, size: int = 25):
-        response = requests.get(f"{self.api}/x{self.comId}/s/feed/quiz-trending?start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.BlogList(json.loads(response.text)["blogList"]).BlogList
+        response = self.request("GET", f"/x{self.comId}/s/feed/quiz-trending?start={start}&size={size}")
+        return objects.BlogList(json.loads(response.text)["blogList"]).BlogList
 
     def get_best_quiz(self, start: int = 0, size: int = 25):
-        response = requests.get(f"{self.api}/x{self.comId}/s/feed/quiz-best-quizzes?start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.BlogList(json.loads(response.text)["blogList"]).BlogList
+        response = self.request("GET", f"/x{self.comId}/s/feed/quiz-best-quizzes?start={start}&size={size}")
+        return objects.BlogList(json.loads(response.text)["blogList"]).BlogList
 
     def send_action(self, actions: list, blogId: str = None, quizId: str = None, lastAction: bool = False):
         # Action List
@@ -1900,9 +1806,8 @@ class SubClient(client.Client):
         else: data['paymentContext'] = {'discountStatus': 0, 'discountValue': 1, 'isAutoRenew': autoRenew}
 
         data = json.dumps(data)
-        response = requests.post(f"{self.api}/x{self.comId}/s/store/purchase", headers=self.parse_headers(data=data), data=data)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/x{self.comId}/s/store/purchase", data=data)
+        return response.status_code
 
     # Provided by "spectrum#4691"
     def apply_avatar_frame(self, avatarId: str, applyToAll: bool = True):
@@ -1927,9 +1832,8 @@ class SubClient(client.Client):
         if applyToAll: data["applyToAll"] = 1
 
         data = json.dumps(data)
-        response = requests.post(f"{self.api}/x{self.comId}/s/avatar-frame/apply", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/x{self.comId}/s/avatar-frame/apply", data=data)
+        return response.status_code
 
     def invite_to_vc(self, chatId: str, userId: str):
         """
@@ -1949,9 +1853,8 @@ class SubClient(client.Client):
             "uid": userId
         })
 
-        response = requests.post(f"{self.api}/x{self.comId}/s/chat/thread/{chatId}/vvchat-presenter/invite/", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/x{self.comId}/s/chat/thread/{chatId}/vvchat-presenter/invite/", data=data)
+        return response.status_code
 
     def add_poll_option(self, blogId: str, question: str):
         data = json.dumps({
@@ -1961,9 +1864,8 @@ class SubClient(client.Client):
             "timestamp": int(timestamp() * 1000)
         })
 
-        response = requests.post(f"{self.api}/x{self.comId}/s/blog/{blogId}/poll/option", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/x{self.comId}/s/blog/{blogId}/poll/option", data=data)
+        return response.status_code
 
     def create_wiki_category(self, title: str, parentCategoryId: str, content: str = None):
         data = json.dumps({
@@ -1975,18 +1877,16 @@ class SubClient(client.Client):
             "timestamp": int(timestamp() * 1000)
         })
 
-        response = requests.post(f"{self.api}/x{self.comId}/s/item-category", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/x{self.comId}/s/item-category", data=data)
+        return response.status_code
 
     def create_shared_folder(self,title: str):
         data = json.dumps({
                 "title":title,
                 "timestamp":int(timestamp() * 1000)
             })
-        response = requests.post(f"{self.api}/x{self.comId}/s/shared-folder/folders", headers=self.parse_headers(data=data),data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/x{self.comId}/s/shared-folder/folders", data=data)
+        return response.status_code
 
     def submit_to_wiki(self, wikiId: str, message: str):
         data = json.dumps({
@@ -1995,9 +1895,8 @@ class SubClient(client.Client):
             "timestamp": int(timestamp() * 1000)
         })
 
-        response = requests.post(f"{self.api}/x{self.comId}/s/knowledge-base-request", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/x{self.comId}/s/knowledge-base-request", data=data)
+        return response.status_code
 
     def accept_wiki_request(self, requestId: str, destinationCategoryIdList: list):
         data = json.dumps({
@@ -2006,26 +1905,22 @@ class SubClient(client.Client):
             "timestamp": int(timestamp() * 1000)
         })
 
-        response = requests.post(f"{self.api}/x{self.comId}/s/knowledge-base-request/{requestId}/approve", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/x{self.comId}/s/knowledge-base-request/{requestId}/approve", data=data)
+        return response.status_code
 
     def reject_wiki_request(self, requestId: str):
         data = json.dumps({})
 
-        response = requests.post(f"{self.api}/x{self.comId}/s/knowledge-base-request/{requestId}/reject", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
+        response = self.request("POST", f"/x{self.comId}/s/knowledge-base-request/{requestId}/reject", data=data)
+        return response.status_code
 
     def get_wiki_submissions(self, start: int = 0, size: int = 25):
-        response = requests.get(f"{self.api}/x{self.comId}/s/knowledge-base-request?type=all&start={start}&size={size}", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.WikiRequestList(json.loads(response.text)["knowledgeBaseRequestList"]).WikiRequestList
+        response = self.request("GET", f"/x{self.comId}/s/knowledge-base-request?type=all&start={start}&size={size}")
+        return objects.WikiRequestList(json.loads(response.text)["knowledgeBaseRequestList"]).WikiRequestList
 
     def get_live_layer(self):
-        response = requests.get(f"{self.api}/x{self.comId}/s/live-layer/homepage?v=2", headers=self.parse_headers(), proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return objects.LiveLayer(json.loads(response.text)["liveLayerList"]).LiveLayer
+        response = self.request("GET", f"/x{self.comId}/s/live-layer/homepage?v=2")
+        return objects.LiveLayer(json.loads(response.text)["liveLayerList"]).LiveLayer
 
     def apply_bubble(self, bubbleId: str, chatId: str, applyToAll: bool = False):
         data = {
@@ -2039,6 +1934,5 @@ class SubClient(client.Client):
             data["applyToAll"] = 1
 
         data = json.dumps(data)
-        response = requests.post(f"{self.api}/x{self.comId}/s/chat/thread/apply-bubble", headers=self.parse_headers(data=data), data=data, proxies=self.proxies, verify=self.certificatePath)
-        if response.status_code != 200: return exceptions.CheckException(json.loads(response.text))
-        else: return response.status_code
\ No newline at end of file
+        response = self.request("POST", f"/x{self.comId}/s/chat/thread/apply-bubble", data=data)
+        return response.status_code
\ No newline at end of file
@@ -0,0 +1,92 @@
+import os
+import sys
+import json
+import time
+
+# The benchmarks run from a checkout, without installing the library.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def best(function, number: int, repeat: int = 5) -> float:
+    """
+    Best time of ``repeat`` runs of ``number`` calls of ``function``, in microseconds per call.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number): function()
+        times.append(time.perf_counter() - start)
+
+    return min(times) / number * 1e6
+
+
+# Shapes recorded from the API and the socket, with their values replaced.
+author = {
+    "uid": "00000000-0000-0000-0000-000000000001", "status": 0, "icon": "http://pm1.aminoapps.com/icon.jpg", "reputation": 1234, "role": 0,
+    "nickname": "someone", "level": 12, "accountMembershipStatus": 0, "membershipStatus": 1, "avatarFrameId": "frame", "isNicknameVerified": False,
+    "avatarFrame": {"frameId": "frame", "icon": "http://pm1.aminoapps.com/frame.jpg"}
+}
+
+
+def message(i: int, type: int = 0, mediaType: int = 0, chatId: str = "chat") -> dict:
+    return {
+        "author": author, "threadId": chatId, "mediaType": mediaType, "content": "hello there", "clientRefId": i, "messageId": f"message-{i}",
+        "uid": author["uid"], "createdTime": "2021-01-01T00:00:00Z", "type": type, "isHidden": False, "includedInSummary": True,
+        "chatBubbleId": "bubble", "chatBubbleVersion": 1, "extensions": {"mentionedArray": [{"uid": "00000000-0000-0000-0000-000000000002"}]}
+    }
+
+
+def message_frame(i: int, type: int = 0, mediaType: int = 0, chatId: str = "chat") -> str:
+    return json.dumps({"t": 1000, "o": {"ndcId": 1, "alertOption": 1, "membershipStatus": 1, "chatMessage": message(i, type, mediaType, chatId)}})
+
+
+def typing_frame(chatId: str = "chat", t: int = 304) -> str:
+    return json.dumps({"t": t, "o": {"actions": "Typing", "threadId": chatId, "ndcId": 1, "params": {"topicIds": [], "threadType": 2}, "id": "1"}})
+
+
+def member(i: int) -> dict:
+    return {
+        "uid": f"{i:08d}-0000-0000-0000-000000000000", "nickname": f"member {i}", "icon": f"http://pm1.aminoapps.com/{i}.jpg", "status": 0, "role": 0,
+        "level": i % 20 + 1, "reputation": i * 7 % 100000, "membershipStatus": 0, "onlineStatus": 2, "isGlobal": False, "isNicknameVerified": False,
+        "accountMembershipStatus": 0, "membersCount": 10, "joinedCount": 5, "postsCount": 3, "blogsCount": 1, "commentsCount": 0, "itemsCount": 0,
+        "storiesCount": 0, "createdTime": "2020-01-01T00:00:00Z", "modifiedTime": "2021-01-01T00:00:00Z", "content": None, "mood": None, "ndcId": 1,
+        "followingStatus": 0, "notificationSubscriptionStatus": 0, "pushEnabled": True, "avatarFrameId": None, "mediaList": None,
+        "consecutiveCheckInDays": None, "extensions": {"style": {"backgroundColor": "#000000"}, "defaultBubbleId": "bubble"}
+    }
+
+
+def thread(i: int) -> dict:
+    return {
+        "threadId": f"thread-{i}", "title": f"chat {i}", "content": "about things", "icon": "http://pm1.aminoapps.com/chat.jpg", "type": 2, "status": 0,
+        "ndcId": 1, "membersCount": 40, "membersQuota": 1000, "keywords": "a,b", "isPinned": False, "alertOption": 1, "membershipStatus": 1,
+        "condition": 0, "needHidden": False, "publishToGlobal": 0, "uid": author["uid"], "author": author, "createdTime": "2020-01-01T00:00:00Z",
+        "modifiedTime": "2021-01-01T00:00:00Z", "latestActivityTime": "2021-01-01T00:00:00Z", "lastReadTime": "2021-01-01T00:00:00Z",
+        "userAddedTopicList": [], "membersSummary": [{"uid": member(n)["uid"], "nickname": f"member {n}", "role": 0} for n in range(5)],
+        "extensions": {"bm": [None, "http://pm1.aminoapps.com/bg.jpg", None], "coHost": [], "viewOnly": False, "announcement": "hi", "language": "en",
+            "membersCanInvite": True, "fansOnly": False, "channelType": 0, "lastMembersSummaryUpdateTime": 0, "pinAnnouncement": False}
+    }
+
+
+def blog(i: int) -> dict:
+    return {
+        "blogId": f"blog-{i}", "title": f"post {i}", "content": "some text " * 20, "type": 0, "status": 0, "ndcId": 1, "author": author,
+        "createdTime": "2020-01-01T00:00:00Z", "modifiedTime": "2021-01-01T00:00:00Z", "commentsCount": 3, "votesCount": 10, "votedValue": 0,
+        "viewCount": 100, "globalCommentsCount": 3, "globalVotesCount": 10, "globalVotedValue": 0, "guestVotesCount": 0, "contentRating": 0,
+        "keywords": "a,b", "needHidden": False, "shareURLFullPath": f"http://aminoapps.com/p/{i}", "mediaList": [[100, "http://pm1.aminoapps.com/p.jpg", None]],
+        "style": {"backgroundColor": "#000000"}, "tipInfo": {"tippable": True, "tippedCoins": 0}, "totalQuizPlayCount": 0, "totalPollVoteCount": 0,
+        "widgetDisplayInterval": None, "endTime": None, "refObjectId": None, "refObject": None,
+        "extensions": {"style": {"backgroundColor": "#000000"}, "fansOnly": False, "featuredType": 0}
+    }
+
+
+def community(i: int) -> dict:
+    return {
+        "ndcId": i, "name": f"community {i}", "tagline": "a community", "content": "about it", "icon": "http://pm1.aminoapps.com/c.jpg", "link": f"http://aminoapps.com/c/{i}",
+        "endpoint": f"community{i}", "membersCount": 1000, "status": 0, "joinType": 0, "listedStatus": 2, "probationStatus": 0, "primaryLanguage": "en",
+        "templateId": 1, "searchable": True, "keywords": "a,b", "communityHeat": 100.5, "createdTime": "2020-01-01T00:00:00Z", "modifiedTime": "2021-01-01T00:00:00Z",
+        "isStandaloneAppDeprecated": False, "isStandaloneAppMonetizationEnabled": False, "agent": author, "mediaList": None, "promotionalMediaList": None,
+        "userAddedTopicList": [], "influencerList": [], "activeInfo": {}, "advancedSettings": {"defaultRankingTypeInLeaderboard": 1, "frontPageLayout": 1},
+        "configuration": {"appearance": {"leftSidePanel": {"style": {"iconColor": "#ffffff"}}}, "module": {"chat": {"enabled": True}}},
+        "themePack": {"themeColor": "#000000", "themePackHash": "hash", "themePackRevision": 1, "themePackUrl": "http://pm1.aminoapps.com/t.zip"},
+        "extensions": {"communityHeadList": []}
+    }
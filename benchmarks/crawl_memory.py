@@ -0,0 +1,48 @@
+"""
+Memory kept by a get_all_users crawl of 10k members, 100 per page, as objects and as records.
+
+    python benchmarks/crawl_memory.py
+"""
+import gc
+import json
+import time
+import tracemalloc
+
+from common import member
+from amino.lib.util import objects, pagination
+
+pages = [json.dumps({"userProfileList": [member(i) for i in range(start, start + 100)], "userProfileCount": 10000}) for start in range(0, 10000, 100)]
+
+
+def get_all_users(start: int = 0, size: int = 100):
+    # Stand-in of Client.get_all_users answering from the pages above.
+    return objects.UserProfileCountList(json.loads(pages[start // 100]) if start < 10000 else {}).UserProfileCountList
+
+
+def measure(crawl):
+    start = time.perf_counter()
+    crawl()
+    elapsed = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    kept = crawl()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return kept, size / 2 ** 20, elapsed * 1000
+
+
+crawls = (
+    ("raw json only", lambda: [item for page in pages for item in json.loads(page)["userProfileList"]]),
+    ("UserProfileCountList pages", lambda: [get_all_users(start) for start in range(0, 10000, 100)]),
+    ("iter_all, UserProfile", lambda: list(pagination.paginate_offsets(get_all_users, pagination.flatten, 0, 100, 1))),
+    ("iter_all(rows=True), records", lambda: list(pagination.paginate_offsets(get_all_users, pagination.records, 0, 100, 1)))
+)
+
+base = None
+for name, crawl in crawls:
+    kept, size, elapsed = measure(crawl)
+    if base is None: base = size
+    print(f"{name:30s} {size:7.1f} MiB (+{size - base:6.1f})  {elapsed:6.0f} ms")
+    del kept
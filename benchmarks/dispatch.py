@@ -0,0 +1,43 @@
+"""
+Cost of routing a socket frame to its handlers through Callbacks.routes.
+
+    python benchmarks/dispatch.py
+"""
+import json
+
+from common import best, message_frame, typing_frame
+from amino.socket import Callbacks
+
+handled = 0
+
+
+def handler(event):
+    global handled
+    handled += 1
+
+
+class Overriding(Callbacks):
+    def on_text_message(self, data): handler(data)
+
+
+callbacks = Callbacks(None)
+callbacks.event("on_text_message")(handler)
+overriding = Overriding(None)
+
+text = json.loads(message_frame(1))
+print("route(), frames already parsed:")
+print(f"  handled message          {best(lambda: callbacks.route((1000, 0, 0), text), 100000):7.2f} us/frame")
+print(f"  message without handler  {best(lambda: callbacks.route((1000, 100, 0), text), 100000):7.2f} us/frame")
+print(f"  overridden on_* method   {best(lambda: overriding.route((1000, 0, 0), text), 100000):7.2f} us/frame")
+
+# Each Message is only delivered once, the handled ones are all different.
+print("resolve(), json frames:")
+for name, frames in (
+    ("handled message", [message_frame(i) for i in range(50000)]),
+    ("message without handler", [message_frame(i, 101) for i in range(50000)]),
+    ("typing without handler", [typing_frame()] * 50000)
+):
+    frames = iter(frames)
+    print(f"  {name:24s} {best(lambda: callbacks.resolve(next(frames)), 10000):7.2f} us/frame")
+
+print(callbacks.frame_stats())
@@ -0,0 +1,36 @@
+"""
+Cost of building the headers of a request.
+
+    python benchmarks/headers.py
+
+Runs in a temporary directory, where device.json is generated. Clearing the cache of device.load_device_info before each call
+reads and parses the file every time, like every request did before the device info was cached.
+"""
+import os
+import json
+import tempfile
+
+from common import best
+from amino.client import Client
+from amino.lib.util import device, headers, middleware
+
+
+class Offline(middleware.Middleware):
+    # Answers the check_device of Client() without the network.
+    def handle(self, request, call_next): return middleware.Response(200, b'{"api:statuscode": 0}')
+
+
+os.chdir(tempfile.mkdtemp())
+client = Client(middlewares=[Offline()])
+client.sid = "sid"
+data = json.dumps({"content": "hello there", "type": 0, "timestamp": 0})
+
+
+def uncached():
+    device.cache.clear()
+    return headers.Headers(data=data).headers
+
+
+print(f"device.json read per call  {best(uncached, 20000):6.2f} us/call")
+print(f"headers.Headers            {best(lambda: headers.Headers(data=data).headers, 20000):6.2f} us/call")
+print(f"Client.parse_headers       {best(lambda: client.parse_headers(data=data), 20000):6.2f} us/call")
@@ -0,0 +1,48 @@
+"""
+Time of ``import amino`` in fresh interpreters started in an empty directory, and the I/O it does.
+
+    python benchmarks/import_time.py
+"""
+import os
+import sys
+import time
+import tempfile
+import subprocess
+import statistics
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+environment = dict(os.environ, PYTHONPATH=root, PYTHONDONTWRITEBYTECODE="1")
+
+# Counts the connections opened by the import, they fail instead of reaching the network, and tells if aiohttp was loaded.
+probe = """
+import sys
+import socket
+opened = []
+def connect(self, address):
+    opened.append(address)
+    raise OSError("no network in the benchmark")
+socket.socket.connect = connect
+import amino
+print(len(opened), "aiohttp" in sys.modules)
+"""
+
+
+def median_time(code: str, runs: int = 15) -> float:
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=tempfile.mkdtemp(), env=environment, check=True, capture_output=True)
+        times.append(time.perf_counter() - start)
+
+    return statistics.median(times) * 1000
+
+
+bare = median_time("pass")
+imported = median_time("import amino")
+print(f"bare interpreter  {bare:6.0f} ms")
+print(f"import amino      {imported:6.0f} ms  (+{imported - bare:.0f} ms)")
+
+cwd = tempfile.mkdtemp()
+result = subprocess.run([sys.executable, "-c", probe], cwd=cwd, env=environment, check=True, capture_output=True, text=True)
+opened, aiohttp = result.stdout.split()
+print(f"connections opened: {opened}, files written: {os.listdir(cwd)}, aiohttp loaded: {aiohttp}")
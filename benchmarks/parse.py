@@ -0,0 +1,20 @@
+"""
+Cost of parsing API responses into objects, with the fields compiled from their schema.
+
+    python benchmarks/parse.py
+"""
+from common import best, member, message, thread, blog, community
+from amino.lib.util import objects
+
+cases = (
+    ("UserProfile", lambda data: objects.UserProfile(data).UserProfile, member(1), 20000),
+    ("UserProfileList (100)", lambda data: objects.UserProfileList(data).UserProfileList, [member(i) for i in range(100)], 500),
+    ("Message", lambda data: objects.Message(data).Message, message(1), 20000),
+    ("MessageList (100)", lambda data: objects.MessageList(data).MessageList, [message(i) for i in range(100)], 200),
+    ("ThreadList (25)", lambda data: objects.ThreadList(data).ThreadList, [thread(i) for i in range(25)], 500),
+    ("BlogList (25)", lambda data: objects.BlogList(data).BlogList, [blog(i) for i in range(25)], 500),
+    ("CommunityList (25)", lambda data: objects.CommunityList(data).CommunityList, [community(i) for i in range(25)], 500)
+)
+
+for name, parse, data, number in cases:
+    print(f"{name:22s} {best(lambda: parse(data), number, 3):9.1f} us")
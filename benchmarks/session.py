@@ -0,0 +1,45 @@
+"""
+Requests per second against a local stand-in server, with the module-level requests functions and with the pooled session of a Client.
+
+    python benchmarks/session.py
+
+Plain HTTP on localhost, so only the TCP handshake is saved. With TLS to the real API every new connection costs a lot more.
+"""
+import threading
+import requests
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from common import best
+from amino.client import Client
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive
+    disable_nagle_algorithm = True  # The headers and the body are written apart, Nagle would hold the body for the delayed ACK.
+
+    def do_GET(self):
+        body = b'{"api:statuscode": 0}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args): pass
+
+
+server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+threading.Thread(target=server.serve_forever, daemon=True).start()
+url = f"http://127.0.0.1:{server.server_port}/api/v1/g/s/account"
+
+
+def rate(get) -> float:
+    return 1e6 / best(lambda: get(url).raise_for_status(), 300, 3)
+
+
+session = Client.create_session()
+
+print(f"module-level requests.get  {rate(requests.get):6.0f} req/s")
+print(f"Client session             {rate(session.get):6.0f} req/s")
+server.shutdown()
@@ -30,10 +30,15 @@ setup(
     install_requires = [
         'setuptools',
         'requests',
+        'aiohttp',
         'six',
         'websocket-client==0.57.0',
         'json_minify'
     ],
+    extras_require = {
+        'arrow': ['pyarrow'],
+        'numpy': ['numpy']
+    },
     setup_requires = [
         'wheel'
     ],